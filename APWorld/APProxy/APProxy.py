@@ -0,0 +1,572 @@
+"""Local bridge between the Untitled Goose Game client and an Archipelago server.
+
+A Python stand-in for APProxy.exe, taking the same command line, so the connection path runs anywhere
+Archipelago's own Python does (no .NET runtime needed). The game connects to it over localhost TCP and
+exchanges newline-delimited JSON: every line the game sends goes to the server as one WebSocket text
+frame, and every frame the server sends comes back to the game as one line. Each game connection gets
+its own server connection, so the RoomInfo the game waits for is always the first line it reads.
+
+    python APProxy.py <server> <port> <local_port> [--ready-file PATH] [--batch-window MS] [--cache-dir PATH | --no-cache]
+
+Readiness: once it is listening, the proxy prints one line to stdout, `READY <port>`, with the port it
+actually bound, and nothing else ever goes to stdout (logs go to stderr). With --ready-file it also writes
+that port number to the file (atomically, so a reader never sees it half-written) and removes the file when
+it exits. A launcher can wait for either instead of sleeping and retrying. A local_port of 0 binds a free
+port picked by the OS, so several game instances on one host never collide; the READY line says which.
+If the port can't be bound, the proxy exits with status 1 before announcing anything.
+
+Location checks: the game sends one LocationChecks packet per location, so a burst (the pot stack breaking,
+pecking the church) would be dozens of frames. Lines holding only LocationChecks that arrive within
+--batch-window ms of the first go to the server as one packet with the ids deduplicated in order. Any other
+line ends the batch, and the batch goes out first, so nothing overtakes anything the game sent before it.
+
+DataPackage: the game asks for every game's DataPackage each time it connects, which in a big multiworld is
+megabytes. The proxy keeps each game's package on disk under the checksum RoomInfo gives for it (laid out like
+Archipelago's own datapackage cache), answers from there, and asks the server only for the games whose
+checksum it hasn't seen. The game still gets a single DataPackage line with every game it asked for.
+
+Slot data: when the Connected packet's slot_data holds a compact_slot_data block (see SlotData.py in the
+APWorld), the game gets it first as a small line of its own, with its keys always in this order:
+
+    [{"cmd":"GooseSlotData","version":2,"options":<bitfield>,"locations":[first,last,first,last,...]}]
+
+so the client can read its options and enabled locations without searching the whole Connected packet.
+Connected itself follows unchanged.
+
+Needs the websockets package, which Archipelago already depends on.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import tempfile
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import websockets
+except ImportError:
+    sys.exit("APProxy needs the websockets package: pip install websockets")
+
+# Frames buffered each way before the faster side has to wait for the slower one
+QUEUE_SIZE = 256
+
+# First word of the line on stdout that says the proxy is listening, followed by the port
+READY_PREFIX = "READY"
+
+# Location checks arriving this close together go to the server as one packet
+BATCH_WINDOW_MS = 5.0
+
+# The cmd of the line carrying the compact slot data, sent to the game just before Connected
+SLOT_DATA_CMD = "GooseSlotData"
+
+# Longest line accepted from the game. Its packets are small; this only guards against a runaway client.
+LINE_LIMIT = 1 << 24
+
+log = logging.getLogger("APProxy")
+
+
+def default_cache_dir() -> str:
+    """Where Archipelago keeps its own DataPackage cache on this platform."""
+    if sys.platform == "win32":
+        base = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "Archipelago", "Cache")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches/Archipelago")
+    else:
+        base = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "Archipelago")
+    return os.path.join(base, "datapackage")
+
+
+def compact(value: Any) -> str:
+    """JSON the way the Archipelago server writes it, which is also the way the game searches it."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def file_safe_name(name: str) -> str:
+    return "".join(character for character in name if character not in '<>:"/\\|?*')
+
+
+def server_uris(server: str, port: str) -> List[str]:
+    """Addresses to try for the server: secure first, then plain, like Archipelago's own clients."""
+    if "://" in server:
+        return [f"{server}:{port}"]
+    return [f"wss://{server}:{port}", f"ws://{server}:{port}"]
+
+
+async def open_server_socket(server: str, port: str):
+    error: Optional[Exception] = None
+    for uri in server_uris(server, port):
+        try:
+            # No size limit: a DataPackage for a big multiworld runs to megabytes
+            socket = await websockets.connect(uri, max_size=None)
+            log.info(f"Connected to {uri}")
+            return socket
+        except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as exception:
+            log.info(f"Couldn't connect to {uri}: {exception or type(exception).__name__}")
+            error = exception
+    raise ConnectionError(f"Couldn't reach the Archipelago server at {server}:{port}") from error
+
+
+def as_line(message: Union[str, bytes]) -> bytes:
+    """One server frame as one line for the game.
+
+    JSON can't have a raw line break inside a string, so any in the frame are just whitespace
+    and can be flattened without changing what the game parses."""
+    if isinstance(message, bytes):
+        message = message.decode("utf-8")
+    if "\n" in message or "\r" in message:
+        message = message.replace("\r", " ").replace("\n", " ")
+    return message.encode("utf-8") + b"\n"
+
+
+def location_checks(text: str) -> Optional[List[int]]:
+    """The location ids in a line that holds nothing but LocationChecks commands, or None for any other line."""
+    if '"LocationChecks"' not in text:
+        return None
+    try:
+        commands = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(commands, list) or not commands:
+        return None
+    ids: List[int] = []
+    for command in commands:
+        if not isinstance(command, dict) or command.get("cmd") != "LocationChecks":
+            return None
+        ids += command.get("locations", [])
+    return ids
+
+
+def slot_data_frame(text: str) -> Optional[str]:
+    """The compact block from a Connected packet's slot_data as a line of its own, or None if there isn't one."""
+    try:
+        commands = json.loads(text)
+    except ValueError:
+        return None
+    for command in commands if isinstance(commands, list) else []:
+        if isinstance(command, dict) and command.get("cmd") == "Connected":
+            slot_data = command.get("slot_data")
+            block = slot_data.get("compact_slot_data") if isinstance(slot_data, dict) else None
+            if isinstance(block, dict):
+                return compact([{"cmd": SLOT_DATA_CMD, **block}])
+    return None
+
+
+class CheckBatch:
+    """LocationChecks lines waiting to go to the server as one packet."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.ids: List[int] = []
+
+    def add(self, line: str, ids: List[int]) -> None:
+        self.lines.append(line)
+        self.ids += ids
+
+    def packet(self) -> str:
+        if len(self.lines) == 1:
+            return self.lines[0]
+        locations = list(dict.fromkeys(self.ids))
+        return compact([{"cmd": "LocationChecks", "locations": locations}])
+
+
+class DataPackageCache:
+    """Each game's DataPackage as compact JSON, on disk under its checksum and in memory once read.
+
+    A checksum only changes along with the game's names and ids, so nothing stored under one goes stale."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.texts: Dict[Tuple[str, str], str] = {}
+
+    def path(self, game: str, checksum: str) -> str:
+        return os.path.join(self.directory, file_safe_name(game), f"{file_safe_name(checksum)}.json")
+
+    def get(self, game: str, checksum: str) -> Optional[str]:
+        """The game's package as compact JSON, or None if it isn't cached. Reads the disk the first time, so
+        it runs off the event loop, like save."""
+        key = (game, checksum)
+        if key not in self.texts:
+            try:
+                with open(self.path(game, checksum), encoding="utf-8-sig") as file:
+                    package = json.load(file)
+            except (OSError, ValueError):
+                return None
+            if not isinstance(package, dict) or package.get("checksum") != checksum:
+                return None
+            self.texts[key] = compact(package)
+        return self.texts[key]
+
+    def get_all(self, checksums: Dict[str, str]) -> Dict[str, str]:
+        """Each game's package that is cached, by game."""
+        texts = {game: self.get(game, checksum) for game, checksum in checksums.items()}
+        return {game: text for game, text in texts.items() if text is not None}
+
+    def remember(self, game: str, package: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """The package as compact JSON, kept in memory if it has a checksum, and that checksum."""
+        text = compact(package)
+        checksum = package.get("checksum")
+        if not isinstance(checksum, str) or not checksum:
+            return text, None
+        self.texts[(game, checksum)] = text
+        return text, checksum
+
+    def save(self, remembered: List[Tuple[str, str]]) -> None:
+        """Write remembered packages to disk. Blocking, so it runs off the event loop."""
+        for game, checksum in remembered:
+            path = self.path(game, checksum)
+            if os.path.exists(path):
+                continue
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # A unique temporary name, as two connections may fetch the same game at once
+                handle, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+                with open(handle, "w", encoding="utf-8") as file:
+                    file.write(self.texts[(game, checksum)])
+                os.replace(temp_path, path)
+            except OSError as error:
+                log.warning(f"Couldn't cache the {game} DataPackage: {error}")
+
+
+class PackageRequest:
+    """A GetDataPackage from the game: the games it asked for, and those already answered from the cache."""
+
+    def __init__(self, games: List[str], cached: Dict[str, str]) -> None:
+        self.games = games
+        self.cached = cached
+
+    def command(self, fetched: Dict[str, str]) -> str:
+        """The DataPackage command for the game, with every game in the order it asked for them."""
+        texts = {**self.cached, **fetched}
+        games = ",".join(f"{compact(game)}:{texts[game]}" for game in dict.fromkeys(self.games + list(fetched))
+                         if game in texts)
+        return f'{{"cmd":"DataPackage","data":{{"games":{{{games}}}}}}}'
+
+    def reply(self, fetched: Dict[str, str]) -> str:
+        """One line holding just the DataPackage command."""
+        return f"[{self.command(fetched)}]"
+
+
+class Bridge:
+    """One game connection and the server connection opened for it.
+
+    Four pumps run at once, with a bounded queue each way: when one side falls behind, the queue fills and
+    the other side stops being read until it catches up, instead of buffering without limit."""
+
+    def __init__(self, game_reader: asyncio.StreamReader, game_writer: asyncio.StreamWriter, socket,
+                 batch_window_ms: float = BATCH_WINDOW_MS, packages: Optional[DataPackageCache] = None) -> None:
+        self.game_reader = game_reader
+        self.game_writer = game_writer
+        self.socket = socket
+        self.to_server: "asyncio.Queue[str]" = asyncio.Queue(QUEUE_SIZE)
+        self.to_game: "asyncio.Queue[bytes]" = asyncio.Queue(QUEUE_SIZE)
+        self.batch_window = batch_window_ms / 1000
+        # Kept here rather than in send_server, so a batch cut short by a disconnect is still flushed,
+        # along with the line that ended it
+        self.batch: Optional[CheckBatch] = None
+        self.after_batch: Optional[str] = None
+        self.check_lines = 0
+        self.check_frames = 0
+        self.packages = packages
+        # Every game in the room and its DataPackage checksum, once RoomInfo has been read
+        self.checksums: Optional[Dict[str, str]] = None
+        self.room_games: List[str] = []
+        self.package_requests: Deque[PackageRequest] = deque()
+        self.saves: Set["asyncio.Future[None]"] = set()
+        self.connected = False
+
+    async def read_game(self) -> None:
+        first = True
+        while True:
+            line = await self.game_reader.readline()
+            if not line:
+                return
+            text = line.decode("utf-8").strip()
+            if first:
+                # .NET's StreamWriter puts a byte order mark in front of the first thing it writes
+                text = text.lstrip("\ufeff")
+                first = False
+            if text:
+                await self.to_server.put(text)
+
+    async def send_server(self) -> None:
+        while True:
+            # The line that ended the last batch is next, through the same checks as any other
+            if self.after_batch is not None:
+                text, self.after_batch = self.after_batch, None
+            else:
+                text = await self.to_server.get()
+            if self.checksums is not None and '"GetDataPackage"' in text:
+                text = await self.request_packages(text)
+                if text is None:
+                    continue
+            ids = location_checks(text) if self.batch_window > 0 else None
+            if ids is None:
+                await self.socket.send(text)
+                continue
+            self.batch = CheckBatch()
+            self.batch.add(text, ids)
+            # Anything that isn't a location check ends the batch, and is handled right after it
+            await self.collect_checks(asyncio.get_running_loop().time() + self.batch_window)
+            await self.send_batch()
+
+    async def collect_checks(self, deadline: float) -> None:
+        """Add location checks to the batch until the window closes, or another kind of line ends it early."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if self.to_server.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    return
+                try:
+                    text = await asyncio.wait_for(self.to_server.get(), timeout)
+                except asyncio.TimeoutError:
+                    return
+            else:
+                text = self.to_server.get_nowait()
+            ids = location_checks(text)
+            if ids is None:
+                self.after_batch = text
+                return
+            self.batch.add(text, ids)
+
+    async def send_batch(self) -> None:
+        # Only let go of the batch once it's sent: if a disconnect cuts this short, resending is harmless
+        batch = self.batch
+        await self.socket.send(batch.packet())
+        self.batch = None
+        self.check_lines += len(batch.lines)
+        self.check_frames += 1
+        if len(batch.lines) > 1:
+            log.info(f"Sent {len(batch.lines)} LocationChecks lines as 1 frame "
+                     f"({len(batch.ids)} ids, {len(set(batch.ids))} unique)")
+
+    async def request_packages(self, text: str) -> Optional[str]:
+        """Answer what the cache can of a GetDataPackage, and narrow it to the rest for the server.
+
+        Returns the line to send the server instead, or None if the cache had every game."""
+        games = self.requested_games(text)
+        if games is None:
+            return text
+        checksums = {game: self.checksums[game] for game in games if game in self.checksums}
+        cached = await asyncio.get_running_loop().run_in_executor(None, self.packages.get_all, checksums)
+        request = PackageRequest(games, cached)
+        missing = [game for game in games if game not in cached]
+        if not missing:
+            log.info(f"DataPackage: all {len(games)} games from the cache")
+            await self.to_game.put(as_line(request.reply({})))
+            return None
+        log.info(f"DataPackage: {len(cached)} of {len(games)} games from the cache, fetching {len(missing)}")
+        self.package_requests.append(request)
+        return compact([{"cmd": "GetDataPackage", "games": missing}])
+
+    def requested_games(self, text: str) -> Optional[List[str]]:
+        """The games a line holding just a GetDataPackage asks for, or None for any other line."""
+        try:
+            commands = json.loads(text)
+        except ValueError:
+            return None
+        if not isinstance(commands, list) or len(commands) != 1 or not isinstance(commands[0], dict):
+            return None
+        command = commands[0]
+        if command.get("cmd") != "GetDataPackage" or "exclusions" in command:
+            return None
+        games = command.get("games")
+        if games is None:
+            # Everything the server has, which is every game in the room and Archipelago itself
+            return list(dict.fromkeys(list(self.checksums) + self.room_games))
+        if not isinstance(games, list) or not all(isinstance(game, str) for game in games):
+            return None
+        return games
+
+    def read_room_info(self, message: str) -> None:
+        try:
+            commands = json.loads(message)
+        except ValueError:
+            return
+        for command in commands if isinstance(commands, list) else []:
+            if isinstance(command, dict) and command.get("cmd") == "RoomInfo":
+                self.checksums = dict(command.get("datapackage_checksums") or {})
+                self.room_games = list(command.get("games") or [])
+
+    def answer_packages(self, message: str) -> Optional[Tuple[str, List[Tuple[str, str]]]]:
+        """The line for the game in place of the server's DataPackage frame (the server's packages plus what the
+        cache had for the oldest waiting request), and the packages to save.
+
+        None if the frame holds no DataPackage after all, or if it goes to the game as it is."""
+        try:
+            commands = json.loads(message)
+        except ValueError:
+            return None
+        if not isinstance(commands, list):
+            return None
+        package = next((command for command in commands
+                        if isinstance(command, dict) and command.get("cmd") == "DataPackage"), None)
+        if package is None:
+            return None
+        # The server answers requests in order, so this one is the oldest's, whether or not it can be read
+        request = self.package_requests.popleft()
+        data = package.get("data")
+        fetched = data.get("games") if isinstance(data, dict) else None
+        if not isinstance(fetched, dict):
+            return None
+        texts: Dict[str, str] = {}
+        remembered: List[Tuple[str, str]] = []
+        for game, game_package in fetched.items():
+            if not isinstance(game_package, dict):
+                return None
+            texts[game], checksum = self.packages.remember(game, game_package)
+            if checksum is not None:
+                remembered.append((game, checksum))
+        # With nothing from the cache to add, the server's own frame is already the answer
+        if not request.cached:
+            return message, remembered
+        line = ",".join(request.command(texts) if command is package else compact(command) for command in commands)
+        return f"[{line}]", remembered
+
+    async def read_server(self) -> None:
+        async for message in self.socket:
+            # The same test the game uses to spot Connected, which only comes once per connection
+            if not self.connected and isinstance(message, str) and '"cmd":"Connected"' in message:
+                self.connected = True
+                frame = slot_data_frame(message)
+                if frame is not None:
+                    await self.to_game.put(as_line(frame))
+            if self.packages is not None and isinstance(message, str):
+                if self.checksums is None and '"RoomInfo"' in message:
+                    self.read_room_info(message)
+                elif self.package_requests and '"DataPackage"' in message:
+                    answered = self.answer_packages(message)
+                    if answered is not None:
+                        line, remembered = answered
+                        await self.to_game.put(as_line(line))
+                        # Written in the background, so the server keeps being read meanwhile; run() waits for
+                        # whatever is still being written before the bridge closes
+                        saving = asyncio.get_running_loop().run_in_executor(None, self.packages.save, remembered)
+                        self.saves.add(saving)
+                        saving.add_done_callback(self.saves.discard)
+                        continue
+            await self.to_game.put(as_line(message))
+
+    async def write_game(self) -> None:
+        while True:
+            lines = [await self.to_game.get()]
+            # Whatever else has queued up meanwhile goes out with it, then one drain for the lot
+            while not self.to_game.empty():
+                lines.append(self.to_game.get_nowait())
+            self.game_writer.writelines(lines)
+            await self.game_writer.drain()
+
+    async def run(self) -> None:
+        pumps = [asyncio.ensure_future(pump()) for pump in
+                 (self.read_game, self.send_server, self.read_server, self.write_game)]
+        try:
+            # Either side closing (or failing) ends the bridge
+            done, _ = await asyncio.wait(pumps, return_when=asyncio.FIRST_COMPLETED)
+            for pump in done:
+                if not pump.cancelled() and pump.exception() is not None:
+                    log.info(f"Bridge closed: {pump.exception()!r}")
+        finally:
+            for pump in pumps:
+                pump.cancel()
+            await asyncio.gather(*pumps, return_exceptions=True)
+            await self.flush()
+            await self.socket.close()
+            self.game_writer.close()
+            if self.saves:
+                await asyncio.gather(*self.saves, return_exceptions=True)
+            if self.check_lines:
+                log.info(f"LocationChecks: {self.check_lines} lines from the game went out as {self.check_frames} frames")
+
+    async def flush(self) -> None:
+        """Deliver what the closing side sent last, e.g. a ConnectionRefused just before the server hangs up."""
+        try:
+            if self.batch is not None:
+                await self.send_batch()
+            if self.after_batch is not None:
+                await self.socket.send(self.after_batch)
+            while not self.to_server.empty():
+                await self.socket.send(self.to_server.get_nowait())
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        lines = []
+        while not self.to_game.empty():
+            lines.append(self.to_game.get_nowait())
+        if lines and not self.game_writer.is_closing():
+            self.game_writer.writelines(lines)
+
+
+async def handle_game(game_reader: asyncio.StreamReader, game_writer: asyncio.StreamWriter,
+                      server: str, port: str, batch_window_ms: float, packages: Optional[DataPackageCache]) -> None:
+    log.info(f"Game connected from {game_writer.get_extra_info('peername')}")
+    try:
+        socket = await open_server_socket(server, port)
+    except ConnectionError as error:
+        # Closing without a RoomInfo line is how the game finds out
+        log.error(str(error))
+        game_writer.close()
+        return
+    await Bridge(game_reader, game_writer, socket, batch_window_ms, packages).run()
+    log.info("Game disconnected")
+
+
+def announce_ready(bound_port: int, ready_file: Optional[str]) -> None:
+    if ready_file:
+        temp_path = f"{ready_file}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(f"{bound_port}\n")
+        os.replace(temp_path, ready_file)
+    print(f"{READY_PREFIX} {bound_port}", flush=True)
+
+
+async def serve(server: str, port: str, local_port: int, ready_file: Optional[str] = None,
+                batch_window_ms: float = BATCH_WINDOW_MS, cache_dir: Optional[str] = None) -> None:
+    # Shared by every game connection, so a reconnect finds the packages already in memory
+    packages = DataPackageCache(cache_dir) if cache_dir else None
+    try:
+        listener = await asyncio.start_server(
+            lambda reader, writer: handle_game(reader, writer, server, port, batch_window_ms, packages),
+            "127.0.0.1", local_port, limit=LINE_LIMIT,
+        )
+    except OSError as error:
+        sys.exit(f"[APProxy] Couldn't listen on 127.0.0.1:{local_port}: {error}")
+    bound_port = listener.sockets[0].getsockname()[1]
+    log.info(f"Listening on 127.0.0.1:{bound_port} for the game, bridging to {server}:{port}")
+    try:
+        announce_ready(bound_port, ready_file)
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        if ready_file and os.path.exists(ready_file):
+            os.remove(ready_file)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("server", help="Archipelago server host, e.g. archipelago.gg (or a full ws:// or wss:// URI)")
+    parser.add_argument("port", help="Archipelago server port")
+    parser.add_argument("local_port", type=int, help="Localhost port the game connects to, or 0 for any free port")
+    parser.add_argument("--ready-file", help="Write the bound port here once listening")
+    parser.add_argument("--batch-window", type=float, default=BATCH_WINDOW_MS, metavar="MS",
+                        help="Merge location checks sent within this many ms of each other (0 sends each on its own)")
+    parser.add_argument("--cache-dir", default=default_cache_dir(), metavar="PATH",
+                        help="Where to keep DataPackages between connections (default: Archipelago's own cache)")
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch DataPackages from the server")
+    args = parser.parse_args()
+
+    # Logs go to stderr; stdout only ever carries the READY line
+    logging.basicConfig(level=logging.INFO, format="[APProxy] %(message)s", stream=sys.stderr)
+    # Being terminated shuts down the same way as Ctrl+C, so the ready file is cleaned up either way
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        asyncio.run(serve(args.server, args.port, args.local_port, args.ready_file, args.batch_window,
+                          None if args.no_cache else args.cache_dir))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
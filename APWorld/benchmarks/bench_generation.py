@@ -0,0 +1,193 @@
+"""Generation benchmark for the Goose APWorld.
+
+Drives one Goose world through generate_early, create_regions, create_items, set_rules and pre_fill, then a
+simple assumed fill, under a matrix of option presets (souls on and off, church pecks, every goal). For each
+stage it reports wall time (best of --repeat untraced runs), memory from one extra run under tracemalloc
+(what the stage left allocated, and its peak), and the location, pool and filled counts once it's done.
+Runs offline against the stubs in ../tests/stubs, so it can be run on every commit; --json writes the numbers out
+for comparing two of them.
+
+    python APWorld/benchmarks/bench_generation.py [--preset goal_all_tasks] [--repeat 3] [--json out.json]
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Tuple
+
+from common import PRESETS, STEPS, new_world
+from BaseClasses import CollectionState, Item, Location
+from untitled_goose_game import GooseGameWorld
+from untitled_goose_game.Options import Goal
+
+STAGES: Tuple[str, ...] = STEPS + ("fill",)
+
+# Goals that spawn the bell from task lists need those lists in the pool
+GOAL_REQUIREMENTS: Dict[int, Dict[str, Any]] = {
+    Goal.option_only_speedrun_tasks: {"include_speedrun_tasks": 1},
+    Goal.option_all_tasks_no_speedrun: {"include_extra_tasks": 1},
+    Goal.option_all_tasks: {"include_extra_tasks": 1, "include_speedrun_tasks": 1},
+}
+
+MATRIX: Dict[str, Dict[str, Any]] = {
+    **PRESETS,
+    "npc_souls_only": {"include_npc_souls": 1, "include_prop_souls": 0},
+    "prop_souls_only": {"include_npc_souls": 0, "include_prop_souls": 1},
+    "first_pecks": {"include_model_church_pecks": 1},
+    "all_pecks": {"include_model_church_pecks": 2},
+    **{
+        f"goal_{name[len('option_'):]}": {"goal": value, **GOAL_REQUIREMENTS.get(value, {})}
+        for name, value in vars(Goal).items() if name.startswith("option_")
+    },
+}
+
+
+class FillError(Exception):
+    pass
+
+
+def place(location: Location, item: Item) -> None:
+    location.item = item
+    item.location = location
+
+
+def partition(locations: List[Location], test) -> Tuple[List[Location], List[Location]]:
+    passed: List[Location] = []
+    failed: List[Location] = []
+    for location in locations:
+        (passed if test(location) else failed).append(location)
+    return passed, failed
+
+
+def simple_fill(world: GooseGameWorld, seed: int) -> bool:
+    """Assumed fill: each progression item goes somewhere reachable with every item not yet placed in hand,
+    then everything else fills whatever is left.
+
+    Much simpler than Archipelago's fill, but it walks the world's rules the same way (sweeping whatever is
+    already placed as it comes into reach), so it costs about what they cost a real fill. Returns whether the
+    seed is beatable."""
+    multiworld = world.multiworld
+    rng = random.Random(seed)
+    progression = [item for item in multiworld.itempool if item.advancement]
+    rest = [item for item in multiworld.itempool if not item.advancement]
+    rng.shuffle(progression)
+    rng.shuffle(rest)
+
+    filled = [location for location in multiworld.get_locations(world.player) if location.item is not None]
+    empty = [location for location in multiworld.get_locations(world.player) if location.item is None]
+
+    def sweep(state: CollectionState) -> CollectionState:
+        pending = filled
+        while True:
+            reached, pending = partition(pending, lambda location: location.can_reach(state))
+            if not reached:
+                return state
+            for location in reached:
+                state.collect(location.item, True, location)
+
+    while progression:
+        item = progression.pop()
+        state = CollectionState(multiworld)
+        for unplaced in progression:
+            state.collect(unplaced, True)
+        sweep(state)
+        reachable = [index for index, location in enumerate(empty) if location.can_reach(state)]
+        if not reachable:
+            raise FillError(f"Nowhere reachable to place {item.name}")
+        location = empty.pop(rng.choice(reachable))
+        place(location, item)
+        filled.append(location)
+
+    if len(rest) > len(empty):
+        raise FillError(f"{len(rest)} items left for {len(empty)} locations")
+    for location, item in zip(empty, rest):
+        place(location, item)
+    return multiworld.completion_condition[world.player](sweep(CollectionState(multiworld)))
+
+
+def counts(world: GooseGameWorld) -> Tuple[int, int, int]:
+    """Locations, pool items and filled locations the world has so far."""
+    locations = world.multiworld.get_locations(world.player)
+    return len(locations), len(world.multiworld.itempool), sum(location.item is not None for location in locations)
+
+
+def run_stages(preset: Dict[str, Any], seed: int,
+               traced: bool) -> Tuple[List[Dict[str, Any]], bool, GooseGameWorld]:
+    """One full generation, with a row of numbers per stage."""
+    world = new_world(preset, seed)
+    rows: List[Dict[str, Any]] = []
+    beatable = False
+    if traced:
+        gc.collect()
+        tracemalloc.start()
+    for stage in STAGES:
+        if traced:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        if stage == "fill":
+            beatable = simple_fill(world, seed)
+        else:
+            getattr(world, stage)()
+        elapsed = time.perf_counter() - start
+        row: Dict[str, Any] = {"stage": stage, "ms": elapsed * 1000}
+        if traced:
+            current, peak = tracemalloc.get_traced_memory()
+            row.update(retained_kib=(current - before) / 1024, peak_kib=(peak - before) / 1024)
+        row["locations"], row["pool"], row["filled"] = counts(world)
+        rows.append(row)
+    if traced:
+        tracemalloc.stop()
+    return rows, beatable, world
+
+
+def bench_preset(name: str, seed: int, repeat: int) -> Dict[str, Any]:
+    preset = MATRIX[name]
+    # Warm-up: the world's generation-time imports aren't per-seed costs.
+    # The untraced worlds stay alive through the traced run, or freeing them would drop the shared rule objects
+    # (held weakly) and the traced run would be charged for building them again.
+    untraced = [run_stages(preset, seed, traced=False) for _ in range(repeat + 1)]
+    timings = [rows for rows, _, _ in untraced[1:]]
+    rows, beatable, _ = run_stages(preset, seed, traced=True)
+    for index, row in enumerate(rows):
+        row["ms"] = min(timing[index]["ms"] for timing in timings)
+    total = sum(row["ms"] for row in rows)
+    del untraced
+
+    print(f"== {name}: {rows[-1]['locations']} locations, {rows[-1]['pool']} pool items, "
+          f"{total:.2f} ms (best of {repeat}), {'beatable' if beatable else 'NOT BEATABLE'}")
+    print(f"   {'stage':<15}{'ms':>9}{'retained KiB':>14}{'peak KiB':>10}{'locations':>11}{'pool':>6}{'filled':>8}")
+    for row in rows:
+        print(f"   {row['stage']:<15}{row['ms']:9.2f}{row['retained_kib']:14.1f}{row['peak_kib']:10.1f}"
+              f"{row['locations']:11d}{row['pool']:6d}{row['filled']:8d}")
+    return {"preset": name, "options": preset, "total_ms": total, "beatable": beatable, "stages": rows}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(MATRIX), action="append",
+                        help="Preset to run (repeatable). Defaults to the whole matrix.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per preset, best one is kept")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results to this file")
+    parser.add_argument("--budget", type=float, help="Fail if any preset takes longer than this many ms in total")
+    args = parser.parse_args()
+
+    results = [bench_preset(name, args.seed, args.repeat) for name in args.preset or MATRIX]
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"seed": args.seed, "repeat": args.repeat, "results": results}, file, indent=2)
+
+    failures: List[str] = [f"{result['preset']} isn't beatable" for result in results if not result["beatable"]]
+    if args.budget is not None:
+        failures += [f"{result['preset']} took {result['total_ms']:.2f} ms, over the {args.budget:.2f} ms budget"
+                     for result in results if result["total_ms"] > args.budget]
+    if failures:
+        sys.exit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Import-time benchmark for the Goose APWorld.
+
+Imports untitled_goose_game in fresh interpreters under `python -X importtime`, with the Archipelago core
+(the stubs in ../tests/stubs) already imported the way the launcher has it, and reports what the world itself
+costs. The best of several runs is kept, since a cold start is noisy.
+
+    python APWorld/benchmarks/bench_import.py [--runs 7] [--budget 15]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STUBS = os.path.join(os.path.dirname(HERE), "tests", "stubs")
+PACKAGE = "untitled_goose_game"
+# Already loaded by the time Archipelago imports any world
+CORE = "import BaseClasses, Options, worlds.AutoWorld"
+
+
+def import_once() -> Tuple[int, Dict[str, int]]:
+    """Microseconds for the whole package import, and the self time of each of its modules."""
+    # Bytecode writing stays on, so only the first (warm-up) run pays for compiling
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([STUBS, os.path.dirname(HERE)]),
+               PYTHONDONTWRITEBYTECODE="")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"{CORE}; import {PACKAGE}"],
+                            env=env, capture_output=True, text=True, check=True)
+    total = 0
+    modules: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # Header line
+        name = name.strip()
+        if name == PACKAGE:
+            total = int(cumulative_us)
+        if name.split(".")[0] == PACKAGE:
+            modules[name] = int(self_us)
+    return total, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters to import in, best one is kept")
+    parser.add_argument("--top", type=int, default=12, help="Most expensive world modules to list")
+    parser.add_argument("--budget", type=float, default=15,
+                        help="Fail if the package import takes longer than this many ms")
+    args = parser.parse_args()
+
+    import_once()  # Warm the bytecode cache so every measured run is alike
+    runs: List[Tuple[int, Dict[str, int]]] = [import_once() for _ in range(args.runs)]
+    total, modules = min(runs, key=lambda run: run[0])
+
+    print(f"== import {PACKAGE}: {total / 1000:.2f} ms (best of {args.runs}, core already imported)")
+    for name, self_us in sorted(modules.items(), key=lambda module: -module[1])[:args.top]:
+        print(f"   {self_us / 1000:7.2f} ms  {name}")
+    if total / 1000 > args.budget:
+        sys.exit(f"Import took {total / 1000:.2f} ms, over the {args.budget:.2f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Memory report for a single Goose slot.
+
+Builds a world under each option preset and measures, with tracemalloc, what one more slot holds once its
+rules are set, while slots with the same options already exist (as in a large async game, where shared
+rule objects are already around). It then rebuilds the slot's items the way they used to be made (a plain
+subclass with an instance __dict__, one constructor call per item), to show the per-slot item footprint
+before and after __slots__ and filler cloning. Runs offline against the stubs
+in ../tests/stubs.
+
+    python APWorld/benchmarks/bench_memory.py [--preset everything]
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, Tuple
+
+from common import PRESETS, build_world
+from untitled_goose_game.Items import item_table, repeated_items
+from BaseClasses import Item
+
+
+class PlainItem(Item):
+    """How GooseGameItem used to be declared: no __slots__, so every instance carries a __dict__."""
+    game = "Untitled Goose Game"
+
+
+def measure(make: Callable[[], object]) -> Tuple[int, object]:
+    """Bytes still allocated after make() returns, and what it returned (kept alive while measuring)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = make()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size, result
+
+
+def report(label: str, count: int, before: int, after: int) -> None:
+    print(f"   {label:<10} before {before / 1024:8.1f} KiB ({before / count:5.0f} B each)"
+          f"   now {after / 1024:8.1f} KiB ({after / count:5.0f} B each)"
+          f"   saved {(before - after) / 1024:7.1f} KiB")
+
+
+def memory_preset(name: str) -> None:
+    # Unmeasured builds first, so one-off costs aren't counted: the world's generation-time imports and the
+    # shared rule objects. They're kept alive while measuring, since the shared rules are only held weakly and
+    # freeing them would make the next slot pay to build them again.
+    warm_worlds = [build_world(PRESETS[name]) for _ in range(2)]
+    slot_size, world = measure(lambda: build_world(PRESETS[name]))
+    player = world.player
+    pool = [item.name for item in world.multiworld.itempool]
+    locations = world.multiworld.get_locations(player)
+
+    items_after, _ = measure(lambda: [world.create_item(item_name) for item_name in pool])
+    items_before, _ = measure(lambda: [
+        PlainItem(item_name, item_table[item_name].classification, item_table[item_name].id, player)
+        for item_name in pool
+    ])
+
+    cloned = sum(item_name in repeated_items for item_name in pool)
+    print(f"== {name}: {len(locations)} locations, {len(pool)} pool items ({cloned} cloned fillers/traps)")
+    print(f"   one more slot through set_rules: {slot_size / 1024:8.1f} KiB")
+    report("items", len(pool), items_before, items_after)
+    del warm_worlds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), action="append",
+                        help="Preset to run (repeatable). Defaults to all of them.")
+    args = parser.parse_args()
+
+    for name in args.preset or PRESETS:
+        memory_preset(name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Connection-path benchmark for the Python APProxy.
+
+Starts a stand-in Archipelago server (a local WebSocket server that answers the packets the game sends),
+launches APProxy.py against it on an ephemeral port, and connects as soon as the proxy's READY line says it is
+listening. Reports how long that took and how long until RoomInfo arrived (against the 1.5 s or more that
+ArchipelagoClient.Connect sleeps before its first try), the round-trip time of single packets through the
+proxy, and how a burst of location checks gets across (how fast, and in how many frames) under each
+--batch-window, e.g. 0 (one frame per check, as the game sends them) against the proxy's default.
+Then it connects twice to a room of --games made-up games, the first time with an empty DataPackage cache and
+the second time with it warm, and reports how long the game waited for its DataPackage and how much of it
+came from the server. Runs offline; needs the websockets package, like the proxy itself.
+
+    python APWorld/benchmarks/bench_proxy.py [--round-trips 200] [--burst 100] [--gap-ms 1] [--batch-window 0 --batch-window 5]
+                                             [--games 50]
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import websockets
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROXY = os.path.join(os.path.dirname(HERE), "APProxy", "APProxy.py")
+
+def make_package(game: str, items: int = 500, locations: int = 1000) -> Dict[str, Any]:
+    package: Dict[str, Any] = {
+        "item_name_groups": {"Everything": [f"{game} Item {index}" for index in range(items)]},
+        "item_name_to_id": {f"{game} Item {index}": index + 1 for index in range(items)},
+        "location_name_groups": {},
+        "location_name_to_id": {f"{game} Location {index}": index + 1 for index in range(locations)},
+    }
+    package["checksum"] = hashlib.sha1(json.dumps(package, sort_keys=True).encode()).hexdigest()
+    return package
+
+
+class FakeServer:
+    """Just enough of an Archipelago server to answer the game: RoomInfo on connect, Connected for Connect,
+    Bounced for Bounce, DataPackage for GetDataPackage. Counts the frames, location checks and DataPackage
+    bytes it receives or sends."""
+
+    def __init__(self, packages: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        self.packages = packages or {"Untitled Goose Game": make_package("Untitled Goose Game")}
+        self.frames = 0
+        self.checked: List[int] = []
+        self.package_bytes = 0
+
+    async def handle(self, socket) -> None:
+        try:
+            await self.answer(socket)
+        except websockets.exceptions.ConnectionClosed:
+            pass  # The proxy was stopped mid-connection
+
+    async def answer(self, socket) -> None:
+        await socket.send(json.dumps([{
+            "cmd": "RoomInfo", "version": {"major": 0, "minor": 6, "build": 4, "class": "Version"},
+            "games": list(self.packages), "seed_name": "benchmark",
+            "datapackage_checksums": {game: package["checksum"] for game, package in self.packages.items()},
+        }]))
+        async for message in socket:
+            self.frames += 1
+            for command in json.loads(message):
+                if command["cmd"] == "Connect":
+                    await socket.send(json.dumps([{"cmd": "Connected", "team": 0, "slot": 1, "players": [],
+                                                   "missing_locations": [], "checked_locations": [],
+                                                   "slot_data": {}}]))
+                elif command["cmd"] == "Bounce":
+                    await socket.send(json.dumps([{"cmd": "Bounced", "data": command.get("data", {})}]))
+                elif command["cmd"] == "LocationChecks":
+                    self.checked += command["locations"]
+                elif command["cmd"] == "GetDataPackage":
+                    games = command.get("games", list(self.packages))
+                    reply = json.dumps([{"cmd": "DataPackage", "data": {"games": {
+                        game: self.packages[game] for game in games if game in self.packages}}}],
+                        ensure_ascii=False, separators=(",", ":"))
+                    self.package_bytes += len(reply.encode())
+                    await socket.send(reply)
+
+
+async def launch(server_port: int, *options: str):
+    """Start the proxy on a free port; returns it with that port once it says it's ready."""
+    proxy = await asyncio.create_subprocess_exec(sys.executable, PROXY, "ws://127.0.0.1", str(server_port), "0",
+                                                 *options, stdout=asyncio.subprocess.PIPE,
+                                                 stderr=asyncio.subprocess.DEVNULL)
+    ready = (await proxy.stdout.readline()).decode().split()
+    if ready[:1] != ["READY"]:
+        proxy.terminate()
+        sys.exit(f"Proxy didn't announce readiness: {ready}")
+    return proxy, int(ready[1])
+
+
+async def run(round_trips: int, burst: int, gap_ms: float, batch_window: float) -> Dict[str, float]:
+    server = FakeServer()
+    async with websockets.serve(server.handle, "127.0.0.1", 0) as listener:
+        server_port = listener.sockets[0].getsockname()[1]
+        launched = time.perf_counter()
+        proxy, proxy_port = await launch(server_port, "--batch-window", str(batch_window), "--no-cache")
+        try:
+            ready_ms = (time.perf_counter() - launched) * 1000
+            reader, writer = await asyncio.open_connection("127.0.0.1", proxy_port)
+            await reader.readline()  # RoomInfo
+            room_info_ms = (time.perf_counter() - launched) * 1000
+            writer.write(b'[{"cmd":"Connect","game":"Untitled Goose Game","name":"Goose"}]\n')
+            await reader.readline()  # Connected
+
+            times = []
+            for index in range(round_trips):
+                start = time.perf_counter()
+                writer.write(f'[{{"cmd":"Bounce","data":{{"n":{index}}}}}]\n'.encode())
+                await reader.readline()
+                times.append(time.perf_counter() - start)
+
+            frames_before = server.frames
+            start = time.perf_counter()
+            for index in range(burst):
+                writer.write(f'[{{"cmd":"LocationChecks","locations":[{119001000 + index}]}}]\n'.encode())
+                if gap_ms:
+                    await writer.drain()
+                    await asyncio.sleep(gap_ms / 1000)
+            # A Bounce after the burst: once it comes back, every check before it has arrived
+            writer.write(b'[{"cmd":"Bounce","data":{}}]\n')
+            await reader.readline()
+            burst_s = time.perf_counter() - start
+            writer.close()
+        finally:
+            proxy.terminate()
+            await proxy.wait()
+
+    times.sort()
+    return {
+        "ready_ms": ready_ms,
+        "room_info_ms": room_info_ms,
+        "rtt_median_ms": statistics.median(times) * 1000,
+        "rtt_p99_ms": times[int(len(times) * 0.99) - 1] * 1000,
+        "burst_checks_per_s": burst / burst_s,
+        "burst_frames": server.frames - frames_before - 1,
+        "checks_received": len(server.checked),
+    }
+
+
+async def fetch_packages(proxy_port: int, server: FakeServer) -> Dict[str, float]:
+    """One connection as the game makes it, up to its DataPackage: how long that took, and what it held."""
+    bytes_before = server.package_bytes
+    reader, writer = await asyncio.open_connection("127.0.0.1", proxy_port, limit=1 << 26)
+    await reader.readline()  # RoomInfo
+    writer.write(b'[{"cmd":"Connect","game":"Untitled Goose Game","name":"Goose"}]\n')
+    await reader.readline()  # Connected
+    start = time.perf_counter()
+    writer.write(b'[{"cmd":"GetDataPackage"}]\n')
+    line = await reader.readline()
+    elapsed = time.perf_counter() - start
+    writer.close()
+    games = json.loads(line)[0]["data"]["games"]
+    return {
+        "ms": elapsed * 1000,
+        "games": len(games),
+        "intact": all(games.get(game) == package for game, package in server.packages.items()),
+        "server_kib": (server.package_bytes - bytes_before) / 1024,
+        "line_kib": len(line) / 1024,
+    }
+
+
+async def run_packages(game_count: int) -> Dict[str, Dict[str, float]]:
+    """Without the cache, then a cold connection, a warm one, and a warm one after a game in the room changed."""
+    server = FakeServer({f"Game {index}": make_package(f"Game {index}") for index in range(game_count)})
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        async with websockets.serve(server.handle, "127.0.0.1", 0, max_size=None) as listener:
+            proxy, proxy_port = await launch(listener.sockets[0].getsockname()[1], "--no-cache")
+            try:
+                results["no cache"] = await fetch_packages(proxy_port, server)
+            finally:
+                proxy.terminate()
+                await proxy.wait()
+            proxy, proxy_port = await launch(listener.sockets[0].getsockname()[1], "--cache-dir", cache_dir)
+            try:
+                results["cold"] = await fetch_packages(proxy_port, server)
+                results["warm"] = await fetch_packages(proxy_port, server)
+                server.packages["Game 0"] = make_package("Game 0", items=501)
+                results["one changed"] = await fetch_packages(proxy_port, server)
+            finally:
+                proxy.terminate()
+                await proxy.wait()
+            # A new proxy process only has the cache on disk to go on
+            proxy, proxy_port = await launch(listener.sockets[0].getsockname()[1], "--cache-dir", cache_dir)
+            try:
+                results["restarted"] = await fetch_packages(proxy_port, server)
+            finally:
+                proxy.terminate()
+                await proxy.wait()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--round-trips", type=int, default=200)
+    parser.add_argument("--burst", type=int, default=100, help="Location checks in the burst, one per line")
+    parser.add_argument("--gap-ms", type=float, default=1.0, help="Time between checks in the burst (0 for back to back)")
+    parser.add_argument("--batch-window", type=float, action="append",
+                        help="Proxy batch window in ms to run under (repeatable). Defaults to 0 and 5.")
+    parser.add_argument("--games", type=int, default=50, help="Games in the room for the DataPackage runs")
+    args = parser.parse_args()
+
+    for batch_window in args.batch_window or [0.0, 5.0]:
+        result = asyncio.run(run(args.round_trips, args.burst, args.gap_ms, batch_window))
+        print(f"== APProxy.py over localhost, batch window {batch_window:g} ms")
+        print(f"   READY after launch      {result['ready_ms']:8.1f} ms")
+        print(f"   RoomInfo after launch   {result['room_info_ms']:8.1f} ms")
+        print(f"   round trip              {result['rtt_median_ms']:8.3f} ms median, {result['rtt_p99_ms']:.3f} ms p99")
+        print(f"   burst of {args.burst} checks     {result['burst_checks_per_s']:8.0f} checks/s in "
+              f"{result['burst_frames']} frames ({result['checks_received']} received)")
+
+    print(f"== DataPackage for {args.games} games")
+    for name, result in asyncio.run(run_packages(args.games)).items():
+        print(f"   {name:<12}{result['ms']:8.1f} ms, {result['server_kib']:8.1f} KiB from the server, "
+              f"{result['line_kib']:.1f} KiB line, {result['games']} games{'' if result['intact'] else ' (WRONG)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Micro-benchmark for the Goose location rules.
+
+Builds UntitledGooseRules under each option preset, draws random partial item sets and times every
+location rule against them, plus a full sweep over all rules per item set. Runs offline against the
+stubs in ../tests/stubs.
+
+    python APWorld/benchmarks/bench_rules.py [--preset everything] [--states 2000] [--top 15] [--budget 1000]
+"""
+import argparse
+import random
+import sys
+import time
+from typing import List, Tuple
+
+from common import PRESETS, build_world
+from untitled_goose_game.Items import item_bit_table, item_table, PROGRESSION_MASK
+from BaseClasses import ItemClassification
+
+
+class BenchState:
+    """Stand-in for CollectionState: the rules only ever read the player's progression mask."""
+    __slots__ = ("prog_items",)
+
+    def __init__(self, player: int, mask: int) -> None:
+        self.prog_items = {player: {PROGRESSION_MASK: mask}}
+
+
+def random_states(player: int, count: int, rng: random.Random) -> List[BenchState]:
+    progression = [item_bit_table[name] for name, data in item_table.items()
+                   if data.classification & ItemClassification.progression]
+    states = []
+    for _ in range(count):
+        # Spread densities out so early, mid and late game item sets all show up
+        density = rng.random()
+        mask = 0
+        for bit in progression:
+            if rng.random() < density:
+                mask |= bit
+        states.append(BenchState(player, mask))
+    return states
+
+
+def time_rule(rule, states: List[BenchState], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for state in states:
+            rule(state)
+        best = min(best, time.perf_counter() - start)
+    return best / len(states) * 1e9
+
+
+def bench_preset(name: str, states_count: int, repeat: int, top: int, seed: int) -> float:
+    """Print the timings for one preset and return the full sweep cost in ns per rule."""
+    world = build_world(PRESETS[name])
+    locations = world.multiworld.get_locations(world.player)
+    states = random_states(world.player, states_count, random.Random(seed))
+
+    per_location: List[Tuple[float, str]] = [
+        (time_rule(location.access_rule, states, repeat), location.name) for location in locations
+    ]
+    rules = [location.access_rule for location in locations]
+
+    def sweep() -> None:
+        for state in states:
+            for rule in rules:
+                rule(state)
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        sweep()
+        best = min(best, time.perf_counter() - start)
+
+    per_rule = best / (states_count * len(rules)) * 1e9
+    per_location.sort(reverse=True)
+    print(f"== {name}: {len(locations)} locations, {len({id(rule) for rule in rules})} distinct rules, "
+          f"{states_count} item sets")
+    print(f"   full sweep: {best / states_count * 1e6:8.2f} us per item set "
+          f"({per_rule:.0f} ns per rule)")
+    for ns, location_name in per_location[:top]:
+        print(f"   {ns:8.0f} ns  {location_name}")
+    return per_rule
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), action="append",
+                        help="Preset to run (repeatable). Defaults to all of them.")
+    parser.add_argument("--states", type=int, default=2000, help="Random item sets per preset")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per rule, best one is kept")
+    parser.add_argument("--top", type=int, default=15, help="Slowest rules to list per preset")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float,
+                        help="Fail if any preset's full sweep costs more than this many ns per rule")
+    args = parser.parse_args()
+
+    over_budget = []
+    for name in args.preset or PRESETS:
+        per_rule = bench_preset(name, args.states, args.repeat, args.top, args.seed)
+        if args.budget is not None and per_rule > args.budget:
+            over_budget.append(name)
+    if over_budget:
+        sys.exit(f"Over the {args.budget:.0f} ns per rule budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+    main()
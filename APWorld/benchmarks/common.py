@@ -0,0 +1,60 @@
+"""Shared setup for the Goose benchmarks: builds a world against the test stubs in ../tests/stubs, so no Archipelago checkout is needed."""
+import os
+import sys
+from typing import Any, Dict, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(os.path.dirname(HERE), "tests", "stubs"), os.path.dirname(HERE)]
+
+from BaseClasses import MultiWorld  # noqa: E402
+import untitled_goose_game  # noqa: E402
+from untitled_goose_game import GooseGameWorld, GooseGameOptions  # noqa: E402
+
+
+# Option presets the benchmarks run under. Anything not listed keeps its default.
+PRESETS: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    "no_souls": {
+        "include_npc_souls": 0,
+        "include_prop_souls": 0,
+    },
+    "everything": {
+        "goal": 5,
+        "include_extra_tasks": 1,
+        "include_speedrun_tasks": 1,
+        "include_model_church_pecks": 2,
+        "include_new_tasks": 1,
+    },
+}
+
+
+def make_options(values: Dict[str, Any]) -> GooseGameOptions:
+    return GooseGameOptions(**{
+        field: option_type(values.get(field, option_type.default))
+        for field, option_type in GooseGameOptions.__annotations__.items()
+    })
+
+
+# The world's generation steps, in the order Archipelago calls them
+STEPS: Tuple[str, ...] = ("generate_early", "create_regions", "create_items", "set_rules", "pre_fill")
+
+
+def new_world(preset: Dict[str, Any], seed: int = 0) -> GooseGameWorld:
+    """A single-player multiworld holding one Goose world, before any generation step has run."""
+    multiworld = MultiWorld(1)
+    multiworld.random.seed(seed)
+    # Random starting area would make runs differ, so the presets pin it unless they say otherwise
+    world = GooseGameWorld(multiworld, 1)
+    world.options = make_options({"starting_area": 0, **preset})
+    multiworld.worlds[1] = world
+    return world
+
+
+def build_world(preset: Dict[str, Any], seed: int = 0, through: str = "set_rules") -> GooseGameWorld:
+    """Run a single Goose world through its generation steps, stopping after `through`."""
+    world = new_world(preset, seed)
+    for step in STEPS:
+        getattr(world, step)()
+        if step == through:
+            break
+    return world
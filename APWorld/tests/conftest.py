@@ -0,0 +1,11 @@
+"""Runs the Goose world against the stubs in ./stubs, so the tests need no Archipelago checkout.
+
+    python -m pytest APWorld/tests
+"""
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APWORLD = os.path.dirname(HERE)
+# APProxy is a script rather than a package, so its folder goes on the path too
+sys.path[:0] = [os.path.join(HERE, "stubs"), APWORLD, os.path.join(APWORLD, "APProxy")]
@@ -0,0 +1,85 @@
+"""Builds Goose worlds against the stubs, and draws the option sets and collected items the tests check over."""
+import random
+from typing import Any, Dict, Iterable, List
+
+from BaseClasses import CollectionState, ItemClassification, MultiWorld
+from untitled_goose_game import GooseGameOptions, GooseGameWorld
+from untitled_goose_game.Items import item_table
+
+# The world's generation steps, in the order Archipelago calls them
+STEPS = ("generate_early", "create_regions", "create_items", "set_rules")
+
+PROGRESSION: List[str] = [
+    name for name, data in item_table.items() if data.classification & ItemClassification.progression
+]
+
+
+def make_options(values: Dict[str, Any]) -> GooseGameOptions:
+    return GooseGameOptions(**{
+        field: option_type(values.get(field, option_type.default))
+        for field, option_type in GooseGameOptions.__annotations__.items()
+    })
+
+
+def build_world(values: Dict[str, Any], through: str = "set_rules", seed: int = 0) -> GooseGameWorld:
+    """A single Goose world run through its generation steps, stopping after `through`.
+
+    The starting area is pinned to the Garden unless `values` says otherwise, so a seed always builds the same world."""
+    multiworld = MultiWorld(1)
+    multiworld.random.seed(seed)
+    world = GooseGameWorld(multiworld, 1)
+    world.options = make_options({"starting_area": 0, **values})
+    multiworld.worlds[1] = world
+    for step in STEPS:
+        getattr(world, step)()
+        if step == through:
+            break
+    return world
+
+
+def random_options(rng: random.Random) -> Dict[str, int]:
+    """An option set generate_early accepts, with every option that changes the rules drawn at random."""
+    values = {
+        "starting_area": rng.randrange(4),
+        "goal": rng.randrange(7),
+        "include_npc_souls": rng.randrange(2),
+        "logically_require_npc_souls": rng.randrange(2),
+        "include_prop_souls": rng.randrange(2),
+        "include_extra_tasks": rng.randrange(2),
+        "include_speedrun_tasks": rng.randrange(2),
+        "include_item_pickups": rng.randrange(2),
+        "include_drag_items": rng.randrange(2),
+        "include_interactions": rng.randrange(2),
+        "include_model_church_pecks": rng.randrange(3),
+        "include_milestone_locations": rng.randrange(2),
+        "include_new_tasks": rng.randrange(2),
+    }
+    # The combinations generate_early turns down
+    if values["include_prop_souls"]:
+        values["include_item_pickups"] = 1
+    if values["goal"] in (3, 5):
+        values["include_speedrun_tasks"] = 1
+    if values["goal"] in (4, 5):
+        values["include_extra_tasks"] = 1
+    return values
+
+
+def random_item_sets(rng: random.Random, count: int) -> Iterable[List[str]]:
+    """Progression item names, from early game to almost everything.
+
+    Half are drawn at a random density; the other half are everything but a few items, where the long goal
+    and milestone rules are close to passing and a single missing item decides them."""
+    for index in range(count):
+        if index % 2:
+            missing = set(rng.sample(PROGRESSION, rng.randrange(6)))
+            yield [name for name in PROGRESSION if name not in missing]
+        else:
+            density = rng.random()
+            yield [name for name in PROGRESSION if rng.random() < density]
+
+
+def collected(world: GooseGameWorld, names: Iterable[str]) -> CollectionState:
+    state = CollectionState(world.multiworld)
+    for name in names:
+        state.collect(world.create_item(name))
+    return state
@@ -0,0 +1,184 @@
+"""Just enough of Archipelago's BaseClasses to build a Goose world offline, for the tests and benchmarks.
+Not a full reimplementation: names and signatures follow Archipelago, behaviour is the minimum the world relies on."""
+import random
+from collections import Counter
+from enum import IntFlag
+
+
+class ItemClassification(IntFlag):
+    filler = 0b00000
+    progression = 0b00001
+    useful = 0b00010
+    trap = 0b00100
+    skip_balancing = 0b01000
+    deprioritized = 0b10000
+    progression_skip_balancing = 0b01001
+    progression_deprioritized = 0b10001
+    progression_deprioritized_skip_balancing = 0b11001
+
+
+class Item:
+    game = "Generic"
+    __slots__ = ("name", "classification", "code", "player", "location")
+
+    def __init__(self, name, classification, code, player):
+        self.name = name
+        self.classification = classification
+        self.player = player
+        self.code = code
+        self.location = None
+
+    @property
+    def advancement(self):
+        return bool(self.classification & ItemClassification.progression)
+
+    @property
+    def useful(self):
+        return bool(self.classification & ItemClassification.useful)
+
+    @property
+    def trap(self):
+        return bool(self.classification & ItemClassification.trap)
+
+
+class Location:
+    game = "Generic"
+    item = None
+    locked = False
+    access_rule = staticmethod(lambda state: True)
+
+    def __init__(self, player, name="", address=None, parent=None):
+        self.player = player
+        self.name = name
+        self.address = address
+        self.parent_region = parent
+
+    def can_reach(self, state):
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def place_locked_item(self, item):
+        self.item = item
+        item.location = self
+        self.locked = True
+
+
+class Entrance:
+    access_rule = staticmethod(lambda state: True)
+
+    def __init__(self, player, name="", parent=None):
+        self.player = player
+        self.name = name
+        self.parent_region = parent
+        self.connected_region = None
+
+    def can_reach(self, state):
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def connect(self, region):
+        self.connected_region = region
+        region.entrances.append(self)
+
+
+class Region:
+    def __init__(self, name, player, multiworld, hint=None):
+        self.name = name
+        self.player = player
+        self.multiworld = multiworld
+        self.locations = []
+        self.exits = []
+        self.entrances = []
+
+    def can_reach(self, state):
+        return state.can_reach_region(self)
+
+    def connect(self, connecting_region, name=None, rule=None):
+        exit_ = Entrance(self.player, name or f"{self.name} -> {connecting_region.name}", self)
+        if rule:
+            exit_.access_rule = rule
+        self.exits.append(exit_)
+        exit_.connect(connecting_region)
+        return exit_
+
+
+class CollectionState:
+    def __init__(self, multiworld):
+        self.multiworld = multiworld
+        self.prog_items = {player: Counter() for player in multiworld.player_ids}
+        for items in multiworld.precollected_items.values():
+            for item in items:
+                self.collect(item, True)
+
+    def copy(self):
+        ret = CollectionState.__new__(CollectionState)
+        ret.multiworld = self.multiworld
+        ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
+        return ret
+
+    def can_reach_region(self, region):
+        # No menu region in the stub multiworld's entrances, so a region with no way in is the start
+        if not region.entrances:
+            return True
+        return any(entrance.can_reach(self) for entrance in region.entrances)
+
+    def has(self, item, player, count=1):
+        return self.prog_items[player][item] >= count
+
+    def has_all(self, items, player):
+        return all(self.prog_items[player][item] for item in items)
+
+    def has_any(self, items, player):
+        return any(self.prog_items[player][item] for item in items)
+
+    def count(self, item, player):
+        return self.prog_items[player][item]
+
+    def collect(self, item, prevent_sweep=False, location=None):
+        return self.multiworld.worlds[item.player].collect(self, item)
+
+    def remove(self, item):
+        return self.multiworld.worlds[item.player].remove(self, item)
+
+
+class MultiWorld:
+    def __init__(self, players=1):
+        self.player_ids = tuple(range(1, players + 1))
+        self.regions = []
+        self.itempool = []
+        self.precollected_items = {player: [] for player in self.player_ids}
+        self.worlds = {}
+        self.completion_condition = {}
+        self.random = random.Random(0)
+        self.seed_name = "benchmark"
+        self.player_name = {player: f"Player{player}" for player in self.player_ids}
+
+    def get_regions(self, player=None):
+        return [region for region in self.regions if player is None or region.player == player]
+
+    def get_region(self, name, player):
+        for region in self.regions:
+            if region.name == name and region.player == player:
+                return region
+        raise KeyError(name)
+
+    def get_locations(self, player=None):
+        return [location for region in self.get_regions(player) for location in region.locations]
+
+    def get_location(self, name, player):
+        for location in self.get_locations(player):
+            if location.name == name:
+                return location
+        raise KeyError(name)
+
+    def get_unfilled_locations(self, player=None):
+        return [location for location in self.get_locations(player) if location.item is None]
+
+    def get_out_file_name_base(self, player):
+        return f"AP_{self.seed_name}_P{player}_{self.player_name[player]}"
+
+    def push_precollected(self, item):
+        self.precollected_items[item.player].append(item)
+
+
+class Tutorial:
+    def __init__(self, *args):
+        self.args = args
@@ -0,0 +1,47 @@
+"""Just enough of Archipelago's Options for GooseGameOptions to build, for the tests and benchmarks."""
+from dataclasses import dataclass
+
+
+class OptionError(ValueError):
+    pass
+
+
+class Option:
+    default = 0
+
+    def __init__(self, value):
+        self.value = int(value)
+
+    def __bool__(self):
+        return bool(self.value)
+
+    def __int__(self):
+        return self.value
+
+    def __eq__(self, other):
+        return self.value == (other.value if isinstance(other, Option) else other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+class Toggle(Option):
+    pass
+
+
+class DefaultOnToggle(Toggle):
+    default = 1
+
+
+class Choice(Option):
+    pass
+
+
+class Range(Option):
+    range_start = 0
+    range_end = 1
+
+
+@dataclass
+class PerGameCommonOptions:
+    pass
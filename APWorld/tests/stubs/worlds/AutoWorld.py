@@ -0,0 +1,35 @@
+"""Just enough of Archipelago's World base class for the Goose world to run its generation steps."""
+import random
+
+
+class WebWorld:
+    pass
+
+
+class World:
+    options_dataclass = None
+    topology_present = False
+
+    def __init__(self, multiworld, player):
+        self.multiworld = multiworld
+        self.player = player
+        self.random = random.Random(multiworld.random.getrandbits(64))
+
+    def collect_item(self, state, item, remove=False):
+        return item.name if item.advancement else None
+
+    def collect(self, state, item):
+        name = self.collect_item(state, item)
+        if name:
+            state.prog_items[self.player][name] += 1
+            return True
+        return False
+
+    def remove(self, state, item):
+        name = self.collect_item(state, item, True)
+        if name:
+            state.prog_items[self.player][name] -= 1
+            if state.prog_items[self.player][name] < 1:
+                del state.prog_items[self.player][name]
+            return True
+        return False
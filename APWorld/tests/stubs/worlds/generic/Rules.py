@@ -0,0 +1,2 @@
+def set_rule(spot, rule):
+    spot.access_rule = rule
@@ -0,0 +1,84 @@
+"""gating_items, and the souls the world makes as useful because of it."""
+import random
+from typing import Dict
+
+import pytest
+
+from BaseClasses import CollectionState, ItemClassification
+from helpers import build_world, random_item_sets, random_options
+from untitled_goose_game.Dependencies import gating_items
+from untitled_goose_game.Items import GooseGameItem, item_bit_table, item_table, npc_souls, prop_souls
+from untitled_goose_game.Requirements import Requirement
+
+
+def read_by_rules(world) -> int:
+    """Every item some location, entrance or the goal reads, going by the rules as they were set."""
+    multiworld = world.multiworld
+    rules = [location.access_rule for location in multiworld.get_locations(world.player)]
+    rules += [entrance.access_rule for region in multiworld.get_regions(world.player) for entrance in region.entrances]
+    rules.append(multiworld.completion_condition[world.player])
+    mask = 0
+    for rule in rules:
+        mask |= rule.dependencies() if isinstance(rule, Requirement) else 0
+    return mask
+
+
+def as_progression(world, names) -> CollectionState:
+    """A state holding the items as the item table classifies them, so downgraded souls are still counted."""
+    state = CollectionState(world.multiworld)
+    for name in names:
+        state.collect(GooseGameItem(name, item_table[name].classification, item_table[name].id, world.player))
+    return state
+
+
+@pytest.mark.parametrize("seed", range(24))
+def test_downgraded_souls_gate_nothing(seed: int) -> None:
+    rng = random.Random(seed)
+    world = build_world(random_options(rng))
+    gating = gating_items(world)
+    assert read_by_rules(world) & ~gating == 0
+    assert all(not item_bit_table[soul] & gating for soul in world.non_gating_souls)
+
+    # Every pool item the table calls progression stays progression unless it gates nothing, and then it's useful
+    for item in world.multiworld.itempool:
+        table_classification = item_table[item.name].classification
+        if not table_classification & ItemClassification.progression:
+            assert item.classification == table_classification
+        elif item_bit_table[item.name] & gating:
+            assert item.name not in world.non_gating_souls
+            assert item.classification == table_classification
+        else:
+            assert item.name in world.non_gating_souls
+            assert item.classification == ItemClassification.useful
+
+    # Holding the downgraded souls or not never changes what can be reached
+    locations = world.multiworld.get_locations(world.player)
+    goal = world.multiworld.completion_condition[world.player]
+    for items in random_item_sets(rng, 16):
+        without = as_progression(world, [name for name in items if name not in world.non_gating_souls])
+        held = as_progression(world, set(items) | world.non_gating_souls)
+        assert [location.can_reach(without) for location in locations] == \
+            [location.can_reach(held) for location in locations]
+        assert goal(without) == goal(held)
+
+
+@pytest.mark.parametrize("values, downgraded", [
+    ({}, 1),
+    ({"include_drag_items": 0, "include_interactions": 0}, 29),
+    # Nothing reads a soul when souls are off, so every soul create_items knows of gates nothing
+    ({"include_npc_souls": 0, "include_prop_souls": 0}, 130),
+], ids=["default", "no_drags_or_interactions", "no_souls"])
+def test_non_gating_soul_counts(values: Dict[str, int], downgraded: int) -> None:
+    world = build_world(values)
+    assert len(world.non_gating_souls) == downgraded
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_souls_made_before_create_items_are_downgraded(seed: int) -> None:
+    """Start inventory is made between generate_early and create_items, so its souls need the same classification."""
+    values = random_options(random.Random(seed))
+    early = build_world(values, through="generate_early", seed=seed)
+    assert early.non_gating_souls == build_world(values, seed=seed).non_gating_souls
+    for soul in npc_souls + prop_souls:
+        expected = ItemClassification.useful if soul in early.non_gating_souls else item_table[soul].classification
+        assert early.create_item(soul).classification == expected
@@ -0,0 +1,41 @@
+"""apportion: exact counts, split by weight, with ties settled by order rather than a roll."""
+import pytest
+
+from untitled_goose_game.Items import apportion
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 7, 10, 33, 100])
+@pytest.mark.parametrize("weights", [
+    [("A", 1)],
+    [("A", 1), ("B", 1)],
+    [("A", 3), ("B", 1)],
+    [("A", 50), ("B", 30), ("C", 20)],
+    [("A", 1), ("B", 1), ("C", 1)],
+    [("A", 7), ("B", 0), ("C", 2)],
+])
+def test_apportion_sums_to_count(weights, count: int) -> None:
+    names = apportion(weights, count)
+    assert len(names) == count
+    total = sum(weight for _, weight in weights)
+    for name, weight in weights:
+        # Never more than one off the exact share
+        assert abs(names.count(name) - count * weight / total) < 1
+
+
+def test_apportion_exact_shares() -> None:
+    assert apportion([("A", 50), ("B", 30), ("C", 20)], 10) == ["A"] * 5 + ["B"] * 3 + ["C"] * 2
+
+
+def test_apportion_keeps_input_order() -> None:
+    assert apportion([("B", 1), ("A", 3)], 4) == ["B", "A", "A", "A"]
+
+
+def test_apportion_largest_remainder_first() -> None:
+    # Shares of 5.4 / 3.6 / 1.0: the one left over goes to B, the largest remainder
+    assert apportion([("A", 54), ("B", 36), ("C", 10)], 10) == ["A"] * 5 + ["B"] * 4 + ["C"]
+
+
+def test_apportion_ties_go_to_earlier_names() -> None:
+    assert apportion([("A", 1), ("B", 1), ("C", 1)], 2) == ["A", "B"]
+    assert apportion([("A", 1), ("B", 1), ("C", 1)], 4) == ["A", "A", "B", "C"]
+    assert apportion([("C", 1), ("B", 1), ("A", 1)], 1) == ["C"]
@@ -0,0 +1,119 @@
+"""LocationPlan against the option chains it replaced: the old create_regions location set and starting area roll."""
+import random
+from typing import Dict, List, Tuple
+
+import pytest
+
+from BaseClasses import MultiWorld
+from helpers import build_world, make_options, random_options
+from untitled_goose_game import GooseGameWorld
+from untitled_goose_game.LocationPlan import REGION_INDEX
+from untitled_goose_game.Locations import (
+    BASE_ID, location_table, extra_locations, speedrun_locations, item_pickup_locations, drag_item_locations,
+    interaction_locations, unique_item_pickup_locations, unique_item_drag_locations, sandcastle_peck_locations,
+    sandcastle_first_peck_locations, milestone_locations_main_tasks, new_tasks_locations
+)
+from untitled_goose_game.names import itemNames, locationNames, regionNames
+
+# The areas the old get_starting_area_name picked from, by option value (4 rolls one at random)
+AREA_NAMES = [
+    itemNames.GARDEN_ACCESS,
+    itemNames.HIGH_STREET_ACCESS,
+    itemNames.BACK_GARDENS_ACCESS,
+    itemNames.PUB_ACCESS,
+]
+
+
+def old_locations(options) -> List[Tuple[str, int, str]]:
+    """(name, id, region) for every location the old create_regions added, in the order it added them."""
+    added: List[Tuple[str, int, str]] = []
+
+    def add_table(table) -> None:
+        added.extend((name, data.id, data.region) for name, data in table.items())
+
+    add_table(location_table)
+    if options.include_extra_tasks:
+        add_table(extra_locations)
+    if options.include_speedrun_tasks:
+        add_table(speedrun_locations)
+    if options.include_item_pickups:
+        add_table(item_pickup_locations)
+        add_table(unique_item_pickup_locations)
+    if options.include_drag_items:
+        add_table(drag_item_locations)
+        add_table(unique_item_drag_locations)
+    if options.include_interactions:
+        add_table(interaction_locations)
+    if options.include_new_tasks:
+        add_table(new_tasks_locations)
+    pecking = options.include_model_church_pecks.value
+    if pecking == 1:
+        add_table(sandcastle_first_peck_locations)
+    elif pecking == 2:
+        add_table(sandcastle_peck_locations)
+    if options.include_milestone_locations:
+        add_table(milestone_locations_main_tasks)
+        if options.include_extra_tasks:
+            added.append((locationNames.MILESTONE_ALL_EXTRA, BASE_ID + 85, regionNames.HUB))
+        if options.include_speedrun_tasks:
+            added.append((locationNames.MILESTONE_ALL_SPEEDRUN, BASE_ID + 86, regionNames.HUB))
+        if options.include_extra_tasks and options.include_speedrun_tasks:
+            added.append((locationNames.MILESTONE_ALL_TASKS, BASE_ID + 90, regionNames.HUB))
+    goal = options.goal.value
+    if goal == 0:
+        added.append((locationNames.GOAL_MODEL_VILLAGE_ENTRY, BASE_ID + 93, regionNames.MODEL_VILLAGE))
+    elif goal == 2:
+        added.append((locationNames.GOAL_ALL_MAIN, BASE_ID + 89, regionNames.HUB))
+    elif goal == 3:
+        added.append((locationNames.GOAL_ALL_SPEEDRUN, BASE_ID + 87, regionNames.HUB))
+    elif goal == 4:
+        added.append((locationNames.GOAL_ALL_NON_SPEEDRUN, BASE_ID + 92, regionNames.HUB))
+    elif goal == 5:
+        added.append((locationNames.GOAL_ALL_TASKS, BASE_ID + 91, regionNames.HUB))
+    elif goal == 6:
+        added.append((locationNames.GOAL_ALL_FINAL_TASKS, BASE_ID + 94, regionNames.HUB))
+    return added
+
+
+@pytest.mark.parametrize("seed", range(32))
+def test_plan_matches_old_location_set(seed: int) -> None:
+    world = build_world(random_options(random.Random(seed)), through="create_regions")
+    expected = old_locations(world.options)
+    plan = world.location_plan
+    # The plan groups locations by region, keeping the old order inside each region
+    grouped = sorted(expected, key=lambda location: REGION_INDEX[location[2]])
+    assert [(name, loc_id, region) for name, loc_id, region, _ in plan] == grouped
+    for region in world.multiworld.get_regions(world.player):
+        in_region = [(name, loc_id) for name, loc_id, region_name in expected if region_name == region.name]
+        names, ids = plan.bucket(region.name)
+        assert list(zip(names, ids)) == in_region
+        # create_regions puts exactly the planned locations in each region, in the same order
+        assert [(location.name, location.address) for location in region.locations] == in_region
+
+
+def unstarted_world(values: Dict[str, int], seed: int) -> GooseGameWorld:
+    multiworld = MultiWorld(1)
+    multiworld.random.seed(seed)
+    world = GooseGameWorld(multiworld, 1)
+    world.options = make_options(values)
+    multiworld.worlds[1] = world
+    return world
+
+
+@pytest.mark.parametrize("option", range(5))
+def test_starting_area_matches_old_roll(option: int) -> None:
+    picked = set()
+    for seed in range(16):
+        world = unstarted_world({"starting_area": option}, seed)
+        # The old code rolled once with the world's random, the first time it needed the area
+        roll = random.Random()
+        roll.setstate(world.random.getstate())
+        expected = roll.choice(AREA_NAMES) if option == 4 else AREA_NAMES[option]
+        for step in ("generate_early", "create_regions", "create_items", "set_rules"):
+            getattr(world, step)()
+        assert world.location_plan.starting_area == expected
+        # slot_data names the same area as the one given to the player
+        assert world.fill_slot_data()["starting_area"] == expected
+        assert [item.name for item in world.multiworld.precollected_items[world.player]].count(expected) == 1
+        picked.add(expected)
+    assert len(picked) == (4 if option == 4 else 1)
@@ -0,0 +1,228 @@
+"""APProxy's LocationChecks batching, and the DataPackage cache."""
+import asyncio
+import json
+import os
+import threading
+from typing import List, Optional
+
+import pytest
+
+pytest.importorskip("websockets")
+from APProxy import (  # noqa: E402
+    Bridge, CheckBatch, DataPackageCache, PackageRequest, compact, location_checks, slot_data_frame
+)
+
+
+def checks(*ids: int) -> str:
+    return compact([{"cmd": "LocationChecks", "locations": list(ids)}])
+
+
+class FakeSocket:
+    """Records what the bridge sends the server, and plays back what the server sends."""
+
+    def __init__(self, received: List[str] = ()) -> None:
+        self.sent: List[str] = []
+        self.received = list(received)
+
+    async def send(self, text: str) -> None:
+        self.sent.append(text)
+
+    async def __aiter__(self):
+        for message in self.received:
+            yield message
+
+
+def test_location_checks() -> None:
+    assert location_checks(checks(1, 2)) == [1, 2]
+    assert location_checks(compact([{"cmd": "LocationChecks", "locations": [1]},
+                                     {"cmd": "LocationChecks", "locations": [2]}])) == [1, 2]
+    # Anything else in the line, or anything that isn't a list of commands, keeps it out of a batch
+    assert location_checks(compact([{"cmd": "LocationChecks", "locations": [1]}, {"cmd": "Say"}])) is None
+    assert location_checks(compact([{"cmd": "Say", "text": "LocationChecks"}])) is None
+    assert location_checks('{"cmd": "LocationChecks"}') is None
+    assert location_checks('[{"cmd": "LocationChecks"') is None
+    assert location_checks("[]") is None
+
+
+def test_batch_packet() -> None:
+    batch = CheckBatch()
+    batch.add(checks(3, 1), [3, 1])
+    # A batch of one goes out exactly as the game wrote it
+    assert batch.packet() == checks(3, 1)
+    batch.add(checks(1, 2), [1, 2])
+    batch.add(checks(3), [3])
+    assert json.loads(batch.packet()) == [{"cmd": "LocationChecks", "locations": [3, 1, 2]}]
+
+
+def run_send_server(bridge: Bridge, lines: List[str]) -> None:
+    async def run() -> None:
+        for line in lines:
+            bridge.to_server.put_nowait(line)
+        sender = asyncio.create_task(bridge.send_server())
+        while not bridge.to_server.empty() or bridge.batch is not None or bridge.after_batch is not None:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
+    asyncio.run(run())
+
+
+def test_checks_batched_until_another_line() -> None:
+    socket = FakeSocket()
+    bridge = Bridge(None, None, socket, batch_window_ms=200)
+    say = compact([{"cmd": "Say", "text": "hi"}])
+    run_send_server(bridge, [checks(1), checks(2), checks(2, 3), say, checks(4)])
+    assert json.loads(socket.sent[0]) == [{"cmd": "LocationChecks", "locations": [1, 2, 3]}]
+    assert socket.sent[1:] == [say, checks(4)]
+    assert (bridge.check_lines, bridge.check_frames) == (4, 2)
+
+
+def test_no_batching_without_a_window() -> None:
+    socket = FakeSocket()
+    bridge = Bridge(None, None, socket, batch_window_ms=0)
+    run_send_server(bridge, [checks(1), checks(2)])
+    assert socket.sent == [checks(1), checks(2)]
+
+
+GOOSE = {"checksum": "abc", "item_name_to_id": {"Garden Access": 1}}
+OTHER = {"checksum": "def", "item_name_to_id": {"Sword": 2}}
+
+
+def test_cache_reads_back_what_it_saved(tmp_path) -> None:
+    cache = DataPackageCache(str(tmp_path))
+    text, checksum = cache.remember("Untitled Goose Game", GOOSE)
+    assert (text, checksum) == (compact(GOOSE), "abc")
+    cache.save([("Untitled Goose Game", "abc")])
+    # A fresh cache (a restarted proxy) reads it from disk
+    assert DataPackageCache(str(tmp_path)).get("Untitled Goose Game", "abc") == compact(GOOSE)
+    assert DataPackageCache(str(tmp_path)).get("Untitled Goose Game", "other") is None
+    # Packages without a checksum are passed on, but never kept
+    assert cache.remember("No Checksum", {"item_name_to_id": {}})[1] is None
+
+
+def test_cache_ignores_bad_files(tmp_path) -> None:
+    cache = DataPackageCache(str(tmp_path))
+    path = cache.path("Untitled Goose Game", "abc")
+    os.makedirs(os.path.dirname(path))
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{"checksum": "abc", "item_name_to_id"')
+    assert cache.get("Untitled Goose Game", "abc") is None
+    # A file that parses but is stored under the wrong checksum doesn't count either
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(OTHER, file)
+    assert cache.get("Untitled Goose Game", "abc") is None
+
+
+def test_package_request_reply_keeps_the_asked_order() -> None:
+    request = PackageRequest(["Other", "Untitled Goose Game"], {"Untitled Goose Game": compact(GOOSE)})
+    reply = json.loads(request.reply({"Other": compact(OTHER)}))
+    assert reply == [{"cmd": "DataPackage", "data": {"games": {"Other": OTHER, "Untitled Goose Game": GOOSE}}}]
+    assert list(reply[0]["data"]["games"]) == ["Other", "Untitled Goose Game"]
+
+
+def cached_bridge(tmp_path, batch_window_ms: float = 0) -> Bridge:
+    packages = DataPackageCache(str(tmp_path))
+    packages.remember("Untitled Goose Game", GOOSE)
+    bridge = Bridge(None, None, FakeSocket(), batch_window_ms=batch_window_ms, packages=packages)
+    bridge.read_room_info(compact([{
+        "cmd": "RoomInfo", "games": ["Untitled Goose Game", "Other"],
+        "datapackage_checksums": {"Untitled Goose Game": "abc", "Other": "def"},
+    }]))
+    return bridge
+
+
+def test_cached_games_are_left_out_of_the_server_request(tmp_path) -> None:
+    bridge = cached_bridge(tmp_path)
+    asked = compact([{"cmd": "GetDataPackage", "games": ["Untitled Goose Game", "Other"]}])
+    assert asyncio.run(bridge.request_packages(asked)) == compact([{"cmd": "GetDataPackage", "games": ["Other"]}])
+    # The server's answer for the rest is merged with what the cache had
+    line, remembered = bridge.answer_packages(compact([{"cmd": "DataPackage", "data": {"games": {"Other": OTHER}}}]))
+    assert json.loads(line)[0]["data"]["games"] == {"Untitled Goose Game": GOOSE, "Other": OTHER}
+    assert remembered == [("Other", "def")]
+    assert not bridge.package_requests
+
+
+def test_fully_cached_request_never_reaches_the_server(tmp_path) -> None:
+    bridge = cached_bridge(tmp_path)
+    asked = compact([{"cmd": "GetDataPackage", "games": ["Untitled Goose Game"]}])
+    assert asyncio.run(bridge.request_packages(asked)) is None
+    assert json.loads(bridge.to_game.get_nowait())[0]["data"]["games"] == {"Untitled Goose Game": GOOSE}
+    assert not bridge.package_requests
+
+
+def test_data_package_found_among_other_commands(tmp_path) -> None:
+    bridge = cached_bridge(tmp_path)
+    asked = compact([{"cmd": "GetDataPackage", "games": ["Untitled Goose Game", "Other"]}])
+    asyncio.run(bridge.request_packages(asked))
+    say = {"cmd": "PrintJSON", "data": [{"text": "hi"}]}
+    fetched = {"cmd": "DataPackage", "data": {"games": {"Other": OTHER}}}
+    line, remembered = bridge.answer_packages(compact([say, fetched]))
+    # The other commands stay where they were
+    answered = {"cmd": "DataPackage", "data": {"games": {"Untitled Goose Game": GOOSE, "Other": OTHER}}}
+    assert json.loads(line) == [say, answered]
+    assert remembered == [("Other", "def")]
+    assert not bridge.package_requests
+
+
+def test_unreadable_data_package_still_answers_its_request(tmp_path) -> None:
+    bridge = cached_bridge(tmp_path)
+    asked = compact([{"cmd": "GetDataPackage", "games": ["Untitled Goose Game", "Other"]}])
+    asyncio.run(bridge.request_packages(asked))
+    asyncio.run(bridge.request_packages(asked))
+    # Not a DataPackage, so both requests keep waiting
+    assert bridge.answer_packages(compact([{"cmd": "PrintJSON", "text": '"DataPackage"'}])) is None
+    assert len(bridge.package_requests) == 2
+    # Goes to the game as it is, but the request it answered is done with
+    assert bridge.answer_packages(compact([{"cmd": "DataPackage", "data": {}}])) is None
+    assert len(bridge.package_requests) == 1
+    line, _ = bridge.answer_packages(compact([{"cmd": "DataPackage", "data": {"games": {"Other": OTHER}}}]))
+    assert json.loads(line)[0]["data"]["games"] == {"Untitled Goose Game": GOOSE, "Other": OTHER}
+    assert not bridge.package_requests
+
+
+def test_cache_is_read_off_the_event_loop(tmp_path) -> None:
+    bridge = cached_bridge(tmp_path)
+    threads = []
+    get = bridge.packages.get
+
+    def recording_get(game: str, checksum: str) -> Optional[str]:
+        threads.append(threading.current_thread())
+        return get(game, checksum)
+
+    bridge.packages.get = recording_get
+    asked = compact([{"cmd": "GetDataPackage", "games": ["Untitled Goose Game", "Other"]}])
+    asyncio.run(bridge.request_packages(asked))
+    assert len(threads) == 2 and threading.main_thread() not in threads
+
+
+def test_line_ending_a_batch_goes_through_the_package_cache(tmp_path) -> None:
+    bridge = cached_bridge(tmp_path, batch_window_ms=1000)
+    asked = compact([{"cmd": "GetDataPackage", "games": ["Untitled Goose Game"]}])
+    run_send_server(bridge, [checks(1), checks(2), asked])
+    # The batch goes out, and the request that ended it is answered from the cache instead of the server
+    assert [json.loads(text) for text in bridge.socket.sent] == [[{"cmd": "LocationChecks", "locations": [1, 2]}]]
+    assert json.loads(bridge.to_game.get_nowait())[0]["data"]["games"] == {"Untitled Goose Game": GOOSE}
+
+
+BLOCK = {"version": 1, "options": 5, "locations": [10, 12]}
+
+
+def test_slot_data_frame() -> None:
+    connected = compact([{"cmd": "Connected", "slot": 1, "slot_data": {"goal": 0, "compact_slot_data": BLOCK}}])
+    # Fixed key order, cmd first, so the client can read it in one pass
+    assert slot_data_frame(connected) == '[{"cmd":"GooseSlotData","version":1,"options":5,"locations":[10,12]}]'
+    assert slot_data_frame(compact([{"cmd": "Connected", "slot_data": {"goal": 0}}])) is None
+    assert slot_data_frame(compact([{"cmd": "RoomInfo"}])) is None
+    assert slot_data_frame("not json") is None
+
+
+def test_slot_data_line_goes_just_before_connected() -> None:
+    room = compact([{"cmd": "RoomInfo", "games": []}])
+    connected = compact([{"cmd": "Connected", "slot_data": {"compact_slot_data": BLOCK}}])
+    bridge = Bridge(None, None, FakeSocket([room, connected, connected]), batch_window_ms=0)
+    asyncio.run(bridge.read_server())
+    lines = []
+    while not bridge.to_game.empty():
+        lines.append(bridge.to_game.get_nowait().decode("utf-8").strip())
+    # Only the first Connected of a connection gets the extra line
+    assert lines == [room, slot_data_frame(connected), connected, connected]
@@ -0,0 +1,72 @@
+"""IdRegistry lookups both ways, and ids that don't belong to any category."""
+import pytest
+
+from untitled_goose_game.Items import BASE_ID, item_table
+from untitled_goose_game.Locations import location_table
+from untitled_goose_game.Registry import (
+    IdRegistry, ITEM_CATEGORIES, LOCATION_CATEGORIES, item_registry, location_registry
+)
+from untitled_goose_game.names import itemNames, locationNames, regionNames
+
+CATEGORIES = (("Low", 1, 9), ("High", 20, 29))
+
+
+def small_registry(*entries) -> IdRegistry:
+    return IdRegistry(((name, BASE_ID + offset, region) for name, offset, region in entries), CATEGORIES)
+
+
+def test_lookups_both_ways() -> None:
+    registry = small_registry(("c", 21, "North"), ("a", 1, "South"), ("b", 5, None))
+    assert len(registry) == 3
+    assert registry.id("c") == BASE_ID + 21
+    assert registry.name(BASE_ID + 5) == "b"
+    assert registry.category(BASE_ID + 1) == "Low"
+    assert registry.category(BASE_ID + 21) == "High"
+    assert registry.region(BASE_ID + 1) == "South"
+    assert registry.region(BASE_ID + 5) is None
+    assert registry.names_for([BASE_ID + 21, BASE_ID + 1, BASE_ID + 21]) == ["c", "a", "c"]
+    assert "a" in registry and BASE_ID + 5 in registry
+    assert "z" not in registry and BASE_ID + 2 not in registry
+
+
+def test_query_filters_in_id_order() -> None:
+    registry = small_registry(("c", 21, "North"), ("a", 1, "South"), ("b", 5, "North"))
+    assert list(registry.query()) == ["a", "b", "c"]
+    assert registry.query(categories={"Low"}) == {"a": BASE_ID + 1, "b": BASE_ID + 5}
+    assert registry.query(regions={"North"}) == {"b": BASE_ID + 5, "c": BASE_ID + 21}
+    assert registry.query(categories={"High"}, regions={"South"}) == {}
+
+
+def test_unknown_keys_raise_key_error() -> None:
+    registry = small_registry(("a", 1, None))
+    with pytest.raises(KeyError):
+        registry.name(BASE_ID + 2)
+    with pytest.raises(KeyError):
+        registry.id("b")
+
+
+@pytest.mark.parametrize("offset", [0, 10, 19, 30])
+def test_out_of_range_id_raises(offset: int) -> None:
+    registry = small_registry(("a", 1, None), ("stray", offset, None))
+    # name_to_id is there from the start; the range check runs when the lookups are first built
+    assert registry.id("stray") == BASE_ID + offset
+    with pytest.raises(ValueError, match=f"id {BASE_ID + offset} isn't in any category range"):
+        registry.name(BASE_ID + 1)
+
+
+def test_duplicates_raise() -> None:
+    with pytest.raises(ValueError):
+        small_registry(("a", 1, None), ("a", 2, None))
+    with pytest.raises(ValueError):
+        small_registry(("a", 1, None), ("b", 1, None)).name(BASE_ID + 1)
+
+
+def test_module_registries_match_the_tables() -> None:
+    assert all(location_registry.id(name) == data.id for name, data in location_table.items())
+    assert all(item_registry.id(name) == data.id for name, data in item_table.items())
+    task = location_registry.id(locationNames.TASK_GARDEN_ENTRY)
+    assert location_registry.name(task) == locationNames.TASK_GARDEN_ENTRY
+    assert location_registry.category(task) == LOCATION_CATEGORIES[0][0]
+    assert location_registry.region(task) == location_table[locationNames.TASK_GARDEN_ENTRY].region
+    assert item_registry.category(item_registry.id(itemNames.GARDEN_ACCESS)) == ITEM_CATEGORIES[0][0]
+    assert set(location_registry.query(regions={regionNames.GARDEN})) >= {locationNames.TASK_GARDEN_ENTRY}
@@ -0,0 +1,106 @@
+"""Requirement internals the rules rely on: dependency masks, and Memo's cache keyed on them."""
+import random
+
+import pytest
+
+from BaseClasses import Location
+from helpers import build_world, random_options
+from untitled_goose_game.Items import item_bit_table
+from untitled_goose_game.Requirements import Has, MEMO_SIZE, Memo, Requirement, all_of
+from untitled_goose_game.names import itemNames
+
+PLAYER = 1
+ALL_ITEMS = sum(item_bit_table.values())
+GARDEN = item_bit_table[itemNames.GARDEN_ACCESS]
+GROUNDSKEEPER = item_bit_table[itemNames.NPC_GROUNDSKEEPER]
+PUB = item_bit_table[itemNames.PUB_ACCESS]
+
+
+def random_masks(rng: random.Random, count: int):
+    """Item masks at a random density, and near-complete ones where the long rules are decided."""
+    for index in range(count):
+        if index % 2:
+            yield ALL_ITEMS & ~sum(rng.sample(list(item_bit_table.values()), rng.randrange(6)))
+        else:
+            density = rng.random()
+            yield sum(bit for bit in item_bit_table.values() if rng.random() < density)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_dependencies_cover_everything_a_rule_reads(seed: int) -> None:
+    rng = random.Random(seed)
+    world = build_world(random_options(rng))
+    rules = {location.access_rule for location in world.multiworld.get_locations(world.player)}
+    # Locations without a rule of their own keep Location's default
+    assert all(isinstance(rule, Requirement) or rule is Location.access_rule for rule in rules)
+    for rule in rules:
+        if not isinstance(rule, Requirement):
+            continue
+        dependencies = rule.dependencies()
+        assert dependencies & ~ALL_ITEMS == 0
+        for mask in random_masks(rng, 40):
+            # Items outside the mask can never change the result
+            noise = rng.getrandbits(len(item_bit_table)) & ~dependencies
+            assert rule.test(mask) == rule.test(mask ^ noise), rule
+
+
+class Counting(Requirement):
+    """Wraps a requirement and counts how often it is actually evaluated."""
+    __slots__ = ("requirement", "calls", "player")
+
+    def __init__(self, requirement: Requirement) -> None:
+        self.requirement = requirement
+        self.calls = 0
+        self.player = requirement.player
+
+    def test(self, mask: int) -> bool:
+        self.calls += 1
+        return self.requirement.test(mask)
+
+    def dependencies(self) -> int:
+        return self.requirement.dependencies()
+
+    def required(self) -> int:
+        return self.requirement.required()
+
+
+def counted_memo():
+    inner = Counting(all_of(Has(itemNames.GARDEN_ACCESS, PLAYER), Has(itemNames.NPC_GROUNDSKEEPER, PLAYER)))
+    return Memo(inner), inner
+
+
+def test_memo_keys_on_dependencies_only() -> None:
+    memo, inner = counted_memo()
+    assert memo.deps == GARDEN | GROUNDSKEEPER
+    assert memo.test(GARDEN | GROUNDSKEEPER)
+    # Collecting something the rule doesn't read hits the same entry
+    assert memo.test(GARDEN | GROUNDSKEEPER | PUB)
+    assert inner.calls == 1
+    assert list(memo.results) == [GARDEN | GROUNDSKEEPER]
+
+
+def test_memo_reevaluates_when_a_dependency_changes() -> None:
+    memo, inner = counted_memo()
+    assert memo.test(GARDEN | GROUNDSKEEPER)
+    # Removing an item it reads is a different key, so the old answer can't be reused
+    assert not memo.test(GARDEN)
+    assert not memo.test(GARDEN | PUB)
+    assert memo.test(GARDEN | GROUNDSKEEPER | PUB)
+    assert inner.calls == 2
+    assert memo.results == {GARDEN | GROUNDSKEEPER: True, GARDEN: False}
+
+
+def test_memo_clears_once_full() -> None:
+    names = sorted(item_bit_table)[:9]
+    bits = [item_bit_table[name] for name in names]
+    inner = Counting(all_of(*(Has(name, PLAYER) for name in names)))
+    memo = Memo(inner)
+    masks = [sum(bit for index, bit in enumerate(bits) if key >> index & 1) for key in range(MEMO_SIZE + 1)]
+    for mask in masks[:MEMO_SIZE]:
+        memo.test(mask)
+    assert len(memo.results) == MEMO_SIZE
+    memo.test(masks[MEMO_SIZE])
+    assert list(memo.results) == [masks[MEMO_SIZE]]
+    # The cleared entries are worked out again, and give the same answers
+    assert memo.test(masks[0]) == inner.requirement.test(masks[0])
+    assert inner.calls == MEMO_SIZE + 2
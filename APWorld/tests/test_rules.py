@@ -0,0 +1,211 @@
+"""The Requirement rules against the plain predicates they replaced (baseline_rules.py).
+
+A location is reachable when its region is and its rule passes, so each check compares the location's
+can_reach with the old rule on top of the same region: the rules may differ only where the region's
+entrance already decides."""
+import random
+from itertools import product
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Optional, Set
+
+import pytest
+
+import baseline_rules
+from helpers import PROGRESSION, build_world, collected, random_item_sets, random_options
+from untitled_goose_game import Rules
+from untitled_goose_game.Items import ITEM_GROUPS
+from untitled_goose_game.names import itemNames, locationNames
+
+
+class RecordedLocation:
+    access_rule = staticmethod(lambda state: True)
+
+
+class RuleRecorder:
+    """Stands in for the multiworld the old set_rules writes to, and keeps every rule it sets."""
+
+    def __init__(self) -> None:
+        self.locations: Dict[str, RecordedLocation] = {}
+        self.completion_condition = {}
+
+    def get_location(self, name: str, player: int) -> RecordedLocation:
+        return self.locations.setdefault(name, RecordedLocation())
+
+
+def old_rules(world) -> RuleRecorder:
+    recorder = RuleRecorder()
+    old_world = SimpleNamespace(player=world.player, options=world.options, multiworld=recorder)
+    baseline_rules.UntitledGooseRules(old_world).set_rules()
+    return recorder
+
+
+def checked_locations(world, old: RuleRecorder, names: Optional[List[str]] = None) -> List:
+    locations = {location.name: location for location in world.multiworld.get_locations(world.player)}
+    assert set(old.locations) <= set(locations)
+    return [locations[name] for name in names] if names else list(locations.values())
+
+
+def compare_state(world, old: RuleRecorder, checked: List, state, items: Iterable[str]) -> None:
+    for location in checked:
+        old_rule = old.locations.get(location.name, RecordedLocation).access_rule
+        expected = location.parent_region.can_reach(state) and old_rule(state)
+        assert location.can_reach(state) == expected, (location.name, sorted(items))
+    new_goal = world.multiworld.completion_condition[world.player]
+    assert new_goal(state) == old.completion_condition[world.player](state), sorted(items)
+
+
+def check_against_baseline(world, item_sets: Iterable[Iterable[str]], names: Optional[List[str]] = None) -> None:
+    old = old_rules(world)
+    checked = checked_locations(world, old, names)
+    for items in item_sets:
+        compare_state(world, old, checked, collected(world, items), items)
+
+
+@pytest.mark.parametrize("seed", range(16))
+def test_every_rule_matches_baseline(seed: int) -> None:
+    rng = random.Random(seed)
+    world = build_world(random_options(rng))
+    check_against_baseline(world, random_item_sets(rng, 24))
+
+
+SOUL_OPTIONS = [
+    {"include_npc_souls": 1, "include_prop_souls": 1},
+    {"include_npc_souls": 1, "include_prop_souls": 1, "logically_require_npc_souls": 1},
+    {"include_npc_souls": 0, "include_prop_souls": 1},
+    {"include_npc_souls": 1, "include_prop_souls": 0},
+    {"include_npc_souls": 0, "include_prop_souls": 0},
+]
+SOUL_IDS = ["souls", "logic_npcs", "no_npcs", "no_props", "no_souls"]
+
+
+@pytest.mark.parametrize("souls", SOUL_OPTIONS, ids=SOUL_IDS)
+@pytest.mark.parametrize("names", [
+    [locationNames.TASK_BACK_GARDENS_BUST],
+    [locationNames.TASK_MODEL_VILLAGE_BELL, locationNames.TASK_MODEL_VILLAGE_VICTORY],
+], ids=["dress_up_bust", "steal_bell"])
+def test_long_rules_match_baseline(souls: Dict[str, int], names: List[str]) -> None:
+    world = build_world({"include_item_pickups": 1, **souls})
+    check_against_baseline(world, random_item_sets(random.Random(0), 400), names)
+
+
+PICNIC_PROPS = (
+    itemNames.PROP_SANDWICH, itemNames.PROP_APPLES, itemNames.PROP_PUMPKINS, itemNames.PROP_CARROTS,
+    itemNames.PROP_JAM, itemNames.PROP_THERMOS, itemNames.PROP_RADIO, itemNames.PROP_PICNIC_BASKET,
+)
+
+GARDEN_ITEMS = (
+    itemNames.GARDEN_ACCESS, itemNames.NPC_GROUNDSKEEPER, itemNames.PROP_TULIP, itemNames.PROP_RAKE,
+    itemNames.PROP_MALLET, itemNames.PROP_STRAW_HAT,
+)
+
+# Locations with the items their rules read. The picnic props count as one item (all or none) in the Garden
+# rules that use the picnic, to keep those exhaustive over everything else.
+TRUTH_TABLES = {
+    locationNames.TASK_GARDEN_PICNIC: (itemNames.GARDEN_ACCESS,) + PICNIC_PROPS,
+    locationNames.TASK_GARDEN_FINAL: GARDEN_ITEMS + (PICNIC_PROPS,),
+    locationNames.TASK_GARDEN_HAT: GARDEN_ITEMS + (PICNIC_PROPS,),
+    locationNames.TASK_HIGH_STREET_GLASSES: (
+        itemNames.HIGH_STREET_ACCESS, itemNames.NPC_BOY, itemNames.PROP_HORN_RIMMED_GLASSES,
+        itemNames.PROP_RED_GLASSES, itemNames.PROP_SUNGLASSES,
+    ),
+    locationNames.TASK_HIGH_STREET_BUY: (
+        itemNames.HIGH_STREET_ACCESS, itemNames.GARDEN_ACCESS, itemNames.NPC_MARKET_LADY, itemNames.NPC_BOY,
+        itemNames.NPC_GROUNDSKEEPER, itemNames.PROP_TOY_PLANE, itemNames.PROP_TROWEL,
+    ),
+    locationNames.TASK_HIGH_STREET_SHOPPING: (
+        itemNames.HIGH_STREET_ACCESS, itemNames.GARDEN_ACCESS, itemNames.PROP_SHOPPING_BASKET,
+        itemNames.PROP_TOOTHRBRUSH, itemNames.PROP_HAIRBRUSH, itemNames.PROP_LOO_PAPER, itemNames.PROP_TINNED_FOOD,
+        itemNames.PROP_DISH_SOAP_BOTTLE, itemNames.PROP_SPRAY_BOTTLE, itemNames.PROP_ORANGES,
+        itemNames.PROP_CUCUMBERS, itemNames.PROP_LEEKS, itemNames.PROP_CARROTS, itemNames.PROP_TOMATOES,
+        itemNames.PROP_APPLES,
+    ),
+}
+
+
+def every_subset(items: Iterable) -> Iterable[Set[str]]:
+    """Every subset of the items; a tuple among them stands for items that are held together."""
+    items = list(items)
+    for held in product((False, True), repeat=len(items)):
+        names: Set[str] = set()
+        for item, is_held in zip(items, held):
+            if is_held:
+                names.update(item if isinstance(item, tuple) else (item,))
+        yield names
+
+
+@pytest.mark.parametrize("souls", [SOUL_OPTIONS[0], SOUL_OPTIONS[-1]], ids=["souls", "no_souls"])
+@pytest.mark.parametrize("name", sorted(TRUTH_TABLES))
+def test_truth_table_matches_baseline(souls: Dict[str, int], name: str) -> None:
+    world = build_world(souls)
+    check_against_baseline(world, every_subset(TRUTH_TABLES[name]), [name])
+
+
+def scales_item_sets(rng: random.Random, count: int) -> Iterable[List[str]]:
+    """Random areas and NPC souls, with only a few props: the scales need 3 weight, so a handful of props
+    is where the weight tables decide."""
+    areas = sorted(ITEM_GROUPS["Area Unlocks"])
+    npcs = sorted(ITEM_GROUPS["NPC Souls"])
+    props = [name for name in PROGRESSION if name not in ITEM_GROUPS["Area Unlocks"] and name not in npcs]
+    for _ in range(count):
+        yield ([name for name in areas if rng.random() < 0.7] + [name for name in npcs if rng.random() < 0.8]
+               + rng.sample(props, rng.randrange(5)))
+
+
+@pytest.mark.parametrize("souls", SOUL_OPTIONS, ids=SOUL_IDS)
+def test_scales_match_baseline(souls: Dict[str, int]) -> None:
+    world = build_world({"include_extra_tasks": 1, "include_item_pickups": 1, **souls})
+    check_against_baseline(world, scales_item_sets(random.Random(0), 3000), [locationNames.EXTRA_TASK_SCALES])
+
+
+GOAL_NAMES = [
+    name for name in vars(locationNames) if name.startswith(("GOAL_", "MILESTONE_"))
+]
+
+
+def goal_options() -> Iterable[Dict[str, int]]:
+    """Every goal with the task lists it allows, and the milestones for them."""
+    for goal, extra, speedrun in product(range(7), (0, 1), (0, 1)):
+        if (goal in (3, 5) and not speedrun) or (goal in (4, 5) and not extra):
+            continue
+        yield {"goal": goal, "include_extra_tasks": extra, "include_speedrun_tasks": speedrun,
+               "include_milestone_locations": 1, "include_item_pickups": 1}
+
+
+@pytest.mark.parametrize("values", list(goal_options()), ids=lambda values: "-".join(map(str, values.values())))
+def test_goals_and_milestones_match_baseline(values: Dict[str, int]) -> None:
+    world = build_world(values)
+    names = [getattr(locationNames, name) for name in GOAL_NAMES]
+    present = {location.name for location in world.multiworld.get_locations(world.player)}
+    names = [name for name in names if name in present]
+    assert names
+    rng = random.Random(values["goal"])
+    check_against_baseline(world, random_item_sets(rng, 60), names)
+    # The same state collecting and then losing items one at a time: each step changes the keys the
+    # memoized rules are cached on by one item, so a stale result would show here
+    old = old_rules(world)
+    checked = checked_locations(world, old, names)
+    order = rng.sample(PROGRESSION, len(PROGRESSION))
+    state = collected(world, ())
+    items = [world.create_item(name) for name in order]
+    for index, item in enumerate(items):
+        state.collect(item)
+        compare_state(world, old, checked, state, order[:index + 1])
+    for index, item in enumerate(items):
+        state.remove(item)
+        compare_state(world, old, checked, state, order[index + 1:])
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_hoisted_rules_match_full_rules(seed: int, monkeypatch) -> None:
+    """Dropping what the region's entrances already check never changes where a location can be reached from."""
+    rng = random.Random(seed)
+    values = random_options(rng)
+    hoisted = build_world(values)
+    monkeypatch.setattr(Rules, "region_requirements", lambda region, cache: 0)
+    full = build_world(values)
+    full_rules = {location.name: location.access_rule for location in full.multiworld.get_locations(full.player)}
+    for items in random_item_sets(rng, 24):
+        state = collected(hoisted, items)
+        for location in hoisted.multiworld.get_locations(hoisted.player):
+            if location.parent_region.can_reach(state):
+                assert location.access_rule(state) == full_rules[location.name](state), (location.name, sorted(items))
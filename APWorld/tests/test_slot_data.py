@@ -0,0 +1,74 @@
+"""The compact slot_data block decodes back to the slot's options, starting area and location ids."""
+import random
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+import pytest
+
+from helpers import build_world, random_options
+from untitled_goose_game import SlotData
+from untitled_goose_game.SlotData import (
+    COMPACT_VERSION, OPTION_BITS, STARTING_AREA_BITS, STARTING_AREAS, compact_slot_data, location_ranges,
+    option_bitfield
+)
+
+
+def decode_options(bits: int) -> Tuple[Dict[str, int], str]:
+    """Read the bitfield the way the client does: the starting area in the lowest bits, then OPTION_BITS."""
+    starting_area = STARTING_AREAS[bits & (1 << STARTING_AREA_BITS) - 1]
+    bits >>= STARTING_AREA_BITS
+    options: Dict[str, int] = {}
+    for field, width in OPTION_BITS:
+        options[field] = bits & (1 << width) - 1
+        bits >>= width
+    assert bits == 0
+    return options, starting_area
+
+
+def expand_ranges(ranges: List[int]) -> List[int]:
+    assert len(ranges) % 2 == 0
+    return [loc_id for first, last in zip(ranges[::2], ranges[1::2]) for loc_id in range(first, last + 1)]
+
+
+@pytest.mark.parametrize("seed", range(24))
+def test_compact_block_round_trips(seed: int) -> None:
+    rng = random.Random(seed)
+    values = random_options(rng)
+    values["death_link"] = rng.randrange(2)
+    values["filler_active_silent_steps"] = rng.randrange(2)
+    world = build_world(values, through="create_items", seed=seed)
+    block = compact_slot_data(world)
+    assert block["version"] == COMPACT_VERSION
+    options, starting_area = decode_options(block["options"])
+    assert options == {field: int(getattr(world.options, field).value) for field, _ in OPTION_BITS}
+    assert starting_area == world.location_plan.starting_area == world.fill_slot_data()["starting_area"]
+    assert expand_ranges(block["locations"]) == sorted(world.location_plan.ids)
+
+
+def test_location_ranges() -> None:
+    assert location_ranges([]) == []
+    assert location_ranges([5]) == [5, 5]
+    assert location_ranges([7, 3, 4, 5, 9, 8]) == [3, 5, 7, 9]
+    assert location_ranges([1, 3, 5]) == [1, 1, 3, 3, 5, 5]
+
+
+def test_values_that_dont_fit_are_refused() -> None:
+    options = {field: SimpleNamespace(value=0) for field, _ in OPTION_BITS}
+    options["goal"] = SimpleNamespace(value=8)
+    world = SimpleNamespace(options=SimpleNamespace(**options),
+                            location_plan=SimpleNamespace(starting_area=STARTING_AREAS[0]))
+    with pytest.raises(ValueError, match="goal = 8"):
+        option_bitfield(world)
+
+
+def test_appended_option_moves_nothing(monkeypatch) -> None:
+    """A field appended to OPTION_BITS lands above everything else, so older clients read the rest as before."""
+    options = {field: SimpleNamespace(value=(1 << width) - 1) for field, width in OPTION_BITS}
+    options["new_option"] = SimpleNamespace(value=1)
+    world = SimpleNamespace(options=SimpleNamespace(**options),
+                            location_plan=SimpleNamespace(starting_area=STARTING_AREAS[2]))
+    before = SlotData.option_bitfield(world)
+    monkeypatch.setattr(SlotData, "OPTION_BITS", OPTION_BITS + (("new_option", 1),))
+    after = SlotData.option_bitfield(world)
+    assert after == before | 1 << before.bit_length()
+    assert decode_options(before)[1] == STARTING_AREAS[2]
@@ -0,0 +1,21 @@
+"""GooseGameWorld's own bookkeeping on top of Archipelago's."""
+from helpers import build_world, collected
+from untitled_goose_game.Items import PROGRESSION_MASK, item_bit_table
+from untitled_goose_game.names import itemNames, locationNames
+
+
+def test_mask_follows_collect_and_remove() -> None:
+    # Starts in the Garden, so Garden Access is already collected
+    world = build_world({"starting_area": 0})
+    pub = item_bit_table[itemNames.PUB_ACCESS]
+    state = collected(world, [itemNames.PUB_ACCESS, itemNames.PUB_ACCESS])
+    location = world.multiworld.get_location(locationNames.TASK_PUB_ENTRY, world.player)
+    assert state.prog_items[world.player][PROGRESSION_MASK] == item_bit_table[itemNames.GARDEN_ACCESS] | pub
+    assert location.can_reach(state)
+    # The bit stays while any copy is still collected
+    state.remove(world.create_item(itemNames.PUB_ACCESS))
+    assert state.prog_items[world.player][PROGRESSION_MASK] & pub
+    assert location.can_reach(state)
+    state.remove(world.create_item(itemNames.PUB_ACCESS))
+    assert state.prog_items[world.player][PROGRESSION_MASK] == item_bit_table[itemNames.GARDEN_ACCESS]
+    assert not location.can_reach(state)
@@ -0,0 +1,35 @@
+from typing import TYPE_CHECKING, Dict
+from BaseClasses import Region
+
+from .Requirements import Requirement
+
+if TYPE_CHECKING:
+    from . import GooseGameWorld
+
+
+def region_requirements(region: Region, cache: Dict[Region, int]) -> int:
+    """Mask of items every way into a region needs, so anything in the region can take them as collected."""
+    if region not in cache:
+        cache[region] = 0  # Guards against loops in the region graph
+        mask = None
+        for entrance in region.entrances:
+            entrance_mask = entrance.access_rule.required() if isinstance(entrance.access_rule, Requirement) else 0
+            if entrance.parent_region:
+                entrance_mask |= region_requirements(entrance.parent_region, cache)
+            mask = entrance_mask if mask is None else mask & entrance_mask
+        cache[region] = mask or 0
+    return cache[region]
+
+
+def gating_items(world: "GooseGameWorld") -> int:
+    """Mask of every item that some enabled location, area entrance or the goal reads.
+
+    Anything outside it gates nothing under these options, however it's classified in the item table.
+    Only needs the rules and the location plan, so it can run before any region exists."""
+    from .Rules import area_entrance_rules  # Rules imports this module
+    rules = world.rules
+    mask = rules.steal_bell.dependencies()
+    for rule_key in set(world.location_plan.rule_keys) | set(area_entrance_rules.values()):
+        if rule_key is not None:
+            mask |= getattr(rules, rule_key).dependencies()
+    return mask
\ No newline at end of file
@@ -0,0 +1,95 @@
+import os
+import time
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from . import GooseGameWorld
+    from .Requirements import RuleCounter
+
+
+# Set on the machine that generates (to anything but 0) to get a report for every Goose slot. It's for whoever
+# hosts generation, not a player option, since it costs the host time and writes extra files.
+REPORT_ENV = "GOOSE_GENERATION_REPORT"
+
+
+def report_enabled() -> bool:
+    return os.environ.get(REPORT_ENV, "0") not in ("", "0")
+
+
+class GenerationReport:
+    """Timings and counters for one Goose slot, kept only when GOOSE_GENERATION_REPORT is set.
+
+    Written as JSON next to the spoiler by generate_output, so a slow async generation can be broken
+    down per slot without a profiler."""
+
+    def __init__(self) -> None:
+        self.stages_ms: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.rules: Dict[str, "RuleCounter"] = {}
+
+    def counter(self, name: str) -> "RuleCounter":
+        from .Requirements import RuleCounter
+        if name not in self.rules:
+            self.rules[name] = RuleCounter()
+        return self.rules[name]
+
+    def count_rules(self, world: "GooseGameWorld") -> None:
+        """Swap every Goose rule for a counting stand-in, filed under its rule name or entrance."""
+        from .Requirements import CountedRule, Requirement
+        plan = world.location_plan
+        for name, rule_key in zip(plan.names, plan.rule_keys):
+            location = world.location_index[name]
+            if rule_key is not None and isinstance(location.access_rule, Requirement):
+                location.access_rule = CountedRule(location.access_rule, self.counter(rule_key), world.player)
+        for region in world.multiworld.get_regions(world.player):
+            for entrance in region.entrances:
+                if isinstance(entrance.access_rule, Requirement):
+                    counter = self.counter(f"Entrance: {entrance.name}")
+                    entrance.access_rule = CountedRule(entrance.access_rule, counter, world.player)
+        completion = world.multiworld.completion_condition[world.player]
+        if isinstance(completion, Requirement):
+            world.multiworld.completion_condition[world.player] = CountedRule(completion, self.counter("Completion"), world.player)
+
+    def as_dict(self, world: "GooseGameWorld") -> Dict[str, Any]:
+        from .Requirements import RuleCounter
+        totals = RuleCounter()
+        for counter in self.rules.values():
+            totals.calls += counter.calls
+            totals.passed += counter.passed
+            totals.memo_hits += counter.memo_hits
+            totals.memo_misses += counter.memo_misses
+        busiest: List[str] = sorted(self.rules, key=lambda name: -self.rules[name].calls)
+        return {
+            "game": world.game,
+            "player": world.player,
+            "player_name": world.multiworld.player_name[world.player],
+            "stages_ms": {stage: round(ms, 3) for stage, ms in self.stages_ms.items()},
+            "counts": self.counts,
+            "rule_totals": totals.as_dict(),
+            "rules": {name: self.rules[name].as_dict() for name in busiest},
+        }
+
+    def write(self, world: "GooseGameWorld", output_directory: str) -> None:
+        import json
+        path = os.path.join(output_directory,
+                            f"{world.multiworld.get_out_file_name_base(world.player)}_generation_report.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.as_dict(world), file, indent=2)
+
+
+def timed_stage(step):
+    """Time a world step into the slot's report. With the report off this only costs one environment lookup."""
+    @wraps(step)
+    def run_step(world: "GooseGameWorld", *args, **kwargs):
+        report = world.generation_report
+        if report is None:
+            if not report_enabled():
+                return step(world, *args, **kwargs)
+            report = world.generation_report = GenerationReport()
+        start = time.perf_counter()
+        try:
+            return step(world, *args, **kwargs)
+        finally:
+            report.stages_ms[step.__name__] = (time.perf_counter() - start) * 1000
+    return run_step
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, NamedTuple, Optional, Set
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
 from BaseClasses import Item, ItemClassification
 
 from .names import itemNames
@@ -10,6 +10,17 @@ class GooseGameItemData(NamedTuple):
 
 class GooseGameItem(Item):
     game = "Untitled Goose Game"
+    __slots__ = ()
+    
+    def clone(self) -> "GooseGameItem":
+        """A fresh, unplaced copy, without going back through the item table and __init__."""
+        item = GooseGameItem.__new__(GooseGameItem)
+        item.name = self.name
+        item.classification = self.classification
+        item.code = self.code
+        item.player = self.player
+        item.location = None
+        return item
 
 
 BASE_ID = 119000000
@@ -191,6 +202,40 @@ item_table: Dict[str, GooseGameItemData] = {
 
 }
 
+# Each item gets its own bit, so everything a player has collected fits in a single int.
+# The world keeps that int in prog_items under PROGRESSION_MASK and the rules test against it.
+PROGRESSION_MASK = "Untitled Goose Game Progression Mask"
+
+item_bit_table: Dict[str, int] = {
+    name: 1 << index for index, name in enumerate(item_table)
+}
+
+# Item name for each bit, so a mask can be turned back into names
+item_names_by_bit: List[str] = list(item_table)
+
+
+def item_names_in_mask(mask: int) -> Iterator[str]:
+    while mask:
+        lowest = mask & -mask
+        yield item_names_by_bit[lowest.bit_length() - 1]
+        mask ^= lowest
+
+
+def apportion(weighted_names: List[Tuple[str, int]], count: int) -> List[str]:
+    """Exactly `count` names, split as close to their weights as whole items allow.
+
+    Each name gets the whole part of its share, and what's left over goes to the largest
+    remainders (earlier names first on ties), so the result never depends on a roll."""
+    total = sum(weight for _, weight in weighted_names)
+    shares = [divmod(count * weight, total) for _, weight in weighted_names]
+    leftover = count - sum(whole for whole, _ in shares)
+    by_remainder = sorted(range(len(shares)), key=lambda index: -shares[index][1])
+    extra = set(by_remainder[:leftover])
+    names: List[str] = []
+    for index, (name, _) in enumerate(weighted_names):
+        names += [name] * (shares[index][0] + (index in extra))
+    return names
+
 # Item groups for logical grouping
 ITEM_GROUPS = {
     "Area Unlocks": {
@@ -540,4 +585,163 @@ ITEM_GROUPS = {
         itemNames.PROP_FORKS,
         itemNames.PROP_TIMBER_HANDLE,
     },
-}
\ No newline at end of file
+}
+
+# NPC Soul items (11 total) - required for NPC-related goals
+npc_souls: List[str] = [
+    itemNames.NPC_GROUNDSKEEPER,
+    itemNames.NPC_BOY,
+    itemNames.NPC_TV_SHOP_OWNER,
+    itemNames.NPC_MARKET_LADY,
+    itemNames.NPC_TIDY_NEIGHBOUR,
+    itemNames.NPC_MESSY_NEIGHBOUR,
+    itemNames.NPC_BURLY_MAN,
+    itemNames.NPC_OLD_MAN,
+    itemNames.NPC_PUB_LADY,
+    itemNames.NPC_FANCY_LADIES,
+    itemNames.NPC_COOK,
+]
+
+# Prop Soul items - required for picking up/dragging items
+# NOTE: NPC-tied items (Keys, Gardener Hat, Boy's Glasses, Slipper, Wooly Hat, Pub Cloth, etc)
+prop_souls: List[str] = [
+    # Grouped Props (26)
+    itemNames.PROP_CARROTS,
+    itemNames.PROP_TOMATOES,
+    itemNames.PROP_PUMPKINS,
+    itemNames.PROP_TOPSOIL_BAGS,
+    itemNames.PROP_GREEN_QUOITS,
+    itemNames.PROP_PLATES,
+    itemNames.PROP_ORANGES,
+    itemNames.PROP_LEEKS,
+    itemNames.PROP_CUCUMBERS,
+    itemNames.PROP_UMBRELLAS,
+    itemNames.PROP_TINNED_FOOD,
+    itemNames.PROP_SOCKS,
+    itemNames.PROP_PINT_BOTTLES,
+    itemNames.PROP_KNIVES,
+    itemNames.PROP_GUMBOOTS,
+    itemNames.PROP_FORKS,
+    itemNames.PROP_APPLE_CORES,
+    itemNames.PROP_APPLES,
+    itemNames.PROP_SANDWICH,
+    itemNames.PROP_RED_QUOITS,
+    itemNames.PROP_RIBBONS,
+    itemNames.PROP_WALKIE_TALKIES,
+    itemNames.PROP_BOOTS,
+    itemNames.PROP_MINI_PEOPLE,
+    itemNames.PROP_MINI_BENCHES,
+    itemNames.PROP_WEED_TOOLS,
+
+    # Start Area One-Off Props (5)
+    itemNames.PROP_DRINK_CAN,
+    itemNames.PROP_TENNIS_BALL,
+    itemNames.PROP_DUMMY,
+    itemNames.PROP_FISHING_BOBBER,
+    itemNames.PROP_TACKLE_BOX,
+
+    # Garden One-Off Props (15)
+    itemNames.PROP_RADIO,
+    itemNames.PROP_TROWEL,
+    itemNames.PROP_TULIP,
+    itemNames.PROP_JAM,
+    itemNames.PROP_PICNIC_MUG,
+    itemNames.PROP_THERMOS,
+    itemNames.PROP_STRAW_HAT,
+    itemNames.PROP_RAKE,
+    itemNames.PROP_PICNIC_BASKET,
+    itemNames.PROP_ESKY,
+    itemNames.PROP_SHOVEL,
+    itemNames.PROP_WATERING_CAN,
+    itemNames.PROP_MALLET,
+    itemNames.PROP_WOODEN_CRATE,
+    itemNames.PROP_CABBAGES,
+
+    # High Street One-Off Props (22)
+    itemNames.PROP_HORN_RIMMED_GLASSES,
+    itemNames.PROP_RED_GLASSES,
+    itemNames.PROP_SUNGLASSES,
+    itemNames.PROP_LOO_PAPER,
+    itemNames.PROP_TOY_CAR,
+    itemNames.PROP_FOOTBALL,
+    itemNames.PROP_HAIRBRUSH,
+    itemNames.PROP_TOOTHRBRUSH,
+    itemNames.PROP_STEREOSCOPE,
+    itemNames.PROP_DISH_SOAP_BOTTLE,
+    itemNames.PROP_SPRAY_BOTTLE,
+    itemNames.PROP_LILY_FLOWER,
+    itemNames.PROP_TOY_PLANE,
+    itemNames.PROP_CHALK,
+    itemNames.PROP_DUSTBIN_LID,
+    itemNames.PROP_SHOPPING_BASKET,
+    itemNames.PROP_PUSH_BROOM,
+    itemNames.PROP_DUSTBIN,
+    itemNames.PROP_BABY_DOLL,
+    itemNames.PROP_PRICING_GUN,
+    itemNames.PROP_ADDING_MACHINE,
+    itemNames.PROP_GARAGE_ROPE,
+
+    # Back Gardens One-Off Props (24)
+    itemNames.PROP_CRICKET_BALL,
+    itemNames.PROP_BUST_PIPE,
+    itemNames.PROP_BUST_HAT,
+    itemNames.PROP_BUST_GLASSES,
+    itemNames.PROP_TEA_CUP,
+    itemNames.PROP_NEWSPAPER,
+    itemNames.PROP_BADMINTON_RACKET,
+    itemNames.PROP_POT_STACK,
+    itemNames.PROP_SOAP,
+    itemNames.PROP_PAINTBRUSH,
+    itemNames.PROP_VASE,
+    itemNames.PROP_BRA,
+    itemNames.PROP_ROSE,
+    itemNames.PROP_ROSE_BOX,
+    itemNames.PROP_CRICKET_BAT,
+    itemNames.PROP_TEA_POT,
+    itemNames.PROP_CLIPPERS,
+    itemNames.PROP_DUCK_STATUE,
+    itemNames.PROP_FROG_STATUE,
+    itemNames.PROP_JEREMY_FISH,
+    itemNames.PROP_NO_GOOSE_SIGN_MESSY,
+    itemNames.PROP_DRAWER,
+    itemNames.PROP_ENAMEL_JUG,
+    itemNames.PROP_NO_GOOSE_SIGN_CLEAN,
+
+    # Pub Prop One-Off Props (17)
+    itemNames.PROP_LETTER,
+    itemNames.PROP_PINT_GLASSES,
+    itemNames.PROP_TOY_BOAT,
+    itemNames.PROP_PEPPER_GRINDER,
+    itemNames.PROP_CORK,
+    itemNames.PROP_CANDLESTICK,
+    itemNames.PROP_FLOWER_FOR_VASE,
+    itemNames.PROP_HARMONICA,
+    itemNames.PROP_TRAFFIC_CONE,
+    itemNames.PROP_PARCEL,
+    itemNames.PROP_STEALTH_BOX,
+    itemNames.PROP_NO_GOOSE_SIGN_PUB,
+    itemNames.PROP_PORTABLE_STOOL,
+    itemNames.PROP_DARTBOARD,
+    itemNames.PROP_MOP_BUCKET,
+    itemNames.PROP_MOP,
+    itemNames.PROP_BUCKET,
+
+    # Model Village One-Off Props (10)
+    itemNames.PROP_MINI_GOOSE,
+    itemNames.PROP_MINI_MAIL_PILLAR,
+    itemNames.PROP_MINI_PHONE_DOOR,
+    itemNames.PROP_MINI_SHOVEL,
+    itemNames.PROP_POPPY_FLOWER,
+    itemNames.PROP_TIMBER_HANDLE,
+    itemNames.PROP_MINI_BIRDBATH,
+    itemNames.PROP_MINI_EASEL,
+    itemNames.PROP_MINI_PUMP,
+    itemNames.PROP_MINI_SUN_LOUNGE,
+
+    # Golden Bell Soul is always required even when prop souls are turned off, so it's not in this list
+]
+
+# Fillers and traps are created many times per world, so the world clones them from one prototype each.
+# clone() copies Item's slots by hand, so it's only used while they are exactly the ones it knows about.
+repeated_items: Set[str] = ITEM_GROUPS["Fillers"] | ITEM_GROUPS["Traps"]
+items_can_clone: bool = set(getattr(Item, "__slots__", ())) == {"name", "classification", "code", "player", "location"}
\ No newline at end of file
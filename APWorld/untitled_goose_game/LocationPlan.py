@@ -0,0 +1,216 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .Locations import (
+    location_table, extra_locations, speedrun_locations, milestone_locations, item_pickup_locations,
+    drag_item_locations, interaction_locations, unique_item_pickup_locations, unique_item_drag_locations,
+    sandcastle_peck_locations, sandcastle_first_peck_locations, milestone_locations_main_tasks,
+    new_tasks_locations, GooseGameLocationData
+)
+from .Options import GooseGameOptions
+from .Rules import (
+    extra_task_rules, speedrun_task_rules, pickup_rules, drag_rules, interaction_rules, new_tasks_rules,
+    church_first_peck_rules, church_all_peck_rules, all_milestone_rules, non_speedrun_milestone_rules,
+    non_to_do_as_well_milestone_rules, basic_milestone_rules, simple_goal_rules, all_main_tasks_goal_rules,
+    all_speedrun_tasks_goal_rules, all_non_speedrun_tasks_goal_rules, all_tasks_goal_rules,
+    four_final_tasks_rules, main_tasks_rules, victory_rules
+)
+from .names import locationNames, regionNames
+
+
+# Regions in the order create_regions makes them; a plan stores an index into this per location
+REGION_NAMES: Tuple[str, ...] = (
+    regionNames.MENU, regionNames.HUB, regionNames.GARDEN, regionNames.HIGH_STREET,
+    regionNames.BACK_GARDENS, regionNames.PUB, regionNames.MODEL_VILLAGE,
+)
+REGION_INDEX: Dict[str, int] = {name: index for index, name in enumerate(REGION_NAMES)}
+
+# The extra location each goal adds (find_bell adds none)
+goal_locations: Dict[int, str] = {
+    0: locationNames.GOAL_MODEL_VILLAGE_ENTRY,
+    2: locationNames.GOAL_ALL_MAIN,
+    3: locationNames.GOAL_ALL_SPEEDRUN,
+    4: locationNames.GOAL_ALL_NON_SPEEDRUN,
+    5: locationNames.GOAL_ALL_TASKS,
+    6: locationNames.GOAL_ALL_FINAL_TASKS,
+}
+
+goal_rules: Dict[int, Dict[str, str]] = {
+    0: simple_goal_rules,
+    2: all_main_tasks_goal_rules,
+    3: all_speedrun_tasks_goal_rules,
+    4: all_non_speedrun_tasks_goal_rules,
+    5: all_tasks_goal_rules,
+    6: four_final_tasks_rules,
+}
+
+
+class LocationPlan:
+    """Every location one Goose world will have, worked out once from its options in generate_early.
+
+    Regions, rules, the item pool and slot_data all read from this instead of walking the option
+    chains themselves, so they always agree on the location set. Entry i of each array describes
+    the same location; rule_keys names the UntitledGooseRules property guarding it, if any.
+
+    Entries are grouped by region, in REGION_NAMES order, so each region's locations are one
+    contiguous bucket that create_regions can attach in a single step."""
+
+    __slots__ = ("starting_area", "names", "ids", "region_indices", "rule_keys", "region_starts")
+
+    starting_area: str
+    names: Tuple[str, ...]
+    ids: array
+    region_indices: array
+    rule_keys: Tuple[Optional[str], ...]
+    region_starts: array
+
+    def __init__(self, starting_area: str, names: Tuple[str, ...], ids: array, region_indices: array,
+                 rule_keys: Tuple[Optional[str], ...]) -> None:
+        object.__setattr__(self, "starting_area", starting_area)
+        object.__setattr__(self, "names", names)
+        object.__setattr__(self, "ids", ids)
+        object.__setattr__(self, "region_indices", region_indices)
+        object.__setattr__(self, "rule_keys", rule_keys)
+
+        # Bucket for region i is entries region_starts[i] up to region_starts[i + 1]
+        if any(later < earlier for earlier, later in zip(region_indices, region_indices[1:])):
+            raise ValueError("LocationPlan entries must be grouped by region")
+        region_starts = array("H", bytes(2 * (len(REGION_NAMES) + 1)))
+        for region_index in region_indices:
+            region_starts[region_index + 1] += 1
+        for region_index in range(len(REGION_NAMES)):
+            region_starts[region_index + 1] += region_starts[region_index]
+        object.__setattr__(self, "region_starts", region_starts)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("LocationPlan is read-only")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[Tuple[str, int, str, Optional[str]]]:
+        """(name, id, region name, rule key) for every planned location, in creation order."""
+        for name, loc_id, region_index, rule_key in zip(self.names, self.ids, self.region_indices, self.rule_keys):
+            yield name, loc_id, REGION_NAMES[region_index], rule_key
+
+    def bucket(self, region_name: str) -> Tuple[Tuple[str, ...], array]:
+        """Names and ids of every location in one region."""
+        region_index = REGION_INDEX[region_name]
+        start, end = self.region_starts[region_index], self.region_starts[region_index + 1]
+        return self.names[start:end], self.ids[start:end]
+
+
+def build_location_plan(options: GooseGameOptions, starting_area: str) -> LocationPlan:
+    """Work out the locations and their rule keys for one set of options."""
+    tables: List[Dict[str, GooseGameLocationData]] = []
+
+    # ----- Locations -----
+
+    # Main task locations (always included)
+    tables.append(location_table)
+
+    if options.include_extra_tasks:
+        tables.append(extra_locations)
+
+    if options.include_speedrun_tasks:
+        tables.append(speedrun_locations)
+
+    # Item pickups, then the unique tracked ones (position-based carrots, etc.)
+    if options.include_item_pickups:
+        tables.append(item_pickup_locations)
+        tables.append(unique_item_pickup_locations)
+
+    # Drag items (separate toggle from pickups), then the unique tracked ones
+    if options.include_drag_items:
+        tables.append(drag_item_locations)
+        tables.append(unique_item_drag_locations)
+
+    if options.include_interactions:
+        tables.append(interaction_locations)
+
+    if options.include_new_tasks:
+        tables.append(new_tasks_locations)
+
+    pecking = options.include_model_church_pecks.value
+    if pecking == 1:
+        tables.append(sandcastle_first_peck_locations)
+    elif pecking == 2:
+        tables.append(sandcastle_peck_locations)
+
+    extra_names: List[str] = []
+    if options.include_milestone_locations:
+        tables.append(milestone_locations_main_tasks)
+        if options.include_extra_tasks:
+            extra_names.append(locationNames.MILESTONE_ALL_EXTRA)
+        if options.include_speedrun_tasks:
+            extra_names.append(locationNames.MILESTONE_ALL_SPEEDRUN)
+        if options.include_extra_tasks and options.include_speedrun_tasks:
+            extra_names.append(locationNames.MILESTONE_ALL_TASKS)
+
+    goal = options.goal.value
+    if goal in goal_locations:
+        extra_names.append(goal_locations[goal])
+    tables.append({name: milestone_locations[name] for name in extra_names})
+
+    # ----- Rules -----
+    # Later tables win where they overlap, same as merging them in order
+
+    rule_tables: List[Dict[str, str]] = [victory_rules, main_tasks_rules]
+
+    if options.include_extra_tasks.value:
+        rule_tables.append(extra_task_rules)
+    if options.include_speedrun_tasks.value:
+        rule_tables.append(speedrun_task_rules)
+    if options.include_item_pickups.value:
+        rule_tables.append(pickup_rules)
+    if options.include_drag_items.value:
+        rule_tables.append(drag_rules)
+    if options.include_interactions.value:
+        rule_tables.append(interaction_rules)
+    if options.include_new_tasks.value:
+        rule_tables.append(new_tasks_rules)
+
+    if pecking == 1:
+        rule_tables.append(church_first_peck_rules)
+    elif pecking == 2:
+        rule_tables.append(church_all_peck_rules)
+
+    milestones = options.include_milestone_locations.value
+    extra = options.include_extra_tasks.value
+    speedrun = options.include_speedrun_tasks.value
+    if milestones and extra and speedrun:
+        rule_tables.append(all_milestone_rules)
+    elif milestones and extra:
+        rule_tables.append(non_speedrun_milestone_rules)
+    elif milestones and speedrun:
+        rule_tables.append(non_to_do_as_well_milestone_rules)
+    elif milestones:
+        rule_tables.append(basic_milestone_rules)
+
+    if goal in goal_rules:
+        rule_tables.append(goal_rules[goal])
+
+    rule_keys: Dict[str, str] = {}
+    for table in rule_tables:
+        rule_keys.update(table)
+
+    # Split into region buckets, keeping table order inside each one
+    buckets: List[List[Tuple[str, int]]] = [[] for _ in REGION_NAMES]
+    for table in tables:
+        for name, data in table.items():
+            buckets[REGION_INDEX[data.region]].append((name, data.id))
+
+    names: List[str] = []
+    ids = array("l")
+    region_indices = array("B")
+    for region_index, bucket in enumerate(buckets):
+        for name, loc_id in bucket:
+            names.append(name)
+            ids.append(loc_id)
+            region_indices.append(region_index)
+
+    unplanned = rule_keys.keys() - set(names)
+    if unplanned:
+        raise KeyError(f"Rules for locations that aren't planned: {sorted(unplanned)}")
+
+    return LocationPlan(starting_area, tuple(names), ids, region_indices, tuple(rule_keys.get(name) for name in names))
\ No newline at end of file
@@ -120,7 +120,7 @@ milestone_locations: Dict[str, GooseGameLocationData] = {
     locationNames.GOAL_MODEL_VILLAGE_ENTRY: GooseGameLocationData(BASE_ID + 93, regionNames.MODEL_VILLAGE),
     locationNames.GOAL_ALL_FINAL_TASKS: GooseGameLocationData(BASE_ID + 94, regionNames.HUB),
 }
-# Separation of the above Milestone locations for Regions.py (DO NOT INCLUDE in get_all_location_ids as they already all are)
+# Separation of the above Milestone locations for Regions.py (DO NOT INCLUDE in Registry.py as they already all are)
 milestone_locations_main_tasks: Dict[str, GooseGameLocationData] = {
     locationNames.MILESTONE_ALL_GARDEN: GooseGameLocationData(BASE_ID + 81, regionNames.GARDEN),
     locationNames.MILESTONE_ALL_HIGH_STREET: GooseGameLocationData(BASE_ID + 82, regionNames.HIGH_STREET),
@@ -488,62 +488,4 @@ new_tasks_locations: Dict[str, GooseGameLocationData] = {
     locationNames.INTERIOR_REDECORATING: GooseGameLocationData(BASE_ID + 1510, regionNames.BACK_GARDENS),
     locationNames.TRAP_TV_SHOP_OWNER_GARAGE: GooseGameLocationData(BASE_ID + 1511, regionNames.HIGH_STREET),
     locationNames.PERFORM_WITH_HARMONICA: GooseGameLocationData(BASE_ID + 1512, regionNames.PUB),
-}
-
-
-def get_all_locations(include_extra: bool = False, include_speedrun: bool = False, 
-                      include_items: bool = True, include_drags: bool = True,
-                      include_interactions: bool = True, include_unique: bool = True,
-                      include_sandcastle: bool = True) -> Dict[str, GooseGameLocationData]:
-    """Get locations based on options (for region creation)"""
-    locations = dict(location_table)
-    
-    if include_extra:
-        locations.update(extra_locations)
-        locations.update(completion_location)
-    
-    if include_speedrun:
-        locations.update(speedrun_locations)
-    
-    if include_items:
-        locations.update(item_pickup_locations)
-    
-    if include_drags:
-        locations.update(drag_item_locations)
-    
-    if include_interactions:
-        locations.update(interaction_locations)
-    
-    if include_unique:
-        locations.update(unique_item_pickup_locations)
-    
-    if include_unique:
-        locations.update(unique_item_drag_locations)
-    
-    if include_sandcastle:
-        locations.update(sandcastle_peck_locations)
-    
-    return locations
-
-
-def get_all_location_ids() -> Dict[str, int]:
-    """Get ALL location name->ID mappings (for AP registration)
-    
-    IMPORTANT: AP requires all possible locations registered upfront,
-    regardless of whether they're enabled by options.
-    """
-    all_locs = {}
-    all_locs.update({name: data.id for name, data in location_table.items()})
-    all_locs.update({name: data.id for name, data in extra_locations.items()})
-    all_locs.update({name: data.id for name, data in speedrun_locations.items()})
-    all_locs.update({name: data.id for name, data in completion_location.items()})
-    all_locs.update({name: data.id for name, data in milestone_locations.items()})
-    all_locs.update({name: data.id for name, data in item_pickup_locations.items()})
-    all_locs.update({name: data.id for name, data in drag_item_locations.items()})
-    all_locs.update({name: data.id for name, data in interaction_locations.items()})
-    all_locs.update({name: data.id for name, data in unique_item_pickup_locations.items()})
-    all_locs.update({name: data.id for name, data in unique_item_drag_locations.items()})
-    all_locs.update({name: data.id for name, data in sandcastle_peck_locations.items()})
-    all_locs.update({name: data.id for name, data in sandcastle_first_peck_locations.items()})
-    all_locs.update({name: data.id for name, data in new_tasks_locations.items()})
-    return all_locs
+}
\ No newline at end of file
@@ -205,6 +205,13 @@ class TrapWeightSuspiciousGoose(Range):
     default = 5
 
 
+class FillerExactRatios(Toggle):
+    """When enabled, the filler and trap weights above are followed exactly instead of rolled for each slot.
+    For example, with 100 slots to fill and weights of 80/5/5/5/5, you get exactly 80 Coins and 5 of each trap."""
+    display_name = "Filler Exact Ratios"
+    default = False
+
+
 class DeathLink(Toggle):
     """When you get caught/shooed, everyone dies. When someone else dies, you drop whatever you're holding and get teleported to the hub."""
     display_name = "Death Link"
@@ -235,4 +242,5 @@ class GooseGameOptions(PerGameCommonOptions):
     trap_weight_confused_feet: TrapWeightConfusedFeet
     trap_weight_butterbeak: TrapWeightButterbeak
     trap_weight_suspicious_goose: TrapWeightSuspiciousGoose
+    filler_exact_ratios: FillerExactRatios
     death_link: DeathLink
\ No newline at end of file
@@ -0,0 +1,153 @@
+from array import array
+from bisect import bisect_right
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
+
+from .Items import BASE_ID, item_table
+from .Locations import (
+    location_table, extra_locations, speedrun_locations, completion_location, milestone_locations,
+    item_pickup_locations, drag_item_locations, interaction_locations, unique_item_pickup_locations,
+    unique_item_drag_locations, sandcastle_peck_locations, sandcastle_first_peck_locations, new_tasks_locations
+)
+
+
+# ----- ID Ranges -----
+# (category, first, last) as offsets from BASE_ID. Every id has to land in exactly one of these,
+# so a new table entry outside them fails on the registry's first lookup instead of going uncategorised.
+
+LOCATION_CATEGORIES: Tuple[Tuple[str, int, int], ...] = (
+    ("Task", 1, 49),
+    ("Extra Task", 50, 69),
+    ("Speedrun Task", 70, 79),
+    ("Completion", 80, 80),
+    ("Milestone", 81, 99),
+    ("Item Pickup", 1001, 1199),
+    ("Item Drag", 1201, 1299),
+    ("Interaction", 1300, 1349),
+    ("Church Peck", 1350, 1399),
+    ("Unique Item Pickup", 1401, 1449),
+    ("Unique Item Drag", 1450, 1499),
+    ("New Task", 1500, 1599),
+)
+
+ITEM_CATEGORIES: Tuple[Tuple[str, int, int], ...] = (
+    ("Area Unlock", 100, 119),
+    ("NPC Soul", 120, 199),
+    ("Filler", 200, 299),
+    ("Trap", 300, 399),
+    ("Prop Soul", 400, 699),
+    ("Event", 999, 999),
+)
+
+
+class IdRegistry:
+    """Every id of one kind (items or locations), in flat arrays sorted by id, with O(1) lookups both ways.
+
+    Categories come from the id ranges above; regions are only known for locations. Only name_to_id is
+    made up front, since Archipelago reads it when the world class is defined; everything the lookups
+    need is built the first time one of them is used."""
+
+    __slots__ = ("names", "ids", "entries", "categories", "category_names", "category_indices",
+                 "region_names", "region_indices", "index_by_id", "index_by_name", "name_to_id")
+
+    def __init__(self, entries: Iterable[Tuple[str, int, Optional[str]]],
+                 categories: Tuple[Tuple[str, int, int], ...]) -> None:
+        entries = list(entries)
+        # Plain dict for Archipelago's name_to_id tables and anything else that wants one
+        self.name_to_id: Dict[str, int] = {name: entry_id for name, entry_id, _ in entries}
+        if len(self.name_to_id) != len(entries):
+            raise ValueError("Untitled Goose Game names must be unique")
+        self.entries = entries
+        self.categories = categories
+        self.index_by_id: Optional[Dict[int, int]] = None
+
+    def build_index(self) -> None:
+        """Sort the entries by id and build everything the lookups read."""
+        ordered = sorted(self.entries, key=lambda entry: entry[1])
+        self.names: Tuple[str, ...] = tuple(name for name, _, _ in ordered)
+        self.ids = array("q", (entry_id for _, entry_id, _ in ordered))
+
+        self.category_names: Tuple[str, ...] = tuple(category for category, _, _ in self.categories)
+        starts = [BASE_ID + first for _, first, _ in self.categories]
+        self.category_indices = array("B")
+        for entry_id in self.ids:
+            index = bisect_right(starts, entry_id) - 1
+            if index < 0 or entry_id > BASE_ID + self.categories[index][2]:
+                raise ValueError(f"Untitled Goose Game id {entry_id} isn't in any category range")
+            self.category_indices.append(index)
+
+        regions = [region for _, _, region in ordered]
+        self.region_names: Tuple[Optional[str], ...] = tuple(dict.fromkeys(regions))
+        region_index = {region: index for index, region in enumerate(self.region_names)}
+        self.region_indices = array("B", (region_index[region] for region in regions))
+
+        self.index_by_name: Dict[str, int] = {name: index for index, name in enumerate(self.names)}
+        index_by_id = {entry_id: index for index, entry_id in enumerate(self.ids)}
+        if len(index_by_id) != len(self.ids):
+            raise ValueError("Untitled Goose Game ids must be unique")
+        self.index_by_id = index_by_id
+
+    def indexed(self) -> "IdRegistry":
+        if self.index_by_id is None:
+            self.build_index()
+        return self
+
+    def __len__(self) -> int:
+        return len(self.name_to_id)
+
+    def __contains__(self, key) -> bool:
+        return key in self.name_to_id or key in self.indexed().index_by_id
+
+    def name(self, entry_id: int) -> str:
+        self.indexed()
+        return self.names[self.index_by_id[entry_id]]
+
+    def id(self, name: str) -> int:
+        return self.name_to_id[name]
+
+    def category(self, entry_id: int) -> str:
+        self.indexed()
+        return self.category_names[self.category_indices[self.index_by_id[entry_id]]]
+
+    def region(self, entry_id: int) -> Optional[str]:
+        self.indexed()
+        return self.region_names[self.region_indices[self.index_by_id[entry_id]]]
+
+    def names_for(self, entry_ids: Iterable[int]) -> List[str]:
+        """Bulk id -> name, for trackers and proxies resolving whole batches of checks."""
+        self.indexed()
+        names, index_by_id = self.names, self.index_by_id
+        return [names[index_by_id[entry_id]] for entry_id in entry_ids]
+
+    def query(self, categories: Optional[Collection[str]] = None,
+              regions: Optional[Collection[str]] = None) -> Dict[str, int]:
+        """name -> id for everything in the given categories and regions (None means any), in id order."""
+        self.indexed()
+        category_filter = None if categories is None else {
+            index for index, category in enumerate(self.category_names) if category in categories
+        }
+        region_filter = None if regions is None else {
+            index for index, region in enumerate(self.region_names) if region in regions
+        }
+        return {
+            name: entry_id
+            for name, entry_id, category_index, region_index
+            in zip(self.names, self.ids, self.category_indices, self.region_indices)
+            if (category_filter is None or category_index in category_filter)
+            and (region_filter is None or region_index in region_filter)
+        }
+
+
+# AP requires all possible locations registered upfront, regardless of whether they're enabled by options
+location_registry = IdRegistry(
+    ((name, data.id, data.region)
+     for table in (
+         location_table, extra_locations, speedrun_locations, completion_location, milestone_locations,
+         item_pickup_locations, drag_item_locations, interaction_locations, unique_item_pickup_locations,
+         unique_item_drag_locations, sandcastle_peck_locations, sandcastle_first_peck_locations,
+         new_tasks_locations,
+     )
+     for name, data in table.items()),
+    LOCATION_CATEGORIES,
+)
+
+item_registry = IdRegistry(((name, data.id, None) for name, data in item_table.items()), ITEM_CATEGORIES)
\ No newline at end of file
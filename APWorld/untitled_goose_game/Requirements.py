@@ -0,0 +1,611 @@
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+from weakref import WeakValueDictionary
+from BaseClasses import CollectionState
+
+from .Items import item_bit_table, item_names_in_mask, PROGRESSION_MASK
+
+# Most results a Memo keeps before starting over
+MEMO_SIZE = 256
+
+
+class Requirement:
+    """An access requirement that can be called directly as a location or entrance rule.
+
+    Requirements are built once per world by UntitledGooseRules. Checks that depend on
+    options (souls turned off, etc.) are folded into constants while building, so
+    they never cost anything when a rule is evaluated.
+
+    Every requirement is a test on the player's progression bitmask (see item_bit_table),
+    so calling one reads a single int from the state and the rest is integer math.
+
+    Requirements from the factories below are shared: building the same requirement twice
+    gives back the same object, so every location with that rule shares one Memo too."""
+    __slots__ = ("__weakref__",)
+    player: int
+
+    def __call__(self, state: CollectionState) -> bool:
+        return self.test(state.prog_items[self.player][PROGRESSION_MASK])
+
+    def test(self, mask: int) -> bool:
+        raise NotImplementedError
+
+    def dependencies(self) -> int:
+        """Mask of every item this requirement reads. Items outside it can never change the result."""
+        raise NotImplementedError
+
+    def key(self) -> Hashable:
+        """Identifies requirements that always give the same result, for sharing them."""
+        raise NotImplementedError
+
+    def required(self) -> int:
+        """Mask of items that must all be collected for this requirement to be met."""
+        return 0
+
+    def assuming(self, mask: int) -> "Requirement":
+        """This requirement simplified for when every item in `mask` is known to be collected."""
+        if not self.dependencies() & mask:
+            return self
+        return self._assuming(mask)
+
+    def _assuming(self, mask: int) -> "Requirement":
+        raise NotImplementedError
+
+    def __and__(self, other: "Requirement") -> "Requirement":
+        return all_of(self, other)
+
+    def __or__(self, other: "Requirement") -> "Requirement":
+        return any_of(self, other)
+
+
+class Constant(Requirement):
+    __slots__ = ("value",)
+
+    def __init__(self, value: bool) -> None:
+        self.value = value
+
+    def __call__(self, state: CollectionState) -> bool:
+        return self.value
+
+    def test(self, mask: int) -> bool:
+        return self.value
+
+    def dependencies(self) -> int:
+        return 0
+
+    def key(self) -> Hashable:
+        return ("Constant", self.value)
+
+    def __repr__(self) -> str:
+        return "TRUE" if self.value else "FALSE"
+
+
+TRUE = Constant(True)
+FALSE = Constant(False)
+
+
+class Has(Requirement):
+    __slots__ = ("item", "player", "bit")
+
+    def __init__(self, item: str, player: int) -> None:
+        self.item = item
+        self.player = player
+        self.bit = item_bit_table[item]
+
+    def test(self, mask: int) -> bool:
+        return mask & self.bit != 0
+
+    def dependencies(self) -> int:
+        return self.bit
+
+    def key(self) -> Hashable:
+        return ("Has", self.player, self.item)
+
+    def required(self) -> int:
+        return self.bit
+
+    def _assuming(self, mask: int) -> Requirement:
+        return TRUE
+
+    def __repr__(self) -> str:
+        return f"Has({self.item!r})"
+
+
+def _mask_of(items: Iterable[str]) -> int:
+    mask = 0
+    for item in items:
+        mask |= item_bit_table[item]
+    return mask
+
+
+class AllOf(Requirement):
+    """Every item and every sub-requirement is needed. Plain item checks are merged into one mask."""
+    __slots__ = ("items", "requirements", "player", "mask")
+
+    def __init__(self, items: Tuple[str, ...], requirements: Tuple[Requirement, ...], player: int) -> None:
+        self.items = items
+        self.requirements = requirements
+        self.player = player
+        self.mask = _mask_of(items)
+
+    def test(self, mask: int) -> bool:
+        if mask & self.mask != self.mask:
+            return False
+        for requirement in self.requirements:
+            if not requirement.test(mask):
+                return False
+        return True
+
+    def dependencies(self) -> int:
+        mask = self.mask
+        for requirement in self.requirements:
+            mask |= requirement.dependencies()
+        return mask
+
+    def key(self) -> Hashable:
+        return ("AllOf", self.player, frozenset(self.items), self.requirements)
+
+    def required(self) -> int:
+        mask = self.mask
+        for requirement in self.requirements:
+            mask |= requirement.required()
+        return mask
+
+    def _assuming(self, mask: int) -> Requirement:
+        return all_of(
+            *(has(item, self.player) for item in self.items if not item_bit_table[item] & mask),
+            *(requirement.assuming(mask) for requirement in self.requirements)
+        )
+
+    def __repr__(self) -> str:
+        return f"AllOf({list(self.items)!r}, {list(self.requirements)!r})"
+
+
+class AnyOf(Requirement):
+    """Any one item or sub-requirement is enough. Plain item checks are merged into one mask."""
+    __slots__ = ("items", "requirements", "player", "mask")
+
+    def __init__(self, items: Tuple[str, ...], requirements: Tuple[Requirement, ...], player: int) -> None:
+        self.items = items
+        self.requirements = requirements
+        self.player = player
+        self.mask = _mask_of(items)
+
+    def test(self, mask: int) -> bool:
+        if mask & self.mask:
+            return True
+        for requirement in self.requirements:
+            if requirement.test(mask):
+                return True
+        return False
+
+    def dependencies(self) -> int:
+        mask = self.mask
+        for requirement in self.requirements:
+            mask |= requirement.dependencies()
+        return mask
+
+    def key(self) -> Hashable:
+        return ("AnyOf", self.player, frozenset(self.items), self.requirements)
+
+    def required(self) -> int:
+        # Only what every alternative needs
+        alternatives = [item_bit_table[item] for item in self.items]
+        alternatives.extend(requirement.required() for requirement in self.requirements)
+        mask = alternatives[0]
+        for alternative in alternatives[1:]:
+            mask &= alternative
+        return mask
+
+    def _assuming(self, mask: int) -> Requirement:
+        if self.mask & mask:
+            return TRUE
+        return any_of(
+            *(has(item, self.player) for item in self.items),
+            *(requirement.assuming(mask) for requirement in self.requirements)
+        )
+
+    def __repr__(self) -> str:
+        return f"AnyOf({list(self.items)!r}, {list(self.requirements)!r})"
+
+
+class AtLeast(Requirement):
+    """The weights of the met sub-requirements must add up to at least `count`.
+    Stops as soon as the count is reached, or can no longer be reached."""
+    __slots__ = ("count", "requirements", "weights", "total", "player")
+
+    def __init__(self, count: int, requirements: Tuple[Requirement, ...], weights: Tuple[int, ...], player: int) -> None:
+        self.count = count
+        self.requirements = requirements
+        self.weights = weights
+        self.total = sum(weights)
+        self.player = player
+
+    def test(self, mask: int) -> bool:
+        found = 0
+        remaining = self.total
+        for requirement, weight in zip(self.requirements, self.weights):
+            remaining -= weight
+            if requirement.test(mask):
+                found += weight
+                if found >= self.count:
+                    return True
+            elif found + remaining < self.count:
+                return False
+        return False
+
+    def dependencies(self) -> int:
+        mask = 0
+        for requirement in self.requirements:
+            mask |= requirement.dependencies()
+        return mask
+
+    def key(self) -> Hashable:
+        return ("AtLeast", self.player, self.count, self.requirements, self.weights)
+
+    def required(self) -> int:
+        # An item is required when the requirements that don't need it can't reach the count alone
+        needs = [requirement.required() for requirement in self.requirements]
+        mask = 0
+        candidates = 0
+        for need in needs:
+            candidates |= need
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            if sum(weight for need, weight in zip(needs, self.weights) if not need & bit) < self.count:
+                mask |= bit
+        return mask
+
+    def _assuming(self, mask: int) -> Requirement:
+        return at_least(
+            self.count,
+            *((requirement.assuming(mask), weight) for requirement, weight in zip(self.requirements, self.weights))
+        )
+
+    def __repr__(self) -> str:
+        return f"AtLeast({self.count}, {list(zip(self.requirements, self.weights))!r})"
+
+
+class WeightedThreshold(Requirement):
+    """Like AtLeast, but for item tables split into gated groups (usually one per area).
+
+    Each group is (gate, free, buckets): once the gate is met the group adds `free`, plus
+    `weight` for every collected item in each (weight, item mask) bucket. Stops as soon as
+    the count is reached, or the groups left can no longer reach it."""
+    __slots__ = ("count", "groups", "player")
+
+    def __init__(self, count: int, groups: Tuple[Tuple[Requirement, int, Tuple[Tuple[int, int], ...], int], ...],
+                 player: int) -> None:
+        self.count = count
+        self.groups = groups
+        self.player = player
+
+    def test(self, mask: int) -> bool:
+        found = 0
+        for gate, free, buckets, best_after in self.groups:
+            if gate.test(mask):
+                found += free
+                for weight, bits in buckets:
+                    found += weight * (mask & bits).bit_count()
+                if found >= self.count:
+                    return True
+            if found + best_after < self.count:
+                return False
+        return False
+
+    def dependencies(self) -> int:
+        mask = 0
+        for gate, free, buckets, best_after in self.groups:
+            mask |= gate.dependencies()
+            for weight, bits in buckets:
+                mask |= bits
+        return mask
+
+    def key(self) -> Hashable:
+        return ("WeightedThreshold", self.player, self.count, self.groups)
+
+    def required(self) -> int:
+        # As for AtLeast: required when the count can't be reached without it
+        gate_needs = [gate.required() for gate, free, buckets, best_after in self.groups]
+        mask = 0
+        candidates = 0
+        for need, (gate, free, buckets, best_after) in zip(gate_needs, self.groups):
+            candidates |= need
+            for weight, bits in buckets:
+                candidates |= bits
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            best = 0
+            for need, (gate, free, buckets, best_after) in zip(gate_needs, self.groups):
+                if not need & bit:
+                    best += free + sum(weight * (bits & ~bit).bit_count() for weight, bits in buckets)
+            if best < self.count:
+                mask |= bit
+        return mask
+
+    def _assuming(self, mask: int) -> Requirement:
+        return weighted_threshold(
+            self.count,
+            *(
+                (
+                    gate.assuming(mask),
+                    [(TRUE, free)] + [
+                        (has(item, self.player).assuming(mask), weight)
+                        for weight, bits in buckets for item in item_names_in_mask(bits)
+                    ]
+                )
+                for gate, free, buckets, best_after in self.groups
+            )
+        )
+
+    def __repr__(self) -> str:
+        return f"WeightedThreshold({self.count}, {[group[:3] for group in self.groups]!r})"
+
+
+class Memo(Requirement):
+    """Remembers the results of a requirement that is expensive to evaluate or shared by many rules.
+
+    Results are keyed on the collected items the requirement actually reads, which works as
+    the state's version for it: collecting or removing one of those items changes the key,
+    while collecting anything else keeps hitting the same entry."""
+    __slots__ = ("requirement", "deps", "needs", "results", "player")
+
+    def __init__(self, requirement: Requirement) -> None:
+        self.requirement = requirement
+        self.deps = requirement.dependencies()
+        self.needs: Optional[int] = None
+        self.results: Dict[int, bool] = {}
+        self.player = requirement.player
+
+    def test(self, mask: int) -> bool:
+        key = mask & self.deps
+        result = self.results.get(key)
+        if result is None:
+            if len(self.results) >= MEMO_SIZE:
+                self.results.clear()
+            result = self.results[key] = self.requirement.test(mask)
+        return result
+
+    def dependencies(self) -> int:
+        return self.deps
+
+    def key(self) -> Hashable:
+        return ("Memo", self.requirement)
+
+    def required(self) -> int:
+        if self.needs is None:
+            self.needs = self.requirement.required()
+        return self.needs
+
+    def _assuming(self, mask: int) -> Requirement:
+        return memoize(self.requirement.assuming(mask))
+
+    def __repr__(self) -> str:
+        return f"Memo({self.requirement!r})"
+
+
+class RuleCounter:
+    """How often the rules under one name were called, passed and answered from their Memo."""
+    __slots__ = ("calls", "passed", "memo_hits", "memo_misses")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.passed = 0
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        memo_calls = self.memo_hits + self.memo_misses
+        return {
+            "calls": self.calls,
+            "passed": self.passed,
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "memo_hit_rate": round(self.memo_hits / memo_calls, 4) if memo_calls else None,
+        }
+
+
+class CountedRule(Requirement):
+    """Stands in for a rule while a generation report is being kept (see Instrumentation), counting every call.
+
+    Everything else is passed through to the wrapped requirement, so the dependency index and
+    region checks read the same masks as without it."""
+    __slots__ = ("requirement", "counter", "player")
+
+    def __init__(self, requirement: Requirement, counter: RuleCounter, player: int) -> None:
+        self.requirement = requirement
+        self.counter = counter
+        self.player = player
+
+    def __call__(self, state: CollectionState) -> bool:
+        return self.test(state.prog_items[self.player][PROGRESSION_MASK])
+
+    def test(self, mask: int) -> bool:
+        counter = self.counter
+        counter.calls += 1
+        requirement = self.requirement
+        if isinstance(requirement, Memo):
+            if mask & requirement.deps in requirement.results:
+                counter.memo_hits += 1
+            else:
+                counter.memo_misses += 1
+        result = requirement.test(mask)
+        if result:
+            counter.passed += 1
+        return result
+
+    def dependencies(self) -> int:
+        return self.requirement.dependencies()
+
+    def key(self) -> Hashable:
+        return ("Counted", self.requirement.key(), id(self.counter))
+
+    def required(self) -> int:
+        return self.requirement.required()
+
+    def _assuming(self, mask: int) -> Requirement:
+        return self.requirement.assuming(mask)
+
+    def __repr__(self) -> str:
+        return f"Counted({self.requirement!r})"
+
+
+_shared: "WeakValueDictionary[Hashable, Requirement]" = WeakValueDictionary()
+
+
+def share(requirement: Requirement) -> Requirement:
+    """Return the existing requirement with the same key, if there is one still in use."""
+    return _shared.setdefault(requirement.key(), requirement)
+
+
+def has(item: str, player: int) -> Requirement:
+    return share(Has(item, player))
+
+
+def _player_of(requirements: Iterable[Requirement]) -> int:
+    for requirement in requirements:
+        player = getattr(requirement, "player", None)
+        if player is not None:
+            return player
+    return 0
+
+
+def all_of(*requirements: Requirement) -> Requirement:
+    """Combine requirements that must all be met, dropping anything that is always true."""
+    items: List[str] = []
+    rest: List[Requirement] = []
+    for requirement in requirements:
+        if requirement is TRUE:
+            continue
+        if requirement is FALSE:
+            return FALSE
+        if isinstance(requirement, Has):
+            items.append(requirement.item)
+        elif isinstance(requirement, AllOf):
+            items.extend(requirement.items)
+            rest.extend(requirement.requirements)
+        elif isinstance(requirement, Memo) and isinstance(requirement.requirement, AllOf):
+            # Its items are still checked up front, so a missing one fails fast without a lookup
+            items.extend(requirement.requirement.items)
+            rest.append(requirement)
+        else:
+            rest.append(requirement)
+
+    items = list(dict.fromkeys(items))
+    if not items and not rest:
+        return TRUE
+    if not items and len(rest) == 1:
+        return rest[0]
+    player = _player_of(requirements)
+    if len(items) == 1 and not rest:
+        return has(items[0], player)
+    return share(AllOf(tuple(items), tuple(rest), player))
+
+
+def any_of(*requirements: Requirement) -> Requirement:
+    """Combine requirements where any one is enough, dropping anything that is never true."""
+    items: List[str] = []
+    rest: List[Requirement] = []
+    for requirement in requirements:
+        if requirement is FALSE:
+            continue
+        if requirement is TRUE:
+            return TRUE
+        if isinstance(requirement, Has):
+            items.append(requirement.item)
+        elif isinstance(requirement, AnyOf):
+            items.extend(requirement.items)
+            rest.extend(requirement.requirements)
+        elif isinstance(requirement, Memo) and isinstance(requirement.requirement, AnyOf):
+            items.extend(requirement.requirement.items)
+            rest.append(requirement)
+        else:
+            rest.append(requirement)
+
+    items = list(dict.fromkeys(items))
+    if not items and not rest:
+        return FALSE
+    if not items and len(rest) == 1:
+        return rest[0]
+    player = _player_of(requirements)
+    if len(items) == 1 and not rest:
+        return has(items[0], player)
+    return share(AnyOf(tuple(items), tuple(rest), player))
+
+
+def at_least(count: int, *requirements: Union[Requirement, Tuple[Requirement, int]]) -> Requirement:
+    """Count met requirements, each worth 1 unless given as a (requirement, weight) pair."""
+    kept: List[Requirement] = []
+    weights: List[int] = []
+    for entry in requirements:
+        requirement, weight = entry if isinstance(entry, tuple) else (entry, 1)
+        if requirement is FALSE:
+            continue
+        if requirement is TRUE:
+            count -= weight
+            continue
+        kept.append(requirement)
+        weights.append(weight)
+
+    if count <= 0:
+        return TRUE
+    if sum(weights) < count:
+        return FALSE
+    if all(weight >= count for weight in weights):
+        return any_of(*kept)
+    if count == sum(weights):
+        return all_of(*kept)
+    return share(AtLeast(count, tuple(kept), tuple(weights), _player_of(kept)))
+
+
+def weighted_threshold(count: int, *groups: Tuple[Requirement, Iterable[Tuple[Requirement, int]]]) -> Requirement:
+    """Need `count` worth of weighted requirements, given as (gate, [(requirement, weight), ...]) groups.
+    Requirements that are plain item checks are counted from the mask in one go per weight."""
+    built = []
+    checks: List[Requirement] = []
+    for gate, entries in groups:
+        if gate is FALSE:
+            continue
+        checks.append(gate)
+        free = 0
+        buckets: Dict[int, int] = {}
+        rest = []
+        for requirement, weight in entries:
+            if requirement is TRUE:
+                free += weight
+            elif isinstance(requirement, Has) and not buckets.get(weight, 0) & requirement.bit:
+                buckets[weight] = buckets.get(weight, 0) | requirement.bit
+                checks.append(requirement)
+            elif requirement is not FALSE:
+                rest.append((gate & requirement, weight))
+                checks.append(requirement)
+        # Anything that isn't a plain item check still counts, as a group of its own
+        if free or buckets:
+            best = free + sum(weight * bits.bit_count() for weight, bits in buckets.items())
+            built.append([gate, free, tuple(buckets.items()), best])
+        for requirement, weight in rest:
+            built.append([requirement, weight, (), weight])
+
+    # Largest group first, so the early exits kick in sooner
+    built.sort(key=lambda group: -group[3])
+    total = sum(group[3] for group in built)
+    if count <= 0:
+        return TRUE
+    if total < count:
+        return FALSE
+    if all(group[0] is TRUE and not group[2] for group in built):
+        return TRUE
+    for group in built:
+        total -= group[3]
+        group[3] = total
+    return share(WeightedThreshold(count, tuple(tuple(group) for group in built), _player_of(checks)))
+
+
+def memoize(requirement: Requirement) -> Requirement:
+    """Wrap a requirement in a Memo, unless it is a plain item check that is cheaper to just test."""
+    if isinstance(requirement, (Constant, Has, Memo)):
+        return requirement
+    if isinstance(requirement, (AllOf, AnyOf)) and not requirement.requirements:
+        return requirement
+    return share(Memo(requirement))
\ No newline at end of file
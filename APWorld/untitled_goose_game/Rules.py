@@ -1,2476 +1,2511 @@
-from BaseClasses import CollectionState
-from typing import TYPE_CHECKING
+import logging
+from functools import cached_property, wraps
+from typing import TYPE_CHECKING, Dict, List, Tuple
+from BaseClasses import Location, Region
 from worlds.generic.Rules import set_rule
 
+from .Dependencies import region_requirements
+from .Items import ITEM_GROUPS, item_bit_table
+from .Requirements import Requirement, TRUE, at_least, has, memoize, weighted_threshold
 from .names import itemNames, locationNames, regionNames
 
 if TYPE_CHECKING:
     from . import GooseGameWorld
 
-class UntitledGooseRules:
-    world: "GooseGameWorld"
 
-    def __init__(self, world: "GooseGameWorld") -> None:
-        self.player = world.player
-        self.world = world
-        
-        # To Do (As Well) Task Rules
-        if self.world.options.include_extra_tasks.value:
-            self.extra_task_rules = {
-                locationNames.EXTRA_TASK_GROUNDSKEEPER: self.lock_groundskeeper_out,
-                locationNames.EXTRA_TASK_CABBAGE: self.cabbage_picnic,
-                locationNames.EXTRA_TASK_PUDDLE: self.trip_boy_in_puddle,
-                locationNames.EXTRA_TASK_SCALES: self.make_scales_ding,
-                locationNames.EXTRA_TASK_UMBRELLA: self.open_umbrella_on_tv,
-                locationNames.EXTRA_TASK_BUY: self.make_groundskeeper_buyback,
-                locationNames.EXTRA_TASK_FLOWERS: self.collect_five_flowers,
-                locationNames.EXTRA_TASK_GARAGE: self.trap_boy_in_garage,
-                locationNames.EXTRA_TASK_CATCH: self.catch_thrown_object,
-                locationNames.EXTRA_TASK_THROWN: self.get_thrown_over_fence,
-                locationNames.EXTRA_TASK_BUST: self.dress_up_bust_outside_items,
-                locationNames.EXTRA_TASK_GOAL: self.score_goal,
-                locationNames.EXTRA_TASK_BOAT: self.sail_boat_under_bridge,
-                locationNames.EXTRA_TASK_RIBBON: self.perform_with_ribbon,
-                locationNames.EXTRA_TASK_HAT: self.steal_woolen_hat,
-            }
+def memoized_rule(build):
+    """Like cached_property, for rule definitions: the built requirement is memoized,
+    so rules shared by several locations and goals are only evaluated once per state."""
+    @wraps(build)
+    def build_memoized(self) -> Requirement:
+        return memoize(build(self))
+    return cached_property(build_memoized)
 
-        # To Do (Quickly!!) Task Rules
-        if self.world.options.include_speedrun_tasks.value:
-            self.speedrun_task_rules = {
-                locationNames.SPEEDRUN_TASK_GARDEN: self.speedrun_garden,
-                locationNames.SPEEDRUN_TASK_HIGH_STREET: self.speedrun_high_street,
-                locationNames.SPEEDRUN_TASK_BACK_GARDENS: self.speedrun_back_gardens,
-                locationNames.SPEEDRUN_TASK_PUB: self.speedrun_pub,
-            }
 
-        # Item Pickup Rules
-        if self.world.options.include_item_pickups.value:
-            self.pickup_rules = {
-                locationNames.PICKUP_RADIO: self.pickup_radio,
-                locationNames.PICKUP_TROWEL: self.pickup_trowel,
-                locationNames.PICKUP_KEYS: self.pickup_keys,
-                locationNames.PICKUP_TULIP: self.pickup_tulip,
-                locationNames.PICKUP_APPLE_1: self.pickup_apples,
-                locationNames.PICKUP_JAM: self.pickup_jam,
-                locationNames.PICKUP_PICNIC_MUG: self.pickup_picnic_mug,
-                locationNames.PICKUP_THERMOS: self.pickup_thermos,
-                locationNames.PICKUP_SANDWICH_R: self.pickup_sandwich,
-                locationNames.PICKUP_SANDWICH_L: self.pickup_sandwich,
-                locationNames.PICKUP_STRAW_HAT: self.pickup_straw_hat,
-                locationNames.PICKUP_DRINK_CAN: self.pickup_drink_can,
-                locationNames.PICKUP_TENNIS_BALL: self.pickup_tennis_ball,
-                locationNames.PICKUP_GROUNDSKEEPERS_HAT: self.pickup_grounsdkeepers_hat,
-                locationNames.PICKUP_APPLE_2: self.pickup_apples,
-                locationNames.PICKUP_BOYS_GLASSES: self.pickup_boys_glasses,
-                locationNames.PICKUP_HORN_RIMMED_GLASSES: self.pickup_horn_rimmed_glasses,
-                locationNames.PICKUP_RED_GLASSES: self.pickup_red_glasses,
-                locationNames.PICKUP_SUNGLASSES: self.pickup_sunglasses,
-                locationNames.PICKUP_LOO_PAPER: self.pickup_loo_paper,
-                locationNames.PICKUP_TOY_CAR: self.pickup_toy_car,
-                locationNames.PICKUP_HAIRBRUSH: self.pickup_hairbrush,
-                locationNames.PICKUP_TOOTHBRUSH: self.pickup_toothbrush,
-                locationNames.PICKUP_STEREOSCOPE: self.pickup_stereoscope,
-                locationNames.PICKUP_DISH_SOAP_BOTTLE: self.pickup_dish_soap_bottle,
-                locationNames.PICKUP_TINNED_FOOD_BLUE: self.pickup_food_cans,
-                locationNames.PICKUP_TINNED_FOOD_YELLOW: self.pickup_food_cans,
-                locationNames.PICKUP_TINNED_FOOD_ORANGE: self.pickup_food_cans,
-                locationNames.PICKUP_WEED_TOOL: self.pickup_weed_tools,
-                locationNames.PICKUP_LILY_FLOWER: self.pickup_lily_flower,
-                locationNames.PICKUP_ORANGE_1: self.pickup_oranges,
-                locationNames.PICKUP_ORANGE_2: self.pickup_oranges,
-                locationNames.PICKUP_ORANGE_3: self.pickup_oranges,
-                locationNames.PICKUP_SHOP_TOMATO_1: self.pickup_tomatoes_high_street,
-                locationNames.PICKUP_SHOP_TOMATO_2: self.pickup_tomatoes_high_street,
-                locationNames.PICKUP_SHOP_TOMATO_3: self.pickup_tomatoes_high_street,
-                locationNames.PICKUP_SHOP_CARROT_1: self.pickup_carrots_high_street,
-                locationNames.PICKUP_SHOP_CARROT_2: self.pickup_carrots_high_street,
-                locationNames.PICKUP_SHOP_CARROT_3: self.pickup_carrots_high_street,
-                locationNames.PICKUP_CUCUMBER_1: self.pickup_cucumbers,
-                locationNames.PICKUP_CUCUMBER_2: self.pickup_cucumbers,
-                locationNames.PICKUP_CUCUMBER_3: self.pickup_cucumbers,
-                locationNames.PICKUP_LEEK_1: self.pickup_leeks,
-                locationNames.PICKUP_LEEK_2: self.pickup_leeks,
-                locationNames.PICKUP_LEEK_3: self.pickup_leeks,
-                locationNames.PICKUP_TOY_PLANE: self.pickup_fusilage,
-                locationNames.PICKUP_PINT_BOTTLE_1: self.pickup_pint_bottle_hub,
-                locationNames.PICKUP_PINT_BOTTLE_2: self.pickup_pint_bottle_high_street,
-                locationNames.PICKUP_PINT_BOTTLE_3: self.pickup_pint_bottle_high_street,
-                locationNames.PICKUP_SPRAY_BOTTLE: self.pickup_spray_bottle,
-                locationNames.PICKUP_WALKIE_TALKIE_1: self.pickup_walkie_talkies,
-                locationNames.PICKUP_WALKIE_TALKIE_2: self.pickup_walkie_talkies,
-                locationNames.PICKUP_APPLE_CORE_1: self.pickup_apple_cores,
-                locationNames.PICKUP_APPLE_CORE_2: self.pickup_apple_cores,
-                locationNames.PICKUP_DUSTBIN_LID: self.pickup_dustbin_lid,
-                locationNames.PICKUP_CHALK: self.pickup_chalk,
-                locationNames.PICKUP_GARDEN_FORK: self.pickup_weed_tools,
-                locationNames.PICKUP_RIBBON_RED: self.pickup_red_bow,
-                locationNames.PICKUP_BLUE_RIBBON: self.pickup_blue_bow,
-                locationNames.PICKUP_DUMMY: self.pickup_dummy,
-                locationNames.PICKUP_CRICKET_BALL: self.pickup_cricket_ball,
-                locationNames.PICKUP_BUST_PIPE: self.pickup_bust_pipe,
-                locationNames.PICKUP_BUST_HAT: self.pickup_bust_hat,
-                locationNames.PICKUP_BUST_GLASSES: self.pickup_bust_glasses,
-                locationNames.PICKUP_SLIPPER_R: self.pickup_slippers,
-                locationNames.PICKUP_SLIPPER_L: self.pickup_slippers,
-                locationNames.PICKUP_TEA_CUP: self.pickup_tea_cup,
-                locationNames.PICKUP_NEWSPAPER: self.pickup_newspaper,
-                locationNames.PICKUP_SOCK_1: self.pickup_socks,
-                locationNames.PICKUP_SOCK_2: self.pickup_socks,
-                locationNames.PICKUP_VASE: self.pickup_vase,
-                locationNames.PICKUP_POT_STACK: self.pickup_pot_stack,
-                locationNames.PICKUP_SOAP: self.pickup_soap,
-                locationNames.PICKUP_PAINTBRUSH: self.pickup_paintbrush,
-                locationNames.PICKUP_VASE_PIECE_1: self.pickup_vase_pieces,
-                locationNames.PICKUP_VASE_PIECE_2: self.pickup_vase_pieces,
-                locationNames.PICKUP_BRA: self.pickup_bra,
-                locationNames.PICKUP_BADMINTON_RACKET: self.pickup_badminton_racket,
-                locationNames.PICKUP_ROSE: self.pickup_rose,
-                locationNames.PICKUP_FISHING_BOBBER: self.pickup_fishing_bobber,
-                locationNames.PICKUP_LETTER: self.pickup_exit_letter,
-                locationNames.PICKUP_PLATE_1: self.pickup_plates,
-                locationNames.PICKUP_PLATE_2: self.pickup_plates,
-                locationNames.PICKUP_PLATE_3: self.pickup_plates,
-                locationNames.PICKUP_GREEN_QUOIT_1: self.pickup_green_quoits,
-                locationNames.PICKUP_GREEN_QUOIT_2: self.pickup_green_quoits,
-                locationNames.PICKUP_GREEN_QUOIT_3: self.pickup_green_quoits,
-                locationNames.PICKUP_RED_QUOIT_1: self.pickup_red_quoits,
-                locationNames.PICKUP_RED_QUOIT_2: self.pickup_red_quoits,
-                locationNames.PICKUP_RED_QUOIT_3: self.pickup_red_quoits,
-                locationNames.PICKUP_FORK_1: self.pickup_forks,
-                locationNames.PICKUP_FORK_2: self.pickup_forks,
-                locationNames.PICKUP_KNIFE_1: self.pickup_knives,
-                locationNames.PICKUP_KNIFE_2: self.pickup_knives,
-                locationNames.PICKUP_CORK: self.pickup_cork,
-                locationNames.PICKUP_CANDLESTICK: self.pickup_candlestick,
-                locationNames.PICKUP_FLOWER_FOR_VASE: self.pickup_vase_flower,
-                locationNames.PICKUP_DART_1: self.pickup_darts,
-                locationNames.PICKUP_DART_2: self.pickup_darts,
-                locationNames.PICKUP_DART_3: self.pickup_darts,
-                locationNames.PICKUP_HARMONICA: self.pickup_harmonica,
-                locationNames.PICKUP_PINT_GLASS: self.pickup_pint_glass,
-                locationNames.PICKUP_TOY_BOAT: self.pickup_toy_boat,
-                locationNames.PICKUP_OLD_MANS_WOOLEN_HAT: self.pickup_woolen_hat,
-                locationNames.PICKUP_PEPPER_GRINDER: self.pickup_pepper_grinder,
-                locationNames.PICKUP_PUB_WOMANS_CLOTH: self.pickup_pub_woman_cloth,
-                locationNames.PICKUP_MINI_PERSON_CHILD: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_JUMPSUIT: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_GARDENER: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_OLD_WOMAN: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_POSTIE: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_VEST_MAN: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_GOOSE: self.pickup_mini_goose,
-                locationNames.PICKUP_MINI_SHOVEL: self.pickup_mini_shovel,
-                locationNames.PICKUP_POPPY_FLOWER: self.pickup_poppy,
-                locationNames.PICKUP_MINI_PHONE_DOOR: self.pickup_mini_phone_booth,
-                locationNames.PICKUP_MINI_MAIL_PILLAR: self.pickup_mini_mail_pillar,
-                locationNames.PICKUP_TIMBER_HANDLE: self.pickup_timber_handle,
-                locationNames.PICKUP_GOLDEN_BELL: self.pickup_golden_bell,
-                locationNames.PICKUP_CARROT_1: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_2: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_3: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_4: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_5: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_6: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_7: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_8: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_9: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_10: self.pickup_garden_carrots,
-                locationNames.PICKUP_PUB_TOMATO_1: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_2: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_3: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_4: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_5: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_6: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_7: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_8: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_9: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_10: self.pickup_pub_open_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_11: self.pickup_pub_open_tomatoes,
-                locationNames.PICKUP_BOOT_START: self.pickup_boots,
-                locationNames.PICKUP_BOOT_HUB: self.pickup_boots,
-            }
+# Every area access item, for telling whether a rule gates on the same areas as its region
+AREA_MASK = sum(item_bit_table[area] for area in ITEM_GROUPS["Area Unlocks"])
 
-        # Item Drag Rules
-        if self.world.options.include_drag_items.value:
-            self.drag_rules = {
-                locationNames.DRAG_RAKE: self.drag_rake,
-                locationNames.DRAG_PICNIC_BASKET: self.drag_picnic_basket,
-                locationNames.DRAG_ESKY: self.drag_esky,
-                locationNames.DRAG_SHOVEL: self.drag_shovel,
-                locationNames.DRAG_PUMKPIN_1: self.drag_pumpkins,
-                locationNames.DRAG_PUMKPIN_2: self.drag_pumpkins,
-                locationNames.DRAG_PUMKPIN_3: self.drag_pumpkins,
-                locationNames.DRAG_PUMKPIN_4: self.drag_pumpkins,
-                locationNames.DRAG_WATERING_CAN: self.drag_watering_can,
-                locationNames.DRAG_GUMBOOT_1: self.drag_gumboots,
-                locationNames.DRAG_GUMBOOT_2: self.drag_gumboots,
-                locationNames.DRAG_NO_GOOSE_SIGN_GARDEN: self.drag_gardener_sign,
-                locationNames.DRAG_WOODEN_CRATE: self.drag_wooden_crate,
-                locationNames.DRAG_FENCE_BOLT: self.drag_fence_bolt,
-                locationNames.DRAG_MALLET: self.drag_mallet,
-                locationNames.DRAG_SHOPPING_BASKET: self.drag_shopping_basket,
-                locationNames.DRAG_UMBRELLA_BLACK: self.drag_umbrellas,
-                locationNames.DRAG_UMBRELLA_RAINBOW: self.drag_umbrellas,
-                locationNames.DRAG_UMBRELLA_RED: self.drag_umbrellas,
-                locationNames.DRAG_PUSH_BROOM: self.drag_push_broom,
-                locationNames.DRAG_BROKEN_BROOM_HEAD: self.drag_broom_head,
-                locationNames.DRAG_DUSTBIN: self.drag_dustbin,
-                locationNames.DRAG_BABY_DOLL: self.drag_baby_doll,
-                locationNames.DRAG_PRICING_GUN: self.drag_pricing_gun,
-                locationNames.DRAG_ADDING_MACHINE: self.drag_adding_machine,
-                locationNames.DRAG_ROSE_BOX: self.drag_rose_box,
-                locationNames.DRAG_CRICKET_BAT: self.drag_cricket_bat,
-                locationNames.DRAG_TEA_POT: self.drag_tea_pot,
-                locationNames.DRAG_CLIPPERS: self.drag_clippers,
-                locationNames.DRAG_DUCK_STATUE: self.drag_duck_statue,
-                locationNames.DRAG_FROG_STATUE: self.drag_frog_statue,
-                locationNames.DRAG_JEREMY_FISH: self.drag_jeremy_fish,
-                locationNames.DRAG_NO_GOOSE_SIGN_MESSY: self.drag_messy_sign,
-                locationNames.DRAG_DRAWER: self.drag_drawer,
-                locationNames.DRAG_ENAMEL_JUG: self.drag_enamel_jug,
-                locationNames.DRAG_NO_GOOSE_SIGN_CLEAN: self.drag_clean_sign,
-                locationNames.DRAG_TACKLE_BOX: self.drag_tackle_box,
-                locationNames.DRAG_TRAFFIC_CONE: self.drag_traffic_cone,
-                locationNames.DRAG_PARCEL: self.drag_exit_parcel,
-                locationNames.DRAG_STEALTH_BOX: self.drag_stealth_box,
-                locationNames.DRAG_NO_GOOSE_SIGN_PUB: self.drag_no_goose_sign,
-                locationNames.DRAG_PORTABLE_STOOL: self.drag_portable_stool,
-                locationNames.DRAG_DARTBOARD: self.drag_dartboard,
-                locationNames.DRAG_MOP_BUCKET: self.drag_mop_bucket,
-                locationNames.DRAG_MOP: self.drag_mop,
-                locationNames.DRAG_DELIVERY_BOX: self.drag_delivery_box,
-                locationNames.DRAG_BUCKET: self.drag_burly_mans_bucket,
-                locationNames.DRAG_MINI_BENCH: self.drag_mini_benches,
-                locationNames.DRAG_MINI_PUMP: self.drag_mini_pump,
-                locationNames.DRAG_MINI_STREET_BENCH: self.drag_mini_benches,
-                locationNames.DRAG_MINI_BIRDBATH: self.drag_mini_birdbath,
-                locationNames.DRAG_MINI_EASEL: self.drag_mini_easel,
-                locationNames.DRAG_MINI_SUN_LOUNGE: self.drag_sun_lounge,
-                locationNames.DRAG_TOPSOIL_BAG_1: self.drag_topsoil_bags,
-                locationNames.DRAG_TOPSOIL_BAG_2: self.drag_topsoil_bags,
-                locationNames.DRAG_TOPSOIL_BAG_3: self.drag_topsoil_bags,
-            }
 
-        # Interaction Rules
-        if self.world.options.include_interactions.value:
-            self.interaction_rules = {
-                locationNames.INTERACT_BIKE_BELL: self.interact_bike_bell,
-                locationNames.INTERACT_GARDEN_TAP: self.interact_garden_water,
-                locationNames.INTERACT_SPRINKLER: self.interact_garden_water,
-                locationNames.INTERACT_UNPLUG_RADIO: self.interact_radio,
-                locationNames.INTERACT_UMBRELLA_BLACK: self.interact_umbrellas,
-                locationNames.INTERACT_UMBRELLA_RAINBOW: self.interact_umbrellas,
-                locationNames.INTERACT_UMBRELLA_RED: self.interact_umbrellas,
-                locationNames.INTERACT_BOYS_LACES_L: self.interact_boys_laces,
-                locationNames.INTERACT_BOYS_LACES_R: self.interact_boys_laces,
-                locationNames.INTERACT_FOOTBALL: self.interact_football,
-                locationNames.INTERACT_RING_BELL: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WINDMILL: self.interact_back_gardens_objects,
-                locationNames.INTERACT_PURPLE_FLOWER: self.interact_back_gardens_objects,
-                locationNames.INTERACT_TRELLIS: self.interact_trellis,
-                locationNames.INTERACT_SUNFLOWER: self.interact_back_gardens_objects,
-                locationNames.INTERACT_TOPIARY: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_C: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_D: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_E: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_F: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_G: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_A: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_B: self.interact_back_gardens_objects,
-                locationNames.INTERACT_VAN_DOOR_L: self.interact_van_doors,
-                locationNames.INTERACT_VAN_DOOR_R: self.interact_van_doors,
-                locationNames.INTERACT_BURLY_MANS_LACES_L: self.interact_burly_laces,
-                locationNames.INTERACT_BURLY_MANS_LACES_R: self.interact_burly_laces,
-                locationNames.INTERACT_PUB_TAP: self.interact_pub_tap,
-                locationNames.INTERACT_WELL: self.interact_well,
-            }
+# ----- Scales Weight Tables -----
+# How much each item is worth on the scales, per area it is found in. Anything worth 3 is enough on its own.
 
-        # New Tasks Rules
-        if self.world.options.include_new_tasks.value:
-            self.new_tasks_rules = {
-                locationNames.SHORT_OUT_RADIO: self.short_out_radio,
-                locationNames.LOCK_GROUNDSKEEPER_IN: self.lock_groundskeeper_out,
-                locationNames.OPEN_INTRO_GATE: self.interact_intro_gate,
-                locationNames.DROP_MAIL_IN_WELL: self.drop_mail_in_well,
-                locationNames.BREAK_THROUGH_BOARDS: self.interact_boards,
-                locationNames.MAKE_WOMAN_FIX_TOPIARY: self.interact_make_woman_fix_topiary,
-                locationNames.POSE_AS_DUCK: self.pose_as_duck_statue,
-                locationNames.DRESS_UP_BUSH: self.dress_up_bush,
-                locationNames.INTERIOR_REDECORATING: self.drag_messy_sign,
-                locationNames.TRIP_BURLY_MAN: self.interact_burly_laces,
-                locationNames.BREAK_PINT_GLASS: self.pickup_pint_glass,
-                locationNames.TRAP_TV_SHOP_OWNER_GARAGE: self.trap_tv_shop_owner_in_garage,
-                locationNames.PERFORM_WITH_HARMONICA: self.perform_with_harmonica,
-            }
+BACK_GARDENS_BEHIND_DRAWER = f"{regionNames.BACK_GARDENS} (Behind Drawer)"
 
-        # Model Church Pecking Rules
-        if self.world.options.include_model_church_pecks.value == 1:
-            self.church_first_peck_rules = {
-                locationNames.PECK_DOORWAY: self.peck_church,
-                locationNames.PECK_TOWER: self.peck_church,
-            }
-        elif self.world.options.include_model_church_pecks.value == 2:
-            self.church_all_peck_rules = {
-                locationNames.PECK_DOORWAY_1: self.peck_church,
-                locationNames.PECK_DOORWAY_2: self.peck_church,
-                locationNames.PECK_DOORWAY_3: self.peck_church,
-                locationNames.PECK_DOORWAY_4: self.peck_church,
-                locationNames.PECK_DOORWAY_5: self.peck_church,
-                locationNames.PECK_DOORWAY_6: self.peck_church,
-                locationNames.PECK_DOORWAY_7: self.peck_church,
-                locationNames.PECK_DOORWAY_8: self.peck_church,
-                locationNames.PECK_DOORWAY_9: self.peck_church,
-                locationNames.PECK_DOORWAY_10: self.peck_church,
-                locationNames.PECK_DOORWAY_11: self.peck_church,
-                locationNames.PECK_DOORWAY_12: self.peck_church,
-                locationNames.PECK_DOORWAY_13: self.peck_church,
-                locationNames.PECK_DOORWAY_14: self.peck_church,
-                locationNames.PECK_DOORWAY_15: self.peck_church,
-                locationNames.PECK_DOORWAY_16: self.peck_church,
-                locationNames.PECK_DOORWAY_17: self.peck_church,
-                locationNames.PECK_DOORWAY_18: self.peck_church,
-                locationNames.PECK_DOORWAY_19: self.peck_church,
-                locationNames.PECK_TOWER_1: self.peck_church,
-                locationNames.PECK_TOWER_2: self.peck_church,
-                locationNames.PECK_TOWER_3: self.peck_church,
-                locationNames.PECK_TOWER_4: self.peck_church,
-                locationNames.PECK_TOWER_5: self.peck_church,
-                locationNames.PECK_TOWER_6: self.peck_church,
-                locationNames.PECK_TOWER_7: self.peck_church,
-                locationNames.PECK_TOWER_8: self.peck_church,
-                locationNames.PECK_TOWER_9: self.peck_church,
-                locationNames.PECK_TOWER_10: self.peck_church,
-                locationNames.PECK_TOWER_11: self.peck_church,
-                locationNames.PECK_TOWER_12: self.peck_church,
-                locationNames.PECK_TOWER_13: self.peck_church,
-                locationNames.PECK_TOWER_14: self.peck_church,
-                locationNames.PECK_TOWER_15: self.peck_church,
-                locationNames.PECK_TOWER_16: self.peck_church,
-            }
+SCALES_ITEM_WEIGHTS: Dict[str, Dict[str, int]] = {
+    regionNames.HIGH_STREET: {
+        itemNames.PROP_CARROTS: 3,
+        itemNames.PROP_TOMATOES: 3,
+        itemNames.PROP_ORANGES: 3,
+        itemNames.PROP_LEEKS: 3,
+        itemNames.PROP_CUCUMBERS: 3,
+        itemNames.PROP_TINNED_FOOD: 3,
+        itemNames.PROP_PINT_BOTTLES: 3,  # Two in High Street, one in the hub near the dummy
+        itemNames.PROP_APPLE_CORES: 2,
+        itemNames.PROP_WALKIE_TALKIES: 2,
+        itemNames.PROP_WEED_TOOLS: 2,
+        itemNames.PROP_TOOTHRBRUSH: 1,
+        itemNames.PROP_HAIRBRUSH: 1,
+        itemNames.PROP_LOO_PAPER: 1,
+        itemNames.PROP_DISH_SOAP_BOTTLE: 1,
+        itemNames.PROP_SPRAY_BOTTLE: 1,
+        itemNames.PROP_TOY_CAR: 1,
+        itemNames.PROP_HORN_RIMMED_GLASSES: 1,
+        itemNames.PROP_RED_GLASSES: 1,
+        itemNames.PROP_SUNGLASSES: 1,
+        itemNames.NPC_BOY: 1,
+        itemNames.PROP_TOY_PLANE: 1,
+        itemNames.PROP_LILY_FLOWER: 1,
+        itemNames.PROP_STEREOSCOPE: 1,
+        itemNames.PROP_DUSTBIN_LID: 1,
+    },
+    regionNames.HUB: {
+        itemNames.PROP_BOOTS: 2,
+        itemNames.PROP_TENNIS_BALL: 1,
+        itemNames.PROP_DUMMY: 1,
+        itemNames.PROP_FISHING_BOBBER: 1,
+        itemNames.PROP_DRINK_CAN: 1,
+        itemNames.PROP_RIBBONS: 1,
+    },
+    regionNames.GARDEN: {
+        itemNames.PROP_APPLES: 2,
+        itemNames.PROP_SANDWICH: 2,
+        itemNames.PROP_JAM: 1,
+        itemNames.PROP_TULIP: 1,
+        itemNames.PROP_PICNIC_MUG: 1,
+        itemNames.PROP_THERMOS: 1,
+        itemNames.PROP_TROWEL: 1,
+        itemNames.PROP_RADIO: 1,
+    },
+    regionNames.BACK_GARDENS: {
+        itemNames.PROP_TEA_CUP: 1,
+        itemNames.PROP_CRICKET_BALL: 1,
+        itemNames.PROP_BUST_PIPE: 1,
+        itemNames.PROP_BUST_HAT: 1,
+        itemNames.PROP_BUST_GLASSES: 1,
+        itemNames.PROP_NEWSPAPER: 1,
+    },
+    BACK_GARDENS_BEHIND_DRAWER: {
+        itemNames.PROP_SOCKS: 2,
+        itemNames.PROP_SOAP: 1,
+        itemNames.PROP_POT_STACK: 1,
+        itemNames.PROP_PAINTBRUSH: 1,
+        itemNames.PROP_BRA: 1,
+    },
+    regionNames.PUB: {
+        itemNames.PROP_GREEN_QUOITS: 3,
+        itemNames.PROP_RED_QUOITS: 3,
+        itemNames.PROP_PLATES: 3,
+        itemNames.PROP_DARTBOARD: 3,
+        itemNames.PROP_KNIVES: 2,
+        itemNames.PROP_FORKS: 2,
+        itemNames.PROP_CORK: 1,
+        itemNames.PROP_LETTER: 1,
+        itemNames.PROP_CANDLESTICK: 1,
+        itemNames.PROP_HARMONICA: 1,
+        itemNames.PROP_TOY_BOAT: 1,
+        itemNames.PROP_PEPPER_GRINDER: 1,
+    },
+    regionNames.MODEL_VILLAGE: {
+        itemNames.PROP_MINI_PEOPLE: 3,
+        itemNames.PROP_MINI_GOOSE: 1,
+        itemNames.PROP_MINI_MAIL_PILLAR: 1,
+        itemNames.PROP_MINI_PHONE_DOOR: 1,
+        itemNames.PROP_MINI_SHOVEL: 1,
+        itemNames.PROP_POPPY_FLOWER: 1,
+        itemNames.PROP_TIMBER_HANDLE: 1,
+    },
+}
 
-        # Milestone Rules
-        if self.world.options.include_milestone_locations.value and self.world.options.include_extra_tasks.value and self.world.options.include_speedrun_tasks.value:
-            self.all_milestone_rules = {
-                locationNames.MILESTONE_ALL_GARDEN: self.all_garden_tasks,
-                locationNames.MILESTONE_ALL_HIGH_STREET: self.all_high_street_tasks,
-                locationNames.MILESTONE_ALL_BACK_GARDENS: self.all_back_gardens_tasks,
-                locationNames.MILESTONE_ALL_PUB: self.all_pub_tasks,
-                locationNames.MILESTONE_ALL_MAIN: self.all_main_task_lists,
-                locationNames.MILESTONE_ALL_EXTRA: self.all_to_do_as_well_tasks,
-                locationNames.MILESTONE_ALL_SPEEDRUN: self.all_speedrun_tasks,
-                locationNames.MILESTONE_ALL_TASKS: self.all_tasks_complete,
-            }
-        elif self.world.options.include_milestone_locations.value and self.world.options.include_extra_tasks.value:
-            self.non_speedrun_milestone_rules = {
-                locationNames.MILESTONE_ALL_GARDEN: self.all_garden_tasks,
-                locationNames.MILESTONE_ALL_HIGH_STREET: self.all_high_street_tasks,
-                locationNames.MILESTONE_ALL_BACK_GARDENS: self.all_back_gardens_tasks,
-                locationNames.MILESTONE_ALL_PUB: self.all_pub_tasks,
-                locationNames.MILESTONE_ALL_MAIN: self.all_main_task_lists,
-                locationNames.MILESTONE_ALL_EXTRA: self.all_to_do_as_well_tasks,
-            }
-        elif self.world.options.include_milestone_locations.value and self.world.options.include_speedrun_tasks.value:
-            self.non_to_do_as_well_milestone_rules = {
-                locationNames.MILESTONE_ALL_GARDEN: self.all_garden_tasks,
-                locationNames.MILESTONE_ALL_HIGH_STREET: self.all_high_street_tasks,
-                locationNames.MILESTONE_ALL_BACK_GARDENS: self.all_back_gardens_tasks,
-                locationNames.MILESTONE_ALL_PUB: self.all_pub_tasks,
-                locationNames.MILESTONE_ALL_MAIN: self.all_main_task_lists,
-                locationNames.MILESTONE_ALL_SPEEDRUN: self.all_speedrun_tasks,
-            }
-        elif self.world.options.include_milestone_locations.value:
-            self.basic_milestone_rules = {
-                locationNames.MILESTONE_ALL_GARDEN: self.all_garden_tasks,
-                locationNames.MILESTONE_ALL_HIGH_STREET: self.all_high_street_tasks,
-                locationNames.MILESTONE_ALL_BACK_GARDENS: self.all_back_gardens_tasks,
-                locationNames.MILESTONE_ALL_PUB: self.all_pub_tasks,
-                locationNames.MILESTONE_ALL_MAIN: self.all_main_task_lists,
-            }
+# ----- Location Rule Tables -----
+# The rule each location uses, by the name of its UntitledGooseRules property.
+# LocationPlan picks out the tables the options enable, the same way it picks the locations.
 
-        # Goals
-        if self.world.options.goal.value == 0:
-            self.simple_goal_rules = {
-                locationNames.GOAL_MODEL_VILLAGE_ENTRY: self.get_into_model_village,
-            }
-        # elif self.world.options.goal.value == 1:\
-            # No special locations
-        elif self.world.options.goal.value == 2:
-            self.all_main_tasks_goal_rules = {
-                locationNames.GOAL_ALL_MAIN: self.all_main_task_lists,
-            }
-        elif self.world.options.goal.value == 3:
-            self.all_speedrun_tasks_goal_rules = {
-                locationNames.GOAL_ALL_SPEEDRUN: self.all_speedrun_tasks,
-            }
-        elif self.world.options.goal.value == 4:
-            self.all_non_speedrun_tasks_goal_rules = {
-                locationNames.GOAL_ALL_NON_SPEEDRUN: self.all_non_speedrun_tasks,
-            }
-        elif self.world.options.goal.value == 5:
-            self.all_tasks_goal_rules = {
-                locationNames.GOAL_ALL_TASKS: self.all_tasks_complete,
-            }
-        elif self.world.options.goal.value == 6:
-            self.four_final_tasks_rules = {
-                locationNames.GOAL_ALL_FINAL_TASKS: self.four_final_tasks,
-            }
-        
-        # Main Task Rules
-        self.main_tasks_rules = {
-            locationNames.TASK_GARDEN_ENTRY: self.get_into_garden,
-            locationNames.TASK_GARDEN_WET: self.get_groundskeeper_wet,
-            locationNames.TASK_GARDEN_KEYS: self.steal_groundskeepers_keys,
-            locationNames.TASK_GARDEN_HAT: self.make_groundskeeper_wear_sun_hat,
-            locationNames.TASK_GARDEN_RAKE: self.rake_in_lake,
-            locationNames.TASK_GARDEN_PICNIC: self.picnic,
-            locationNames.TASK_GARDEN_FINAL: self.make_groundskeeper_hammer_thumb,
-            locationNames.TASK_HIGH_STREET_BROOM: self.break_broom,
-            locationNames.TASK_HIGH_STREET_PHONE: self.trap_boy_in_phone_booth,
-            locationNames.TASK_HIGH_STREET_GLASSES: self.make_boy_wear_wrong_glasses,
-            locationNames.TASK_HIGH_STREET_BUY: self.make_someone_buyback,
-            locationNames.TASK_HIGH_STREET_TV: self.get_on_tv,
-            locationNames.TASK_HIGH_STREET_SHOPPING: self.go_shopping,
-            locationNames.TASK_HIGH_STREET_FINAL: self.trap_shopkeep_in_garage,
-            locationNames.TASK_BACK_GARDENS_VASE: self.make_someone_break_vase,
-            locationNames.TASK_BACK_GARDENS_BUST: self.dress_up_bust,
-            locationNames.TASK_BACK_GARDENS_TEA: self.make_man_spit_out_tea,
-            locationNames.TASK_BACK_GARDENS_RIBBON: self.get_dressed_up,
-            locationNames.TASK_BACK_GARDENS_BAREFOOT: self.make_man_barefoot,
-            locationNames.TASK_BACK_GARDENS_WASHING: self.do_washing,
-            locationNames.TASK_BACK_GARDENS_FINAL: self.make_someone_prune_rose,
-            locationNames.TASK_PUB_ENTRY: self.get_into_pub,
-            locationNames.TASK_PUB_DARTBOARD: self.break_dartboard,
-            locationNames.TASK_PUB_BOAT: self.get_toy_boat,
-            locationNames.TASK_PUB_BUM: self.make_old_man_fall_on_bum,
-            locationNames.TASK_PUB_FLOWER: self.be_awarded_flower,
-            locationNames.TASK_PUB_PINT: self.drop_pint_glass_in_canal,
-            locationNames.TASK_PUB_TABLE: self.set_table,
-            locationNames.TASK_PUB_FINAL: self.drop_bucket_on_burly_man,
-        }
+# To Do (As Well) Task Rules
+extra_task_rules: Dict[str, str] = {
+    locationNames.EXTRA_TASK_GROUNDSKEEPER: "lock_groundskeeper_out",
+    locationNames.EXTRA_TASK_CABBAGE: "cabbage_picnic",
+    locationNames.EXTRA_TASK_PUDDLE: "trip_boy_in_puddle",
+    locationNames.EXTRA_TASK_SCALES: "make_scales_ding",
+    locationNames.EXTRA_TASK_UMBRELLA: "open_umbrella_on_tv",
+    locationNames.EXTRA_TASK_BUY: "make_groundskeeper_buyback",
+    locationNames.EXTRA_TASK_FLOWERS: "collect_five_flowers",
+    locationNames.EXTRA_TASK_GARAGE: "trap_boy_in_garage",
+    locationNames.EXTRA_TASK_CATCH: "catch_thrown_object",
+    locationNames.EXTRA_TASK_THROWN: "get_thrown_over_fence",
+    locationNames.EXTRA_TASK_BUST: "dress_up_bust_outside_items",
+    locationNames.EXTRA_TASK_GOAL: "score_goal",
+    locationNames.EXTRA_TASK_BOAT: "sail_boat_under_bridge",
+    locationNames.EXTRA_TASK_RIBBON: "perform_with_ribbon",
+    locationNames.EXTRA_TASK_HAT: "steal_woolen_hat",
+}
+
+# To Do (Quickly!!) Task Rules
+speedrun_task_rules: Dict[str, str] = {
+    locationNames.SPEEDRUN_TASK_GARDEN: "speedrun_garden",
+    locationNames.SPEEDRUN_TASK_HIGH_STREET: "speedrun_high_street",
+    locationNames.SPEEDRUN_TASK_BACK_GARDENS: "speedrun_back_gardens",
+    locationNames.SPEEDRUN_TASK_PUB: "speedrun_pub",
+}
+
+# Item Pickup Rules
+pickup_rules: Dict[str, str] = {
+    locationNames.PICKUP_RADIO: "pickup_radio",
+    locationNames.PICKUP_TROWEL: "pickup_trowel",
+    locationNames.PICKUP_KEYS: "pickup_keys",
+    locationNames.PICKUP_TULIP: "pickup_tulip",
+    locationNames.PICKUP_APPLE_1: "pickup_apples",
+    locationNames.PICKUP_JAM: "pickup_jam",
+    locationNames.PICKUP_PICNIC_MUG: "pickup_picnic_mug",
+    locationNames.PICKUP_THERMOS: "pickup_thermos",
+    locationNames.PICKUP_SANDWICH_R: "pickup_sandwich",
+    locationNames.PICKUP_SANDWICH_L: "pickup_sandwich",
+    locationNames.PICKUP_STRAW_HAT: "pickup_straw_hat",
+    locationNames.PICKUP_DRINK_CAN: "pickup_drink_can",
+    locationNames.PICKUP_TENNIS_BALL: "pickup_tennis_ball",
+    locationNames.PICKUP_GROUNDSKEEPERS_HAT: "pickup_grounsdkeepers_hat",
+    locationNames.PICKUP_APPLE_2: "pickup_apples",
+    locationNames.PICKUP_BOYS_GLASSES: "pickup_boys_glasses",
+    locationNames.PICKUP_HORN_RIMMED_GLASSES: "pickup_horn_rimmed_glasses",
+    locationNames.PICKUP_RED_GLASSES: "pickup_red_glasses",
+    locationNames.PICKUP_SUNGLASSES: "pickup_sunglasses",
+    locationNames.PICKUP_LOO_PAPER: "pickup_loo_paper",
+    locationNames.PICKUP_TOY_CAR: "pickup_toy_car",
+    locationNames.PICKUP_HAIRBRUSH: "pickup_hairbrush",
+    locationNames.PICKUP_TOOTHBRUSH: "pickup_toothbrush",
+    locationNames.PICKUP_STEREOSCOPE: "pickup_stereoscope",
+    locationNames.PICKUP_DISH_SOAP_BOTTLE: "pickup_dish_soap_bottle",
+    locationNames.PICKUP_TINNED_FOOD_BLUE: "pickup_food_cans",
+    locationNames.PICKUP_TINNED_FOOD_YELLOW: "pickup_food_cans",
+    locationNames.PICKUP_TINNED_FOOD_ORANGE: "pickup_food_cans",
+    locationNames.PICKUP_WEED_TOOL: "pickup_weed_tools",
+    locationNames.PICKUP_LILY_FLOWER: "pickup_lily_flower",
+    locationNames.PICKUP_ORANGE_1: "pickup_oranges",
+    locationNames.PICKUP_ORANGE_2: "pickup_oranges",
+    locationNames.PICKUP_ORANGE_3: "pickup_oranges",
+    locationNames.PICKUP_SHOP_TOMATO_1: "pickup_tomatoes_high_street",
+    locationNames.PICKUP_SHOP_TOMATO_2: "pickup_tomatoes_high_street",
+    locationNames.PICKUP_SHOP_TOMATO_3: "pickup_tomatoes_high_street",
+    locationNames.PICKUP_SHOP_CARROT_1: "pickup_carrots_high_street",
+    locationNames.PICKUP_SHOP_CARROT_2: "pickup_carrots_high_street",
+    locationNames.PICKUP_SHOP_CARROT_3: "pickup_carrots_high_street",
+    locationNames.PICKUP_CUCUMBER_1: "pickup_cucumbers",
+    locationNames.PICKUP_CUCUMBER_2: "pickup_cucumbers",
+    locationNames.PICKUP_CUCUMBER_3: "pickup_cucumbers",
+    locationNames.PICKUP_LEEK_1: "pickup_leeks",
+    locationNames.PICKUP_LEEK_2: "pickup_leeks",
+    locationNames.PICKUP_LEEK_3: "pickup_leeks",
+    locationNames.PICKUP_TOY_PLANE: "pickup_fusilage",
+    locationNames.PICKUP_PINT_BOTTLE_1: "pickup_pint_bottle_hub",
+    locationNames.PICKUP_PINT_BOTTLE_2: "pickup_pint_bottle_high_street",
+    locationNames.PICKUP_PINT_BOTTLE_3: "pickup_pint_bottle_high_street",
+    locationNames.PICKUP_SPRAY_BOTTLE: "pickup_spray_bottle",
+    locationNames.PICKUP_WALKIE_TALKIE_1: "pickup_walkie_talkies",
+    locationNames.PICKUP_WALKIE_TALKIE_2: "pickup_walkie_talkies",
+    locationNames.PICKUP_APPLE_CORE_1: "pickup_apple_cores",
+    locationNames.PICKUP_APPLE_CORE_2: "pickup_apple_cores",
+    locationNames.PICKUP_DUSTBIN_LID: "pickup_dustbin_lid",
+    locationNames.PICKUP_CHALK: "pickup_chalk",
+    locationNames.PICKUP_GARDEN_FORK: "pickup_weed_tools",
+    locationNames.PICKUP_RIBBON_RED: "pickup_red_bow",
+    locationNames.PICKUP_BLUE_RIBBON: "pickup_blue_bow",
+    locationNames.PICKUP_DUMMY: "pickup_dummy",
+    locationNames.PICKUP_CRICKET_BALL: "pickup_cricket_ball",
+    locationNames.PICKUP_BUST_PIPE: "pickup_bust_pipe",
+    locationNames.PICKUP_BUST_HAT: "pickup_bust_hat",
+    locationNames.PICKUP_BUST_GLASSES: "pickup_bust_glasses",
+    locationNames.PICKUP_SLIPPER_R: "pickup_slippers",
+    locationNames.PICKUP_SLIPPER_L: "pickup_slippers",
+    locationNames.PICKUP_TEA_CUP: "pickup_tea_cup",
+    locationNames.PICKUP_NEWSPAPER: "pickup_newspaper",
+    locationNames.PICKUP_SOCK_1: "pickup_socks",
+    locationNames.PICKUP_SOCK_2: "pickup_socks",
+    locationNames.PICKUP_VASE: "pickup_vase",
+    locationNames.PICKUP_POT_STACK: "pickup_pot_stack",
+    locationNames.PICKUP_SOAP: "pickup_soap",
+    locationNames.PICKUP_PAINTBRUSH: "pickup_paintbrush",
+    locationNames.PICKUP_VASE_PIECE_1: "pickup_vase_pieces",
+    locationNames.PICKUP_VASE_PIECE_2: "pickup_vase_pieces",
+    locationNames.PICKUP_BRA: "pickup_bra",
+    locationNames.PICKUP_BADMINTON_RACKET: "pickup_badminton_racket",
+    locationNames.PICKUP_ROSE: "pickup_rose",
+    locationNames.PICKUP_FISHING_BOBBER: "pickup_fishing_bobber",
+    locationNames.PICKUP_LETTER: "pickup_exit_letter",
+    locationNames.PICKUP_PLATE_1: "pickup_plates",
+    locationNames.PICKUP_PLATE_2: "pickup_plates",
+    locationNames.PICKUP_PLATE_3: "pickup_plates",
+    locationNames.PICKUP_GREEN_QUOIT_1: "pickup_green_quoits",
+    locationNames.PICKUP_GREEN_QUOIT_2: "pickup_green_quoits",
+    locationNames.PICKUP_GREEN_QUOIT_3: "pickup_green_quoits",
+    locationNames.PICKUP_RED_QUOIT_1: "pickup_red_quoits",
+    locationNames.PICKUP_RED_QUOIT_2: "pickup_red_quoits",
+    locationNames.PICKUP_RED_QUOIT_3: "pickup_red_quoits",
+    locationNames.PICKUP_FORK_1: "pickup_forks",
+    locationNames.PICKUP_FORK_2: "pickup_forks",
+    locationNames.PICKUP_KNIFE_1: "pickup_knives",
+    locationNames.PICKUP_KNIFE_2: "pickup_knives",
+    locationNames.PICKUP_CORK: "pickup_cork",
+    locationNames.PICKUP_CANDLESTICK: "pickup_candlestick",
+    locationNames.PICKUP_FLOWER_FOR_VASE: "pickup_vase_flower",
+    locationNames.PICKUP_DART_1: "pickup_darts",
+    locationNames.PICKUP_DART_2: "pickup_darts",
+    locationNames.PICKUP_DART_3: "pickup_darts",
+    locationNames.PICKUP_HARMONICA: "pickup_harmonica",
+    locationNames.PICKUP_PINT_GLASS: "pickup_pint_glass",
+    locationNames.PICKUP_TOY_BOAT: "pickup_toy_boat",
+    locationNames.PICKUP_OLD_MANS_WOOLEN_HAT: "pickup_woolen_hat",
+    locationNames.PICKUP_PEPPER_GRINDER: "pickup_pepper_grinder",
+    locationNames.PICKUP_PUB_WOMANS_CLOTH: "pickup_pub_woman_cloth",
+    locationNames.PICKUP_MINI_PERSON_CHILD: "pickup_people_miniatures",
+    locationNames.PICKUP_MINI_PERSON_JUMPSUIT: "pickup_people_miniatures",
+    locationNames.PICKUP_MINI_PERSON_GARDENER: "pickup_people_miniatures",
+    locationNames.PICKUP_MINI_PERSON_OLD_WOMAN: "pickup_people_miniatures",
+    locationNames.PICKUP_MINI_PERSON_POSTIE: "pickup_people_miniatures",
+    locationNames.PICKUP_MINI_PERSON_VEST_MAN: "pickup_people_miniatures",
+    locationNames.PICKUP_MINI_PERSON: "pickup_people_miniatures",
+    locationNames.PICKUP_MINI_GOOSE: "pickup_mini_goose",
+    locationNames.PICKUP_MINI_SHOVEL: "pickup_mini_shovel",
+    locationNames.PICKUP_POPPY_FLOWER: "pickup_poppy",
+    locationNames.PICKUP_MINI_PHONE_DOOR: "pickup_mini_phone_booth",
+    locationNames.PICKUP_MINI_MAIL_PILLAR: "pickup_mini_mail_pillar",
+    locationNames.PICKUP_TIMBER_HANDLE: "pickup_timber_handle",
+    locationNames.PICKUP_GOLDEN_BELL: "pickup_golden_bell",
+    locationNames.PICKUP_CARROT_1: "pickup_garden_carrots",
+    locationNames.PICKUP_CARROT_2: "pickup_garden_carrots",
+    locationNames.PICKUP_CARROT_3: "pickup_garden_carrots",
+    locationNames.PICKUP_CARROT_4: "pickup_garden_carrots",
+    locationNames.PICKUP_CARROT_5: "pickup_garden_carrots",
+    locationNames.PICKUP_CARROT_6: "pickup_garden_carrots",
+    locationNames.PICKUP_CARROT_7: "pickup_garden_carrots",
+    locationNames.PICKUP_CARROT_8: "pickup_garden_carrots",
+    locationNames.PICKUP_CARROT_9: "pickup_garden_carrots",
+    locationNames.PICKUP_CARROT_10: "pickup_garden_carrots",
+    locationNames.PICKUP_PUB_TOMATO_1: "pickup_pub_boxed_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_2: "pickup_pub_boxed_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_3: "pickup_pub_boxed_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_4: "pickup_pub_boxed_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_5: "pickup_pub_boxed_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_6: "pickup_pub_boxed_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_7: "pickup_pub_boxed_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_8: "pickup_pub_boxed_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_9: "pickup_pub_boxed_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_10: "pickup_pub_open_tomatoes",
+    locationNames.PICKUP_PUB_TOMATO_11: "pickup_pub_open_tomatoes",
+    locationNames.PICKUP_BOOT_START: "pickup_boots",
+    locationNames.PICKUP_BOOT_HUB: "pickup_boots",
+}
+
+# Item Drag Rules
+drag_rules: Dict[str, str] = {
+    locationNames.DRAG_RAKE: "drag_rake",
+    locationNames.DRAG_PICNIC_BASKET: "drag_picnic_basket",
+    locationNames.DRAG_ESKY: "drag_esky",
+    locationNames.DRAG_SHOVEL: "drag_shovel",
+    locationNames.DRAG_PUMKPIN_1: "drag_pumpkins",
+    locationNames.DRAG_PUMKPIN_2: "drag_pumpkins",
+    locationNames.DRAG_PUMKPIN_3: "drag_pumpkins",
+    locationNames.DRAG_PUMKPIN_4: "drag_pumpkins",
+    locationNames.DRAG_WATERING_CAN: "drag_watering_can",
+    locationNames.DRAG_GUMBOOT_1: "drag_gumboots",
+    locationNames.DRAG_GUMBOOT_2: "drag_gumboots",
+    locationNames.DRAG_NO_GOOSE_SIGN_GARDEN: "drag_gardener_sign",
+    locationNames.DRAG_WOODEN_CRATE: "drag_wooden_crate",
+    locationNames.DRAG_FENCE_BOLT: "drag_fence_bolt",
+    locationNames.DRAG_MALLET: "drag_mallet",
+    locationNames.DRAG_SHOPPING_BASKET: "drag_shopping_basket",
+    locationNames.DRAG_UMBRELLA_BLACK: "drag_umbrellas",
+    locationNames.DRAG_UMBRELLA_RAINBOW: "drag_umbrellas",
+    locationNames.DRAG_UMBRELLA_RED: "drag_umbrellas",
+    locationNames.DRAG_PUSH_BROOM: "drag_push_broom",
+    locationNames.DRAG_BROKEN_BROOM_HEAD: "drag_broom_head",
+    locationNames.DRAG_DUSTBIN: "drag_dustbin",
+    locationNames.DRAG_BABY_DOLL: "drag_baby_doll",
+    locationNames.DRAG_PRICING_GUN: "drag_pricing_gun",
+    locationNames.DRAG_ADDING_MACHINE: "drag_adding_machine",
+    locationNames.DRAG_ROSE_BOX: "drag_rose_box",
+    locationNames.DRAG_CRICKET_BAT: "drag_cricket_bat",
+    locationNames.DRAG_TEA_POT: "drag_tea_pot",
+    locationNames.DRAG_CLIPPERS: "drag_clippers",
+    locationNames.DRAG_DUCK_STATUE: "drag_duck_statue",
+    locationNames.DRAG_FROG_STATUE: "drag_frog_statue",
+    locationNames.DRAG_JEREMY_FISH: "drag_jeremy_fish",
+    locationNames.DRAG_NO_GOOSE_SIGN_MESSY: "drag_messy_sign",
+    locationNames.DRAG_DRAWER: "drag_drawer",
+    locationNames.DRAG_ENAMEL_JUG: "drag_enamel_jug",
+    locationNames.DRAG_NO_GOOSE_SIGN_CLEAN: "drag_clean_sign",
+    locationNames.DRAG_TACKLE_BOX: "drag_tackle_box",
+    locationNames.DRAG_TRAFFIC_CONE: "drag_traffic_cone",
+    locationNames.DRAG_PARCEL: "drag_exit_parcel",
+    locationNames.DRAG_STEALTH_BOX: "drag_stealth_box",
+    locationNames.DRAG_NO_GOOSE_SIGN_PUB: "drag_no_goose_sign",
+    locationNames.DRAG_PORTABLE_STOOL: "drag_portable_stool",
+    locationNames.DRAG_DARTBOARD: "drag_dartboard",
+    locationNames.DRAG_MOP_BUCKET: "drag_mop_bucket",
+    locationNames.DRAG_MOP: "drag_mop",
+    locationNames.DRAG_DELIVERY_BOX: "drag_delivery_box",
+    locationNames.DRAG_BUCKET: "drag_burly_mans_bucket",
+    locationNames.DRAG_MINI_BENCH: "drag_mini_benches",
+    locationNames.DRAG_MINI_PUMP: "drag_mini_pump",
+    locationNames.DRAG_MINI_STREET_BENCH: "drag_mini_benches",
+    locationNames.DRAG_MINI_BIRDBATH: "drag_mini_birdbath",
+    locationNames.DRAG_MINI_EASEL: "drag_mini_easel",
+    locationNames.DRAG_MINI_SUN_LOUNGE: "drag_sun_lounge",
+    locationNames.DRAG_TOPSOIL_BAG_1: "drag_topsoil_bags",
+    locationNames.DRAG_TOPSOIL_BAG_2: "drag_topsoil_bags",
+    locationNames.DRAG_TOPSOIL_BAG_3: "drag_topsoil_bags",
+}
+
+# Interaction Rules
+interaction_rules: Dict[str, str] = {
+    locationNames.INTERACT_BIKE_BELL: "interact_bike_bell",
+    locationNames.INTERACT_GARDEN_TAP: "interact_garden_water",
+    locationNames.INTERACT_SPRINKLER: "interact_garden_water",
+    locationNames.INTERACT_UNPLUG_RADIO: "interact_radio",
+    locationNames.INTERACT_UMBRELLA_BLACK: "interact_umbrellas",
+    locationNames.INTERACT_UMBRELLA_RAINBOW: "interact_umbrellas",
+    locationNames.INTERACT_UMBRELLA_RED: "interact_umbrellas",
+    locationNames.INTERACT_BOYS_LACES_L: "interact_boys_laces",
+    locationNames.INTERACT_BOYS_LACES_R: "interact_boys_laces",
+    locationNames.INTERACT_FOOTBALL: "interact_football",
+    locationNames.INTERACT_RING_BELL: "interact_back_gardens_objects",
+    locationNames.INTERACT_WINDMILL: "interact_back_gardens_objects",
+    locationNames.INTERACT_PURPLE_FLOWER: "interact_back_gardens_objects",
+    locationNames.INTERACT_TRELLIS: "interact_trellis",
+    locationNames.INTERACT_SUNFLOWER: "interact_back_gardens_objects",
+    locationNames.INTERACT_TOPIARY: "interact_back_gardens_objects",
+    locationNames.INTERACT_WIND_CHIME_C: "interact_back_gardens_objects",
+    locationNames.INTERACT_WIND_CHIME_D: "interact_back_gardens_objects",
+    locationNames.INTERACT_WIND_CHIME_E: "interact_back_gardens_objects",
+    locationNames.INTERACT_WIND_CHIME_F: "interact_back_gardens_objects",
+    locationNames.INTERACT_WIND_CHIME_G: "interact_back_gardens_objects",
+    locationNames.INTERACT_WIND_CHIME_A: "interact_back_gardens_objects",
+    locationNames.INTERACT_WIND_CHIME_B: "interact_back_gardens_objects",
+    locationNames.INTERACT_VAN_DOOR_L: "interact_van_doors",
+    locationNames.INTERACT_VAN_DOOR_R: "interact_van_doors",
+    locationNames.INTERACT_BURLY_MANS_LACES_L: "interact_burly_laces",
+    locationNames.INTERACT_BURLY_MANS_LACES_R: "interact_burly_laces",
+    locationNames.INTERACT_PUB_TAP: "interact_pub_tap",
+    locationNames.INTERACT_WELL: "interact_well",
+}
+
+# New Tasks Rules
+new_tasks_rules: Dict[str, str] = {
+    locationNames.SHORT_OUT_RADIO: "short_out_radio",
+    locationNames.LOCK_GROUNDSKEEPER_IN: "lock_groundskeeper_out",
+    locationNames.OPEN_INTRO_GATE: "interact_intro_gate",
+    locationNames.DROP_MAIL_IN_WELL: "drop_mail_in_well",
+    locationNames.BREAK_THROUGH_BOARDS: "interact_boards",
+    locationNames.MAKE_WOMAN_FIX_TOPIARY: "interact_make_woman_fix_topiary",
+    locationNames.POSE_AS_DUCK: "pose_as_duck_statue",
+    locationNames.DRESS_UP_BUSH: "dress_up_bush",
+    locationNames.INTERIOR_REDECORATING: "drag_messy_sign",
+    locationNames.TRIP_BURLY_MAN: "interact_burly_laces",
+    locationNames.BREAK_PINT_GLASS: "pickup_pint_glass",
+    locationNames.TRAP_TV_SHOP_OWNER_GARAGE: "trap_tv_shop_owner_in_garage",
+    locationNames.PERFORM_WITH_HARMONICA: "perform_with_harmonica",
+}
+
+# Model Church Pecking Rules
+church_first_peck_rules: Dict[str, str] = {
+    locationNames.PECK_DOORWAY: "peck_church",
+    locationNames.PECK_TOWER: "peck_church",
+}
+
+church_all_peck_rules: Dict[str, str] = {
+    locationNames.PECK_DOORWAY_1: "peck_church",
+    locationNames.PECK_DOORWAY_2: "peck_church",
+    locationNames.PECK_DOORWAY_3: "peck_church",
+    locationNames.PECK_DOORWAY_4: "peck_church",
+    locationNames.PECK_DOORWAY_5: "peck_church",
+    locationNames.PECK_DOORWAY_6: "peck_church",
+    locationNames.PECK_DOORWAY_7: "peck_church",
+    locationNames.PECK_DOORWAY_8: "peck_church",
+    locationNames.PECK_DOORWAY_9: "peck_church",
+    locationNames.PECK_DOORWAY_10: "peck_church",
+    locationNames.PECK_DOORWAY_11: "peck_church",
+    locationNames.PECK_DOORWAY_12: "peck_church",
+    locationNames.PECK_DOORWAY_13: "peck_church",
+    locationNames.PECK_DOORWAY_14: "peck_church",
+    locationNames.PECK_DOORWAY_15: "peck_church",
+    locationNames.PECK_DOORWAY_16: "peck_church",
+    locationNames.PECK_DOORWAY_17: "peck_church",
+    locationNames.PECK_DOORWAY_18: "peck_church",
+    locationNames.PECK_DOORWAY_19: "peck_church",
+    locationNames.PECK_TOWER_1: "peck_church",
+    locationNames.PECK_TOWER_2: "peck_church",
+    locationNames.PECK_TOWER_3: "peck_church",
+    locationNames.PECK_TOWER_4: "peck_church",
+    locationNames.PECK_TOWER_5: "peck_church",
+    locationNames.PECK_TOWER_6: "peck_church",
+    locationNames.PECK_TOWER_7: "peck_church",
+    locationNames.PECK_TOWER_8: "peck_church",
+    locationNames.PECK_TOWER_9: "peck_church",
+    locationNames.PECK_TOWER_10: "peck_church",
+    locationNames.PECK_TOWER_11: "peck_church",
+    locationNames.PECK_TOWER_12: "peck_church",
+    locationNames.PECK_TOWER_13: "peck_church",
+    locationNames.PECK_TOWER_14: "peck_church",
+    locationNames.PECK_TOWER_15: "peck_church",
+    locationNames.PECK_TOWER_16: "peck_church",
+}
+
+# Milestone Rules
+all_milestone_rules: Dict[str, str] = {
+    locationNames.MILESTONE_ALL_GARDEN: "all_garden_tasks",
+    locationNames.MILESTONE_ALL_HIGH_STREET: "all_high_street_tasks",
+    locationNames.MILESTONE_ALL_BACK_GARDENS: "all_back_gardens_tasks",
+    locationNames.MILESTONE_ALL_PUB: "all_pub_tasks",
+    locationNames.MILESTONE_ALL_MAIN: "all_main_task_lists",
+    locationNames.MILESTONE_ALL_EXTRA: "all_to_do_as_well_tasks",
+    locationNames.MILESTONE_ALL_SPEEDRUN: "all_speedrun_tasks",
+    locationNames.MILESTONE_ALL_TASKS: "all_tasks_complete",
+}
+
+non_speedrun_milestone_rules: Dict[str, str] = {
+    locationNames.MILESTONE_ALL_GARDEN: "all_garden_tasks",
+    locationNames.MILESTONE_ALL_HIGH_STREET: "all_high_street_tasks",
+    locationNames.MILESTONE_ALL_BACK_GARDENS: "all_back_gardens_tasks",
+    locationNames.MILESTONE_ALL_PUB: "all_pub_tasks",
+    locationNames.MILESTONE_ALL_MAIN: "all_main_task_lists",
+    locationNames.MILESTONE_ALL_EXTRA: "all_to_do_as_well_tasks",
+}
+
+non_to_do_as_well_milestone_rules: Dict[str, str] = {
+    locationNames.MILESTONE_ALL_GARDEN: "all_garden_tasks",
+    locationNames.MILESTONE_ALL_HIGH_STREET: "all_high_street_tasks",
+    locationNames.MILESTONE_ALL_BACK_GARDENS: "all_back_gardens_tasks",
+    locationNames.MILESTONE_ALL_PUB: "all_pub_tasks",
+    locationNames.MILESTONE_ALL_MAIN: "all_main_task_lists",
+    locationNames.MILESTONE_ALL_SPEEDRUN: "all_speedrun_tasks",
+}
+
+basic_milestone_rules: Dict[str, str] = {
+    locationNames.MILESTONE_ALL_GARDEN: "all_garden_tasks",
+    locationNames.MILESTONE_ALL_HIGH_STREET: "all_high_street_tasks",
+    locationNames.MILESTONE_ALL_BACK_GARDENS: "all_back_gardens_tasks",
+    locationNames.MILESTONE_ALL_PUB: "all_pub_tasks",
+    locationNames.MILESTONE_ALL_MAIN: "all_main_task_lists",
+}
+
+# Goals
+simple_goal_rules: Dict[str, str] = {
+    locationNames.GOAL_MODEL_VILLAGE_ENTRY: "get_into_model_village",
+}
+
+all_main_tasks_goal_rules: Dict[str, str] = {
+    locationNames.GOAL_ALL_MAIN: "all_main_task_lists",
+}
+
+all_speedrun_tasks_goal_rules: Dict[str, str] = {
+    locationNames.GOAL_ALL_SPEEDRUN: "all_speedrun_tasks",
+}
+
+all_non_speedrun_tasks_goal_rules: Dict[str, str] = {
+    locationNames.GOAL_ALL_NON_SPEEDRUN: "all_non_speedrun_tasks",
+}
+
+all_tasks_goal_rules: Dict[str, str] = {
+    locationNames.GOAL_ALL_TASKS: "all_tasks_complete",
+}
+
+four_final_tasks_rules: Dict[str, str] = {
+    locationNames.GOAL_ALL_FINAL_TASKS: "four_final_tasks",
+}
+
+# Main Task Rules
+main_tasks_rules: Dict[str, str] = {
+    locationNames.TASK_GARDEN_ENTRY: "get_into_garden",
+    locationNames.TASK_GARDEN_WET: "get_groundskeeper_wet",
+    locationNames.TASK_GARDEN_KEYS: "steal_groundskeepers_keys",
+    locationNames.TASK_GARDEN_HAT: "make_groundskeeper_wear_sun_hat",
+    locationNames.TASK_GARDEN_RAKE: "rake_in_lake",
+    locationNames.TASK_GARDEN_PICNIC: "picnic",
+    locationNames.TASK_GARDEN_FINAL: "make_groundskeeper_hammer_thumb",
+    locationNames.TASK_HIGH_STREET_BROOM: "break_broom",
+    locationNames.TASK_HIGH_STREET_PHONE: "trap_boy_in_phone_booth",
+    locationNames.TASK_HIGH_STREET_GLASSES: "make_boy_wear_wrong_glasses",
+    locationNames.TASK_HIGH_STREET_BUY: "make_someone_buyback",
+    locationNames.TASK_HIGH_STREET_TV: "get_on_tv",
+    locationNames.TASK_HIGH_STREET_SHOPPING: "go_shopping",
+    locationNames.TASK_HIGH_STREET_FINAL: "trap_shopkeep_in_garage",
+    locationNames.TASK_BACK_GARDENS_VASE: "make_someone_break_vase",
+    locationNames.TASK_BACK_GARDENS_BUST: "dress_up_bust",
+    locationNames.TASK_BACK_GARDENS_TEA: "make_man_spit_out_tea",
+    locationNames.TASK_BACK_GARDENS_RIBBON: "get_dressed_up",
+    locationNames.TASK_BACK_GARDENS_BAREFOOT: "make_man_barefoot",
+    locationNames.TASK_BACK_GARDENS_WASHING: "do_washing",
+    locationNames.TASK_BACK_GARDENS_FINAL: "make_someone_prune_rose",
+    locationNames.TASK_PUB_ENTRY: "get_into_pub",
+    locationNames.TASK_PUB_DARTBOARD: "break_dartboard",
+    locationNames.TASK_PUB_BOAT: "get_toy_boat",
+    locationNames.TASK_PUB_BUM: "make_old_man_fall_on_bum",
+    locationNames.TASK_PUB_FLOWER: "be_awarded_flower",
+    locationNames.TASK_PUB_PINT: "drop_pint_glass_in_canal",
+    locationNames.TASK_PUB_TABLE: "set_table",
+    locationNames.TASK_PUB_FINAL: "drop_bucket_on_burly_man",
+}
+
+# Model Village Rules/Victory Rules
+victory_rules: Dict[str, str] = {
+    locationNames.TASK_MODEL_VILLAGE_ENTRY: "get_into_model_village",
+    locationNames.TASK_MODEL_VILLAGE_BELL: "steal_bell",
+    locationNames.TASK_MODEL_VILLAGE_VICTORY: "steal_bell",
+}
+
+# The rule on each area's entrance from the Hub, by the region it leads to
+area_entrance_rules: Dict[str, str] = {
+    regionNames.GARDEN: "has_garden",
+    regionNames.HIGH_STREET: "has_high_street",
+    regionNames.BACK_GARDENS: "has_back_gardens",
+    regionNames.PUB: "has_pub",
+    regionNames.MODEL_VILLAGE: "has_model_village",
+}
+
+
+class UntitledGooseRules:
+    world: "GooseGameWorld"
+
+    def __init__(self, world: "GooseGameWorld") -> None:
+        self.player = world.player
+        self.world = world
         
-        # Model Village Rules/Victory Rules
-        self.victory_rules = {
-            locationNames.TASK_MODEL_VILLAGE_ENTRY: self.get_into_model_village,
-            locationNames.TASK_MODEL_VILLAGE_BELL: self.steal_bell,
-            locationNames.TASK_MODEL_VILLAGE_VICTORY: self.steal_bell,
-        }
+        # Every rule below is a Requirement built once here, with option-dependent soul checks already folded away
+        self.region_requirements: Dict[Region, int] = {}
+        self.simplified_rules: Dict[Tuple[Requirement, int], Requirement] = {}
+        self.region_gate_mismatches: List[str] = []
     
     
     # ----- Region Defs -----
     
-    def has_area(self, state: CollectionState, area) -> bool:
-        return state.has(f"{area} Access", self.player)
+    def has_item(self, item) -> Requirement:
+        return has(item, self.player)
+    
+    def has_area(self, area) -> Requirement:
+        return self.has_item(f"{area} Access")
 
-    def has_garden(self, state: CollectionState) -> bool:
-        return self.has_area(state, regionNames.GARDEN)
+    @memoized_rule
+    def has_garden(self) -> Requirement:
+        return self.has_area(regionNames.GARDEN)
 
-    def has_high_street(self, state: CollectionState) -> bool:
-        return self.has_area(state, regionNames.HIGH_STREET)
+    @memoized_rule
+    def has_high_street(self) -> Requirement:
+        return self.has_area(regionNames.HIGH_STREET)
 
-    def has_back_gardens(self, state: CollectionState) -> bool:
-        return self.has_area(state, regionNames.BACK_GARDENS)
+    @memoized_rule
+    def has_back_gardens(self) -> Requirement:
+        return self.has_area(regionNames.BACK_GARDENS)
 
-    def has_pub(self, state: CollectionState) -> bool:
-        return self.has_area(state, regionNames.PUB)
+    @memoized_rule
+    def has_pub(self) -> Requirement:
+        return self.has_area(regionNames.PUB)
 
-    def has_model_village(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def has_model_village(self) -> Requirement:
         return (
-            self.has_area(state, regionNames.PUB)
-            and self.has_area(state, regionNames.MODEL_VILLAGE)
+            self.has_area(regionNames.PUB)
+            & self.has_area(regionNames.MODEL_VILLAGE)
         )
     
     
     # ----- Souls Defs -----
+    # With souls turned off these fold to TRUE, which drops them from every rule they appear in
 
-    def has_npc(self, state: CollectionState, npc_soul) -> bool:
+    def has_npc(self, npc_soul) -> Requirement:
         if self.world.options.include_npc_souls.value:
-            return state.has(f"{npc_soul}", self.player)
-        return True
+            return self.has_item(npc_soul)
+        return TRUE
     
-    def has_prop(self, state: CollectionState, prop) -> bool:
+    def has_prop(self, prop) -> Requirement:
         if self.world.options.include_prop_souls.value:
-            return state.has(f"{prop}", self.player)
-        return True
+            return self.has_item(prop)
+        return TRUE
+    
+    def has_soul(self, soul) -> Requirement:
+        if soul in ITEM_GROUPS["NPC Souls"]:
+            return self.has_npc(soul)
+        return self.has_prop(soul)
     
     
     # ----- Garden Task Rule Defs -----
     
-    def get_into_garden(self, state: CollectionState) -> bool:
-        return self.has_garden(state)
+    @memoized_rule
+    def get_into_garden(self) -> Requirement:
+        return self.has_garden
     
-    def get_groundskeeper_wet(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def get_groundskeeper_wet(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
+            self.has_garden
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
         )
     
-    def steal_groundskeepers_keys(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def steal_groundskeepers_keys(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
+            self.has_garden
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
         )
     
-    def make_groundskeeper_wear_sun_hat(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def make_groundskeeper_wear_sun_hat(self) -> Requirement:
         return (
-            self.pickup_grounsdkeepers_hat(state)
-            and self.has_prop(state, itemNames.PROP_STRAW_HAT)
+            self.pickup_grounsdkeepers_hat
+            & self.has_prop(itemNames.PROP_STRAW_HAT)
         )
     
-    def rake_in_lake(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def rake_in_lake(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_RAKE)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_RAKE)
         )
     
-    def picnic(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def picnic(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_SANDWICH)
-            and self.has_prop(state, itemNames.PROP_APPLES)
-            and self.has_prop(state, itemNames.PROP_PUMPKINS)
-            and self.has_prop(state, itemNames.PROP_CARROTS)
-            and self.has_prop(state, itemNames.PROP_JAM)
-            and self.has_prop(state, itemNames.PROP_THERMOS)
-            and self.has_prop(state, itemNames.PROP_RADIO)
-            and self.has_prop(state, itemNames.PROP_PICNIC_BASKET)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_SANDWICH)
+            & self.has_prop(itemNames.PROP_APPLES)
+            & self.has_prop(itemNames.PROP_PUMPKINS)
+            & self.has_prop(itemNames.PROP_CARROTS)
+            & self.has_prop(itemNames.PROP_JAM)
+            & self.has_prop(itemNames.PROP_THERMOS)
+            & self.has_prop(itemNames.PROP_RADIO)
+            & self.has_prop(itemNames.PROP_PICNIC_BASKET)
         )
     
-    def make_groundskeeper_hammer_thumb(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_garden(state):
-            task_count += 1
-        if self.get_groundskeeper_wet(state):
-            task_count += 1
-        if self.steal_groundskeepers_keys(state):
-            task_count += 1
-        if self.make_groundskeeper_wear_sun_hat(state):
-            task_count += 1
-        if self.rake_in_lake(state):
-            task_count += 1
-        if self.picnic(state):
-            task_count += 1
-        
+    @memoized_rule
+    def make_groundskeeper_hammer_thumb(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-            and self.has_prop(state, itemNames.PROP_MALLET)
-            and task_count >= 5
+            self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+            & self.has_prop(itemNames.PROP_MALLET)
+            & at_least(
+                5,
+                self.get_into_garden,
+                self.get_groundskeeper_wet,
+                self.steal_groundskeepers_keys,
+                self.make_groundskeeper_wear_sun_hat,
+                self.rake_in_lake,
+                self.picnic,
+            )
         )
     
     
     # ----- High Street Task Rule Defs -----
     
-    def break_broom(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def break_broom(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_PUSH_BROOM)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_PUSH_BROOM)
         )
     
-    def trap_boy_in_phone_booth(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def trap_boy_in_phone_booth(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
-            and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-            and self.has_prop(state, itemNames.PROP_GARAGE_ROPE)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_BOY)
+            & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+            & self.has_prop(itemNames.PROP_GARAGE_ROPE)
         )
     
-    def make_boy_wear_wrong_glasses(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def make_boy_wear_wrong_glasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
-            and (
-                self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES)
-                or self.has_prop(state, itemNames.PROP_RED_GLASSES) 
-                or self.has_prop(state, itemNames.PROP_SUNGLASSES)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_BOY)
+            & (
+                self.has_prop(itemNames.PROP_HORN_RIMMED_GLASSES)
+                | self.has_prop(itemNames.PROP_RED_GLASSES) 
+                | self.has_prop(itemNames.PROP_SUNGLASSES)
             )
         )
     
-    def make_someone_buyback(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def make_someone_buyback(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and (
-                self.has_npc(state, itemNames.NPC_BOY) and self.has_prop(state, itemNames.PROP_TOY_PLANE)
-                or self.has_garden(state) and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER) and self.has_prop(state, itemNames.PROP_TROWEL)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & (
+                self.has_npc(itemNames.NPC_BOY) & self.has_prop(itemNames.PROP_TOY_PLANE)
+                | self.has_garden & self.has_npc(itemNames.NPC_GROUNDSKEEPER) & self.has_prop(itemNames.PROP_TROWEL)
             )
         )
     
-    def get_on_tv(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def get_on_tv(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-            and (
-                self.has_npc(state, itemNames.NPC_BOY)
-                or self.has_prop(state, itemNames.PROP_WALKIE_TALKIES)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+            & (
+                self.has_npc(itemNames.NPC_BOY)
+                | self.has_prop(itemNames.PROP_WALKIE_TALKIES)
             )
         )
     
-    def go_shopping(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def go_shopping(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_SHOPPING_BASKET)
-            and self.has_prop(state, itemNames.PROP_TOOTHRBRUSH)
-            and self.has_prop(state, itemNames.PROP_HAIRBRUSH)
-            and self.has_prop(state, itemNames.PROP_LOO_PAPER)
-            and self.has_prop(state, itemNames.PROP_TINNED_FOOD)
-            and (
-                self.has_prop(state, itemNames.PROP_DISH_SOAP_BOTTLE)
-                or self.has_prop(state, itemNames.PROP_SPRAY_BOTTLE)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_SHOPPING_BASKET)
+            & self.has_prop(itemNames.PROP_TOOTHRBRUSH)
+            & self.has_prop(itemNames.PROP_HAIRBRUSH)
+            & self.has_prop(itemNames.PROP_LOO_PAPER)
+            & self.has_prop(itemNames.PROP_TINNED_FOOD)
+            & (
+                self.has_prop(itemNames.PROP_DISH_SOAP_BOTTLE)
+                | self.has_prop(itemNames.PROP_SPRAY_BOTTLE)
             )
-            and (
-                self.has_prop(state, itemNames.PROP_ORANGES)
-                or self.has_prop(state, itemNames.PROP_CUCUMBERS)
-                or self.has_prop(state, itemNames.PROP_LEEKS)
-                or self.has_prop(state, itemNames.PROP_CARROTS)
-                or self.has_prop(state, itemNames.PROP_TOMATOES)
+            & (
+                self.has_prop(itemNames.PROP_ORANGES)
+                | self.has_prop(itemNames.PROP_CUCUMBERS)
+                | self.has_prop(itemNames.PROP_LEEKS)
+                | self.has_prop(itemNames.PROP_CARROTS)
+                | self.has_prop(itemNames.PROP_TOMATOES)
                 # TO DO: Test if apple cores work
-                or self.has_garden(state) and self.has_prop(state, itemNames.PROP_APPLES)
+                | self.has_garden & self.has_prop(itemNames.PROP_APPLES)
             )
         )
     
-    def trap_shopkeep_in_garage(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.break_broom(state):
-            task_count += 1
-        if self.trap_boy_in_phone_booth(state):
-            task_count += 1
-        if self.make_boy_wear_wrong_glasses(state):
-            task_count += 1
-        if self.make_someone_buyback(state):
-            task_count += 1
-        if self.get_on_tv(state):
-            task_count += 1
-        if self.go_shopping(state):
-            task_count += 1
-        
-        return (
-            self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_CHALK)
-            and self.has_prop(state, itemNames.PROP_GARAGE_ROPE)
-            and task_count >= 5
+    @memoized_rule
+    def trap_shopkeep_in_garage(self) -> Requirement:
+        return (
+            self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_CHALK)
+            & self.has_prop(itemNames.PROP_GARAGE_ROPE)
+            & at_least(
+                5,
+                self.break_broom,
+                self.trap_boy_in_phone_booth,
+                self.make_boy_wear_wrong_glasses,
+                self.make_someone_buyback,
+                self.get_on_tv,
+                self.go_shopping,
+            )
         )
     
     
     # ----- Back Gardens Task Rule Defs -----
     
-    def make_someone_break_vase(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def make_someone_break_vase(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_VASE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_VASE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def make_man_spit_out_tea(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def make_man_spit_out_tea(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_TEA_CUP)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_TEA_CUP)
         )
     
-    def get_dressed_up(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def get_dressed_up(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DUCK_STATUE)
-            and self.has_prop(state, itemNames.PROP_RIBBONS)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DUCK_STATUE)
+            & self.has_prop(itemNames.PROP_RIBBONS)
         )
     
-    def make_man_barefoot(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def make_man_barefoot(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
         )
     
-    def do_washing(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def do_washing(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and self.has_prop(state, itemNames.PROP_SOCKS)
-            and self.has_prop(state, itemNames.PROP_BRA)
-            and self.has_prop(state, itemNames.PROP_SOAP)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & self.has_prop(itemNames.PROP_SOCKS)
+            & self.has_prop(itemNames.PROP_BRA)
+            & self.has_prop(itemNames.PROP_SOAP)
         )
     
-    def dress_up_bust(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def dress_up_bust(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and (
-                self.has_prop(state, itemNames.PROP_BUST_HAT)
-                or self.has_garden(state) and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-                or self.has_pub(state) and (
-                    self.has_prop(state, itemNames.PROP_TRAFFIC_CONE)
-                    or self.has_npc(state, itemNames.NPC_OLD_MAN)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & (
+                self.has_prop(itemNames.PROP_BUST_HAT)
+                | self.has_garden & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+                | self.has_pub & (
+                    self.has_prop(itemNames.PROP_TRAFFIC_CONE)
+                    | self.has_npc(itemNames.NPC_OLD_MAN)
                 )
             )
-            and (
-                self.has_prop(state, itemNames.PROP_BUST_GLASSES)
-                or self.has_high_street(state) and (
-                    self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES)
-                    or self.has_prop(state, itemNames.PROP_RED_GLASSES)
-                    or self.has_prop(state, itemNames.PROP_SUNGLASSES)
-                    or self.has_prop(state, itemNames.PROP_STEREOSCOPE)
-                    or self.has_npc(state, itemNames.NPC_BOY)
+            & (
+                self.has_prop(itemNames.PROP_BUST_GLASSES)
+                | self.has_high_street & (
+                    self.has_prop(itemNames.PROP_HORN_RIMMED_GLASSES)
+                    | self.has_prop(itemNames.PROP_RED_GLASSES)
+                    | self.has_prop(itemNames.PROP_SUNGLASSES)
+                    | self.has_prop(itemNames.PROP_STEREOSCOPE)
+                    | self.has_npc(itemNames.NPC_BOY)
                 )
             )
-            and (
-                self.has_prop(state, itemNames.PROP_BUST_PIPE)
-                or self.has_prop(state, itemNames.PROP_DUMMY)
-                or self.has_garden(state) and self.has_prop(state, itemNames.PROP_TULIP)
-                or self.has_high_street(state) and (
-                    self.has_prop(state, itemNames.PROP_TOOTHRBRUSH)
-                    or self.has_prop(state, itemNames.PROP_LILY_FLOWER)
+            & (
+                self.has_prop(itemNames.PROP_BUST_PIPE)
+                | self.has_prop(itemNames.PROP_DUMMY)
+                | self.has_garden & self.has_prop(itemNames.PROP_TULIP)
+                | self.has_high_street & (
+                    self.has_prop(itemNames.PROP_TOOTHRBRUSH)
+                    | self.has_prop(itemNames.PROP_LILY_FLOWER)
                 )
-                or self.has_pub(state) and (
-                    self.has_prop(state, itemNames.PROP_KNIVES)
-                    or self.has_prop(state, itemNames.PROP_FORKS)
-                    or self.has_prop(state, itemNames.PROP_HARMONICA)
-                    or self.has_npc(state, itemNames.NPC_FANCY_LADIES) and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
+                | self.has_pub & (
+                    self.has_prop(itemNames.PROP_KNIVES)
+                    | self.has_prop(itemNames.PROP_FORKS)
+                    | self.has_prop(itemNames.PROP_HARMONICA)
+                    | self.has_npc(itemNames.NPC_FANCY_LADIES) & self.has_prop(itemNames.PROP_FLOWER_FOR_VASE)
                 )
-                or self.has_model_village(state) and self.has_prop(state, itemNames.PROP_POPPY_FLOWER)
-                or ( # Rose from completing all other Back Gardens tasks
-                    self.make_someone_break_vase(state)
-                    and self.make_man_spit_out_tea(state)
-                    and self.get_dressed_up(state)
-                    and self.make_man_barefoot(state)
-                    and self.do_washing(state)
-                    and self.has_prop(state, itemNames.PROP_ROSE)
-                    and self.has_prop(state, itemNames.PROP_ROSE_BOX)
-                    and self.has_prop(state, itemNames.PROP_CLIPPERS)
-                    and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
+                | self.has_model_village & self.has_prop(itemNames.PROP_POPPY_FLOWER)
+                | ( # Rose from completing all other Back Gardens tasks
+                    self.make_someone_break_vase
+                    & self.make_man_spit_out_tea
+                    & self.get_dressed_up
+                    & self.make_man_barefoot
+                    & self.do_washing
+                    & self.has_prop(itemNames.PROP_ROSE)
+                    & self.has_prop(itemNames.PROP_ROSE_BOX)
+                    & self.has_prop(itemNames.PROP_CLIPPERS)
+                    & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
                 )
             )
         )
     
-    def make_someone_prune_rose(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.make_someone_break_vase(state):
-            task_count += 1
-        if self.make_man_spit_out_tea(state):
-            task_count += 1
-        if self.get_dressed_up(state):
-            task_count += 1
-        if self.make_man_barefoot(state):
-            task_count += 1
-        if self.do_washing(state):
-            task_count += 1
-        if self.dress_up_bust(state):
-            task_count += 1
-        
-        return (
-            self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and self.has_prop(state, itemNames.PROP_ROSE)
-            and self.has_prop(state, itemNames.PROP_ROSE_BOX)
-            and self.has_prop(state, itemNames.PROP_CLIPPERS)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
-            and task_count >= 5
+    @memoized_rule
+    def make_someone_prune_rose(self) -> Requirement:
+        return (
+            self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & self.has_prop(itemNames.PROP_ROSE)
+            & self.has_prop(itemNames.PROP_ROSE_BOX)
+            & self.has_prop(itemNames.PROP_CLIPPERS)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
+            & at_least(
+                5,
+                self.make_someone_break_vase,
+                self.make_man_spit_out_tea,
+                self.get_dressed_up,
+                self.make_man_barefoot,
+                self.do_washing,
+                self.dress_up_bust,
+            )
         )
     
     
     # ----- Pub Task Rule Defs -----
     
-    def get_into_pub(self, state: CollectionState) -> bool:
-        return self.has_pub(state)
+    @memoized_rule
+    def get_into_pub(self) -> Requirement:
+        return self.has_pub
     
-    def break_dartboard(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def break_dartboard(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_OLD_MAN)
-            and self.has_prop(state, itemNames.PROP_DARTBOARD)
+            self.has_pub
+            & self.has_npc(itemNames.NPC_OLD_MAN)
+            & self.has_prop(itemNames.PROP_DARTBOARD)
         )
     
-    def get_toy_boat(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def get_toy_boat(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TOY_BOAT)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_TOY_BOAT)
         )
     
-    def make_old_man_fall_on_bum(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def make_old_man_fall_on_bum(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_OLD_MAN)
-            and self.has_prop(state, itemNames.PROP_PORTABLE_STOOL)
-            and (
-                self.has_prop(state, itemNames.PROP_DARTBOARD)
-                or self.has_prop(state, itemNames.PROP_GREEN_QUOITS)
-                or self.has_prop(state, itemNames.PROP_RED_QUOITS)
+            self.has_pub
+            & self.has_npc(itemNames.NPC_OLD_MAN)
+            & self.has_prop(itemNames.PROP_PORTABLE_STOOL)
+            & (
+                self.has_prop(itemNames.PROP_DARTBOARD)
+                | self.has_prop(itemNames.PROP_GREEN_QUOITS)
+                | self.has_prop(itemNames.PROP_RED_QUOITS)
             )
         )
     
-    def be_awarded_flower(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def be_awarded_flower(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-            and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
+            self.has_pub
+            & self.has_npc(itemNames.NPC_FANCY_LADIES)
+            & self.has_prop(itemNames.PROP_FLOWER_FOR_VASE)
         )
     
-    def drop_pint_glass_in_canal(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drop_pint_glass_in_canal(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PINT_GLASSES)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_PINT_GLASSES)
         )
     
-    def set_table(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def set_table(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PLATES)
-            and self.has_prop(state, itemNames.PROP_FORKS)
-            and self.has_prop(state, itemNames.PROP_KNIVES)
-            and self.has_prop(state, itemNames.PROP_PEPPER_GRINDER)
-            and self.has_prop(state, itemNames.PROP_CANDLESTICK)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_PLATES)
+            & self.has_prop(itemNames.PROP_FORKS)
+            & self.has_prop(itemNames.PROP_KNIVES)
+            & self.has_prop(itemNames.PROP_PEPPER_GRINDER)
+            & self.has_prop(itemNames.PROP_CANDLESTICK)
         )
     
-    def drop_bucket_on_burly_man(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_pub(state):
-            task_count += 1
-        if self.break_dartboard(state):
-            task_count += 1
-        if self.get_toy_boat(state):
-            task_count += 1
-        if self.make_old_man_fall_on_bum(state):
-            task_count += 1
-        if self.be_awarded_flower(state):
-            task_count += 1
-        if self.drop_pint_glass_in_canal(state):
-            task_count += 1
-        if self.set_table(state):
-            task_count += 1
-        
+    @memoized_rule
+    def drop_bucket_on_burly_man(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_BURLY_MAN)
-            and self.has_npc(state, itemNames.NPC_PUB_LADY)
-            and self.has_prop(state, itemNames.PROP_BUCKET)
-            and self.has_prop(state, itemNames.PROP_TOMATOES)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_PUB)
-            and task_count >= 6
+            self.has_npc(itemNames.NPC_BURLY_MAN)
+            & self.has_npc(itemNames.NPC_PUB_LADY)
+            & self.has_prop(itemNames.PROP_BUCKET)
+            & self.has_prop(itemNames.PROP_TOMATOES)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_PUB)
+            & at_least(
+                6,
+                self.get_into_pub,
+                self.break_dartboard,
+                self.get_toy_boat,
+                self.make_old_man_fall_on_bum,
+                self.be_awarded_flower,
+                self.drop_pint_glass_in_canal,
+                self.set_table,
+            )
         )
     
     
     # ----- To Do (As Well) Task Rule Defs -----
     
-    def lock_groundskeeper_out(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def lock_groundskeeper_out(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
+            self.has_garden
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
         )
     
-    def cabbage_picnic(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def cabbage_picnic(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_CABBAGES)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_CABBAGES)
         )
     
-    def trip_boy_in_puddle(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def trip_boy_in_puddle(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_BOY)
         )
     
-    def make_scales_ding(self, state: CollectionState) -> bool:
-        if not self.has_high_street(state):
-            return False
-        
-        # Any of these provides enough items to complete the task alone
-        if self.has_prop(state, itemNames.PROP_CARROTS):
-            return True
-        if self.has_prop(state, itemNames.PROP_TOMATOES):
-            return True
-        if self.has_prop(state, itemNames.PROP_ORANGES):
-            return True
-        if self.has_prop(state, itemNames.PROP_LEEKS):
-            return True
-        if self.has_prop(state, itemNames.PROP_CUCUMBERS):
-            return True
-        if self.has_prop(state, itemNames.PROP_TINNED_FOOD):
-            return True
-        if self.has_pub(state) and self.has_prop(state, itemNames.PROP_GREEN_QUOITS):
-            return True
-        if self.has_pub(state) and self.has_prop(state, itemNames.PROP_RED_QUOITS):
-            return True
-        if self.has_pub(state) and self.has_prop(state, itemNames.PROP_PLATES):
-            return True
-        if self.has_pub(state) and self.has_prop(state, itemNames.PROP_DARTBOARD):
-            return True
-        if self.has_pub(state) and self.has_model_village(state) and self.has_prop(state, itemNames.PROP_MINI_PEOPLE):
-            return True
-        if self.has_prop(state, itemNames.PROP_PINT_BOTTLES):
-            return True # Two in High Street, one in the hub near the dummy
-            
-        item_count = 0
-        
-        # High Street items (1 each)
-        if self.has_prop(state, itemNames.PROP_TOOTHRBRUSH):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_HAIRBRUSH):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_LOO_PAPER):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_DISH_SOAP_BOTTLE):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_SPRAY_BOTTLE):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_TOY_CAR):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_RED_GLASSES):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_SUNGLASSES):
-            item_count += 1
-        if self.has_npc(state, itemNames.NPC_BOY):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_TOY_PLANE):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_LILY_FLOWER):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_STEREOSCOPE):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_DUSTBIN_LID):
-            item_count += 1
-        
-        # High Street items (2 each)
-        if self.has_prop(state, itemNames.PROP_APPLE_CORES):
-            item_count += 2
-        if self.has_prop(state, itemNames.PROP_WALKIE_TALKIES):
-            item_count += 2
-        if self.has_prop(state, itemNames.PROP_WEED_TOOLS):
-            item_count += 2
-        
-        # Hub items (1 each)
-        if self.has_prop(state, itemNames.PROP_TENNIS_BALL):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_DUMMY):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_FISHING_BOBBER):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_DRINK_CAN):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_RIBBONS):
-            item_count += 1
-        
-        # Hub items (2 each)
-        if self.has_prop(state, itemNames.PROP_BOOTS):
-            item_count += 2
-        
-        if self.has_garden(state):
-            # Garden items (1 each)
-            if self.has_prop(state, itemNames.PROP_JAM):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_TULIP):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_PICNIC_MUG):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_THERMOS):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_TROWEL):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_RADIO):
-                item_count += 1
-                
-            # Garden items (2 each)
-            if self.has_prop(state, itemNames.PROP_APPLES):
-                item_count += 2
-            if self.has_prop(state, itemNames.PROP_SANDWICH):
-                item_count += 2
-        
-        if self.has_back_gardens(state):
-            # Back Garden front items (1 each)
-            if self.has_prop(state, itemNames.PROP_TEA_CUP):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_CRICKET_BALL):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_BUST_PIPE):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_BUST_HAT):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_BUST_GLASSES):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_NEWSPAPER):
-                item_count += 1
-                
-            # Back Garden back items (mostly 1 each)
-            if self.has_prop(state, itemNames.PROP_DRAWER):
-                if self.has_prop(state, itemNames.PROP_SOAP):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_POT_STACK):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_PAINTBRUSH):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_BRA):
-                    item_count += 1
-                    
-                if self.has_prop(state, itemNames.PROP_SOCKS):
-                    item_count += 2
-        
-        if self.has_pub(state):
-            # Pub items (1 each)
-            if self.has_prop(state, itemNames.PROP_CORK):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_LETTER):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_CANDLESTICK):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_HARMONICA):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_TOY_BOAT):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_PEPPER_GRINDER):
-                item_count += 1
-                
-            # Pub items (2 each)
-            if self.has_prop(state, itemNames.PROP_KNIVES):
-                item_count += 2
-            if self.has_prop(state, itemNames.PROP_FORKS):
-                item_count += 2
-                
-            if self.has_model_village(state):
-                if self.has_prop(state, itemNames.PROP_MINI_GOOSE):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_MINI_MAIL_PILLAR):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_MINI_PHONE_DOOR):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_MINI_SHOVEL):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_POPPY_FLOWER):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_TIMBER_HANDLE):
-                    item_count += 1
+    @memoized_rule
+    def make_scales_ding(self) -> Requirement:
+        # The scales need three items' worth, counted from each area the goose can reach
+        area_gates = {
+            regionNames.HUB: TRUE,
+            regionNames.HIGH_STREET: self.has_high_street,
+            regionNames.GARDEN: self.has_garden,
+            regionNames.BACK_GARDENS: self.has_back_gardens,
+            BACK_GARDENS_BEHIND_DRAWER: self.has_back_gardens & self.has_prop(itemNames.PROP_DRAWER),
+            regionNames.PUB: self.has_pub,
+            regionNames.MODEL_VILLAGE: self.has_model_village,
+        }
         
-        return item_count >= 3
+        return self.has_high_street & weighted_threshold(
+            3,
+            *(
+                (area_gates[area], [(self.has_soul(item), weight) for item, weight in weights.items()])
+                for area, weights in SCALES_ITEM_WEIGHTS.items()
+            )
+        )
     
-    def open_umbrella_on_tv(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def open_umbrella_on_tv(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_UMBRELLAS)
-            and (
-                self.has_npc(state, itemNames.NPC_BOY)
-                or self.has_prop(state, itemNames.PROP_WALKIE_TALKIES)
+            self.has_pub
+            & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_UMBRELLAS)
+            & (
+                self.has_npc(itemNames.NPC_BOY)
+                | self.has_prop(itemNames.PROP_WALKIE_TALKIES)
             )
         )
     
-    def make_groundskeeper_buyback(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def make_groundskeeper_buyback(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_TROWEL)
+            self.has_garden
+            & self.has_high_street
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_TROWEL)
         )
     
-    def collect_five_flowers(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def collect_five_flowers(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_high_street(state)
-            and self.has_pub(state)
-            and self.has_model_village(state)
-            and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-            and self.has_prop(state, itemNames.PROP_TULIP)
-            and self.has_prop(state, itemNames.PROP_LILY_FLOWER)
-            and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
-            and self.has_prop(state, itemNames.PROP_POPPY_FLOWER)
-            and self.make_someone_prune_rose(state)
+            self.has_garden
+            & self.has_high_street
+            & self.has_pub
+            & self.has_model_village
+            & self.has_npc(itemNames.NPC_FANCY_LADIES)
+            & self.has_prop(itemNames.PROP_TULIP)
+            & self.has_prop(itemNames.PROP_LILY_FLOWER)
+            & self.has_prop(itemNames.PROP_FLOWER_FOR_VASE)
+            & self.has_prop(itemNames.PROP_POPPY_FLOWER)
+            & self.make_someone_prune_rose
         )
     
-    def trap_boy_in_garage(self, state: CollectionState) -> bool:
-        return self.trap_shopkeep_in_garage(state)
+    @memoized_rule
+    def trap_boy_in_garage(self) -> Requirement:
+        return self.trap_shopkeep_in_garage
     
-    def catch_thrown_object(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def catch_thrown_object(self) -> Requirement:
         return ( # Tracking any prop souls here is unnecessary as it can be done with the Fence Bolt from the starting area
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def get_thrown_over_fence(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def get_thrown_over_fence(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and self.has_prop(state, itemNames.PROP_STEALTH_BOX)
+            self.has_back_gardens
+            & self.has_pub
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & self.has_prop(itemNames.PROP_STEALTH_BOX)
         )
     
-    def dress_up_bust_outside_items(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def dress_up_bust_outside_items(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and (
-                self.has_garden(state) and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-                or self.has_pub(state) and (
-                    self.has_prop(state, itemNames.PROP_TRAFFIC_CONE)
-                    or self.has_npc(state, itemNames.NPC_OLD_MAN)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & (
+                self.has_garden & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+                | self.has_pub & (
+                    self.has_prop(itemNames.PROP_TRAFFIC_CONE)
+                    | self.has_npc(itemNames.NPC_OLD_MAN)
                 )
             )
-            and self.has_high_street(state) and (
-                self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES)
-                or self.has_prop(state, itemNames.PROP_RED_GLASSES)
-                or self.has_prop(state, itemNames.PROP_SUNGLASSES)
-                or self.has_prop(state, itemNames.PROP_STEREOSCOPE)
-                or self.has_npc(state, itemNames.NPC_BOY)
+            & self.has_high_street & (
+                self.has_prop(itemNames.PROP_HORN_RIMMED_GLASSES)
+                | self.has_prop(itemNames.PROP_RED_GLASSES)
+                | self.has_prop(itemNames.PROP_SUNGLASSES)
+                | self.has_prop(itemNames.PROP_STEREOSCOPE)
+                | self.has_npc(itemNames.NPC_BOY)
             )
-            and (
-                self.has_prop(state, itemNames.PROP_DUMMY)
-                or self.has_garden(state) and self.has_prop(state, itemNames.PROP_TULIP)
-                or self.has_high_street(state) and (
-                    self.has_prop(state, itemNames.PROP_TOOTHRBRUSH)
-                    or self.has_prop(state, itemNames.PROP_LILY_FLOWER)
+            & (
+                self.has_prop(itemNames.PROP_DUMMY)
+                | self.has_garden & self.has_prop(itemNames.PROP_TULIP)
+                | self.has_high_street & (
+                    self.has_prop(itemNames.PROP_TOOTHRBRUSH)
+                    | self.has_prop(itemNames.PROP_LILY_FLOWER)
                 )
-                or self.has_pub(state) and (
-                    self.has_prop(state, itemNames.PROP_KNIVES)
-                    or self.has_prop(state, itemNames.PROP_FORKS)
-                    or self.has_prop(state, itemNames.PROP_HARMONICA)
-                    or self.has_npc(state, itemNames.NPC_FANCY_LADIES) and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
+                | self.has_pub & (
+                    self.has_prop(itemNames.PROP_KNIVES)
+                    | self.has_prop(itemNames.PROP_FORKS)
+                    | self.has_prop(itemNames.PROP_HARMONICA)
+                    | self.has_npc(itemNames.NPC_FANCY_LADIES) & self.has_prop(itemNames.PROP_FLOWER_FOR_VASE)
                 )
-                or self.has_model_village(state) and self.has_prop(state, itemNames.PROP_POPPY_FLOWER)
+                | self.has_model_village & self.has_prop(itemNames.PROP_POPPY_FLOWER)
             )
         )
     
-    def score_goal(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def score_goal(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.make_someone_prune_rose(state)
-            and self.has_prop(state, itemNames.PROP_FOOTBALL)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_MESSY)
+            self.has_high_street
+            & self.make_someone_prune_rose
+            & self.has_prop(itemNames.PROP_FOOTBALL)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_MESSY)
         )
     
-    def sail_boat_under_bridge(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def sail_boat_under_bridge(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TOY_BOAT)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_TOY_BOAT)
         )
     
-    def perform_with_ribbon(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def perform_with_ribbon(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DUCK_STATUE)
-            and self.has_prop(state, itemNames.PROP_RIBBONS)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_pub
+            & self.has_back_gardens
+            & self.has_npc(itemNames.NPC_FANCY_LADIES)
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DUCK_STATUE)
+            & self.has_prop(itemNames.PROP_RIBBONS)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def steal_woolen_hat(self, state: CollectionState) -> bool:
-        return self.make_old_man_fall_on_bum(state)
+    @memoized_rule
+    def steal_woolen_hat(self) -> Requirement:
+        return self.make_old_man_fall_on_bum
     
     
     # ----- To Do (Quickly!!) Task Rule Defs -----
     
-    def speedrun_garden(self, state: CollectionState) -> bool:
-        return self.make_groundskeeper_hammer_thumb(state)
-    
-    def speedrun_high_street(self, state: CollectionState) -> bool:
-        return self.trap_shopkeep_in_garage(state)
-    
-    def speedrun_back_gardens(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.make_someone_break_vase(state):
-            task_count += 1
-        if self.make_man_spit_out_tea(state):
-            task_count += 1
-        if self.get_dressed_up(state):
-            task_count += 1
-        if self.make_man_barefoot(state):
-            task_count += 1
-        if self.do_washing(state):
-            task_count += 1
-        if (
-            self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_BUST_HAT)
-            and self.has_prop(state, itemNames.PROP_BUST_GLASSES)
-            and self.has_prop(state, itemNames.PROP_BUST_PIPE)
-        ):
-            task_count += 1
-        
-        return (
-            self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and self.has_prop(state, itemNames.PROP_ROSE)
-            and self.has_prop(state, itemNames.PROP_ROSE_BOX)
-            and self.has_prop(state, itemNames.PROP_CLIPPERS)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
-            and task_count >= 5
+    @memoized_rule
+    def speedrun_garden(self) -> Requirement:
+        return self.make_groundskeeper_hammer_thumb
+    
+    @memoized_rule
+    def speedrun_high_street(self) -> Requirement:
+        return self.trap_shopkeep_in_garage
+    
+    @memoized_rule
+    def speedrun_back_gardens(self) -> Requirement:
+        return (
+            self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & self.has_prop(itemNames.PROP_ROSE)
+            & self.has_prop(itemNames.PROP_ROSE_BOX)
+            & self.has_prop(itemNames.PROP_CLIPPERS)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
+            & at_least(
+                5,
+                self.make_someone_break_vase,
+                self.make_man_spit_out_tea,
+                self.get_dressed_up,
+                self.make_man_barefoot,
+                self.do_washing,
+                (
+                    self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+                    & self.has_prop(itemNames.PROP_BUST_HAT)
+                    & self.has_prop(itemNames.PROP_BUST_GLASSES)
+                    & self.has_prop(itemNames.PROP_BUST_PIPE)
+                ),
+            )
         )
     
-    def speedrun_pub(self, state: CollectionState) -> bool:
-        return self.drop_bucket_on_burly_man(state)
+    @memoized_rule
+    def speedrun_pub(self) -> Requirement:
+        return self.drop_bucket_on_burly_man
     
     
     # ----- Milestone & Goal Defs -----
     
-    def all_garden_tasks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def all_garden_tasks(self) -> Requirement:
         return (
-            self.get_into_garden(state)
-            and self.get_groundskeeper_wet(state)
-            and self.steal_groundskeepers_keys(state)
-            and self.make_groundskeeper_wear_sun_hat(state)
-            and self.rake_in_lake(state)
-            and self.picnic(state)
-            and self.make_groundskeeper_hammer_thumb(state)
+            self.get_into_garden
+            & self.get_groundskeeper_wet
+            & self.steal_groundskeepers_keys
+            & self.make_groundskeeper_wear_sun_hat
+            & self.rake_in_lake
+            & self.picnic
+            & self.make_groundskeeper_hammer_thumb
         )
     
-    def all_high_street_tasks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def all_high_street_tasks(self) -> Requirement:
         return (
-            self.break_broom(state)
-            and self.trap_boy_in_phone_booth(state)
-            and self.make_boy_wear_wrong_glasses(state)
-            and self.make_someone_buyback(state)
-            and self.get_on_tv(state)
-            and self.go_shopping(state)
-            and self.trap_shopkeep_in_garage(state)
+            self.break_broom
+            & self.trap_boy_in_phone_booth
+            & self.make_boy_wear_wrong_glasses
+            & self.make_someone_buyback
+            & self.get_on_tv
+            & self.go_shopping
+            & self.trap_shopkeep_in_garage
         )
     
-    def all_back_gardens_tasks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def all_back_gardens_tasks(self) -> Requirement:
         return (
-            self.make_someone_break_vase(state)
-            and self.make_man_spit_out_tea(state)
-            and self.get_dressed_up(state)
-            and self.make_man_barefoot(state)
-            and self.do_washing(state)
-            and self.dress_up_bust(state)
-            and self.make_someone_prune_rose(state)
+            self.make_someone_break_vase
+            & self.make_man_spit_out_tea
+            & self.get_dressed_up
+            & self.make_man_barefoot
+            & self.do_washing
+            & self.dress_up_bust
+            & self.make_someone_prune_rose
         )
     
-    def all_pub_tasks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def all_pub_tasks(self) -> Requirement:
         return (
-            self.get_into_pub(state)
-            and self.break_dartboard(state)
-            and self.get_toy_boat(state)
-            and self.make_old_man_fall_on_bum(state)
-            and self.be_awarded_flower(state)
-            and self.drop_pint_glass_in_canal(state)
-            and self.set_table(state)
-            and self.drop_bucket_on_burly_man(state)
+            self.get_into_pub
+            & self.break_dartboard
+            & self.get_toy_boat
+            & self.make_old_man_fall_on_bum
+            & self.be_awarded_flower
+            & self.drop_pint_glass_in_canal
+            & self.set_table
+            & self.drop_bucket_on_burly_man
         )
     
-    def all_main_task_lists(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def all_main_task_lists(self) -> Requirement:
         return (
-            self.all_garden_tasks(state)
-            and self.all_high_street_tasks(state)
-            and self.all_back_gardens_tasks(state)
-            and self.all_pub_tasks(state)
+            self.all_garden_tasks
+            & self.all_high_street_tasks
+            & self.all_back_gardens_tasks
+            & self.all_pub_tasks
         )
     
-    def all_to_do_as_well_tasks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def all_to_do_as_well_tasks(self) -> Requirement:
         return (
-            self.lock_groundskeeper_out(state)
-            and self.cabbage_picnic(state)
-            and self.trip_boy_in_puddle(state)
-            and self.make_scales_ding(state)
-            and self.open_umbrella_on_tv(state)
-            and self.make_groundskeeper_buyback(state)
-            and self.collect_five_flowers(state)
-            and self.trap_boy_in_garage(state)
-            and self.catch_thrown_object(state)
-            and self.get_thrown_over_fence(state)
-            and self.dress_up_bust_outside_items(state)
-            and self.score_goal(state)
-            and self.sail_boat_under_bridge(state)
-            and self.perform_with_ribbon(state)
-            and self.steal_woolen_hat(state)
+            self.lock_groundskeeper_out
+            & self.cabbage_picnic
+            & self.trip_boy_in_puddle
+            & self.make_scales_ding
+            & self.open_umbrella_on_tv
+            & self.make_groundskeeper_buyback
+            & self.collect_five_flowers
+            & self.trap_boy_in_garage
+            & self.catch_thrown_object
+            & self.get_thrown_over_fence
+            & self.dress_up_bust_outside_items
+            & self.score_goal
+            & self.sail_boat_under_bridge
+            & self.perform_with_ribbon
+            & self.steal_woolen_hat
         )
     
-    def all_speedrun_tasks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def all_speedrun_tasks(self) -> Requirement:
         return (
-            self.speedrun_garden(state)
-            and self.speedrun_high_street(state)
-            and self.speedrun_back_gardens(state)
-            and self.speedrun_pub(state)
+            self.speedrun_garden
+            & self.speedrun_high_street
+            & self.speedrun_back_gardens
+            & self.speedrun_pub
         )
     
-    def all_tasks_complete(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def all_tasks_complete(self) -> Requirement:
         return (
-            self.all_main_task_lists(state)
-            and self.all_to_do_as_well_tasks(state)
-            and self.all_speedrun_tasks(state)
+            self.all_main_task_lists
+            & self.all_to_do_as_well_tasks
+            & self.all_speedrun_tasks
         )
     
-    def all_non_speedrun_tasks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def all_non_speedrun_tasks(self) -> Requirement:
         return (
-            self.all_main_task_lists(state)
-            and self.all_to_do_as_well_tasks(state)
+            self.all_main_task_lists
+            & self.all_to_do_as_well_tasks
         )
     
-    def four_final_tasks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def four_final_tasks(self) -> Requirement:
         return (
-            self.make_groundskeeper_hammer_thumb(state)
-            and self.trap_shopkeep_in_garage(state)
-            and self.make_someone_prune_rose(state)
-            and self.drop_bucket_on_burly_man(state)
+            self.make_groundskeeper_hammer_thumb
+            & self.trap_shopkeep_in_garage
+            & self.make_someone_prune_rose
+            & self.drop_bucket_on_burly_man
         )
     
     
     # ----- Model Village Defs -----
     
-    def get_into_model_village(self, state: CollectionState) -> bool:
-        return self.has_model_village(state)
+    @memoized_rule
+    def get_into_model_village(self) -> Requirement:
+        return self.has_model_village
     
-    def steal_bell(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def steal_bell(self) -> Requirement:
         if self.world.options.logically_require_npc_souls.value:
             return (
-                self.has_garden(state)
-                and self.has_high_street(state)
-                and self.has_back_gardens(state)
-                and self.has_pub(state)
-                and self.has_model_village(state)
-                and self.has_prop(state, itemNames.PROP_TIMBER_HANDLE)
-                and state.has(itemNames.PROP_GOLDEN_BELL, self.player)
-                and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-                and self.has_npc(state, itemNames.NPC_BOY)
-                and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-                and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-                and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-                and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-                and self.has_npc(state, itemNames.NPC_BURLY_MAN)
-                and self.has_npc(state, itemNames.NPC_OLD_MAN)
-                and self.has_npc(state, itemNames.NPC_PUB_LADY)
-                and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-                and self.has_npc(state, itemNames.NPC_COOK)
+                self.has_garden
+                & self.has_high_street
+                & self.has_back_gardens
+                & self.has_pub
+                & self.has_model_village
+                & self.has_prop(itemNames.PROP_TIMBER_HANDLE)
+                & self.has_item(itemNames.PROP_GOLDEN_BELL)
+                & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+                & self.has_npc(itemNames.NPC_BOY)
+                & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+                & self.has_npc(itemNames.NPC_MARKET_LADY)
+                & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+                & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+                & self.has_npc(itemNames.NPC_BURLY_MAN)
+                & self.has_npc(itemNames.NPC_OLD_MAN)
+                & self.has_npc(itemNames.NPC_PUB_LADY)
+                & self.has_npc(itemNames.NPC_FANCY_LADIES)
+                & self.has_npc(itemNames.NPC_COOK)
             )
 
         return (
-            self.has_garden(state)
-            and self.has_high_street(state)
-            and self.has_back_gardens(state)
-            and self.has_pub(state)
-            and self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_TIMBER_HANDLE)
-            and state.has(itemNames.PROP_GOLDEN_BELL, self.player)
+            self.has_garden
+            & self.has_high_street
+            & self.has_back_gardens
+            & self.has_pub
+            & self.has_model_village
+            & self.has_prop(itemNames.PROP_TIMBER_HANDLE)
+            & self.has_item(itemNames.PROP_GOLDEN_BELL)
         )
     
     
     # ----- Hub Item Pickup Defs -----
     
-    def pickup_drink_can(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_DRINK_CAN)
+    @memoized_rule
+    def pickup_drink_can(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_DRINK_CAN)
     
-    def pickup_tennis_ball(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_TENNIS_BALL)
+    @memoized_rule
+    def pickup_tennis_ball(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_TENNIS_BALL)
     
-    def pickup_blue_bow(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_RIBBONS)
+    @memoized_rule
+    def pickup_blue_bow(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_RIBBONS)
     
-    def pickup_dummy(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_DUMMY)
+    @memoized_rule
+    def pickup_dummy(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_DUMMY)
     
-    def pickup_fishing_bobber(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_FISHING_BOBBER)
+    @memoized_rule
+    def pickup_fishing_bobber(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_FISHING_BOBBER)
     
-    def pickup_boots(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_BOOTS)
+    @memoized_rule
+    def pickup_boots(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_BOOTS)
     
     
     # ----- Garden Item Pickup Defs -----
     
-    def pickup_radio(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_radio(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_RADIO)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_RADIO)
         )
     
-    def pickup_trowel(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_trowel(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_TROWEL)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_TROWEL)
         )
     
-    def pickup_keys(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_keys(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
+            self.has_garden
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
         )
     
-    def pickup_grounsdkeepers_hat(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_grounsdkeepers_hat(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-            and
+            self.has_garden
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+            &
             (
-                self.has_prop(state, itemNames.PROP_TULIP)
-                or self.rake_in_lake(state)
-                and self.picnic(state)
-                and self.has_prop(state, itemNames.PROP_MALLET)
+                self.has_prop(itemNames.PROP_TULIP)
+                | self.rake_in_lake
+                & self.picnic
+                & self.has_prop(itemNames.PROP_MALLET)
             )
         )
     
-    def pickup_tulip(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_tulip(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_TULIP)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_TULIP)
         )
     
-    def pickup_apples(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_apples(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_APPLES)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_APPLES)
         )
     
-    def pickup_jam(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_jam(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_JAM)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_JAM)
         )
     
-    def pickup_picnic_mug(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_picnic_mug(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_PICNIC_MUG)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_PICNIC_MUG)
         )
     
-    def pickup_thermos(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_thermos(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_THERMOS)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_THERMOS)
         )
     
-    def pickup_sandwich(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_sandwich(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_SANDWICH)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_SANDWICH)
         )
     
-    def pickup_straw_hat(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_straw_hat(self) -> Requirement:
         return (
-            self.pickup_grounsdkeepers_hat(state)
-            and self.has_prop(state, itemNames.PROP_STRAW_HAT)
+            self.pickup_grounsdkeepers_hat
+            & self.has_prop(itemNames.PROP_STRAW_HAT)
         )
     
-    def pickup_garden_carrots(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_garden_carrots(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_CARROTS)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_CARROTS)
         )
     
     
     # ----- High Street Item Pickup Defs -----
     
-    def pickup_boys_glasses(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_boys_glasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_BOY)
         )
     
-    def pickup_horn_rimmed_glasses(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_horn_rimmed_glasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_HORN_RIMMED_GLASSES)
         )
     
-    def pickup_red_glasses(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_red_glasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_RED_GLASSES)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_RED_GLASSES)
         )
     
-    def pickup_sunglasses(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_sunglasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_SUNGLASSES)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_SUNGLASSES)
         )
     
-    def pickup_loo_paper(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_loo_paper(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_LOO_PAPER)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_LOO_PAPER)
         )
     
-    def pickup_toy_car(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_toy_car(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TOY_CAR)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_TOY_CAR)
         )
     
-    def pickup_hairbrush(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_hairbrush(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_HAIRBRUSH)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_HAIRBRUSH)
         )
     
-    def pickup_toothbrush(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_toothbrush(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TOOTHRBRUSH)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_TOOTHRBRUSH)
         )
     
-    def pickup_stereoscope(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_stereoscope(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_STEREOSCOPE)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_STEREOSCOPE)
         )
     
-    def pickup_dish_soap_bottle(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_dish_soap_bottle(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_DISH_SOAP_BOTTLE)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_DISH_SOAP_BOTTLE)
         )
     
-    def pickup_food_cans(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_food_cans(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TINNED_FOOD)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_TINNED_FOOD)
         )
     
-    def pickup_weed_tools(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_weed_tools(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_WEED_TOOLS)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_WEED_TOOLS)
         )
     
-    def pickup_lily_flower(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_lily_flower(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_LILY_FLOWER)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_LILY_FLOWER)
         )
     
-    def pickup_oranges(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_oranges(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_ORANGES)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_ORANGES)
         )
     
-    def pickup_tomatoes_high_street(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_tomatoes_high_street(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TOMATOES)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_TOMATOES)
         )
     
-    def pickup_carrots_high_street(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_carrots_high_street(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_CARROTS)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_CARROTS)
         )
     
-    def pickup_cucumbers(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_cucumbers(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_CUCUMBERS)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_CUCUMBERS)
         )
     
-    def pickup_leeks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_leeks(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_LEEKS)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_LEEKS)
         )
     
-    def pickup_fusilage(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_fusilage(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TOY_PLANE)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_TOY_PLANE)
         )
     
-    def pickup_pint_bottle_hub(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_PINT_BOTTLES)
+    @memoized_rule
+    def pickup_pint_bottle_hub(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_PINT_BOTTLES)
     
-    def pickup_pint_bottle_high_street(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_pint_bottle_high_street(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_PINT_BOTTLES)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_PINT_BOTTLES)
         )
     
-    def pickup_spray_bottle(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_spray_bottle(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_SPRAY_BOTTLE)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_SPRAY_BOTTLE)
         )
     
-    def pickup_walkie_talkies(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_walkie_talkies(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_WALKIE_TALKIES)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_WALKIE_TALKIES)
         )
     
-    def pickup_apple_cores(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_apple_cores(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_APPLE_CORES)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_APPLE_CORES)
         )
     
-    def pickup_dustbin_lid(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_dustbin_lid(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_DUSTBIN_LID)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_DUSTBIN_LID)
         )
     
-    def pickup_chalk(self, state: CollectionState) -> bool:
-        return self.trap_shopkeep_in_garage(state)
+    @memoized_rule
+    def pickup_chalk(self) -> Requirement:
+        return self.trap_shopkeep_in_garage
     
     
     # ----- Back Gardens Item Pickup Defs -----
     
-    def pickup_red_bow(self, state: CollectionState) -> bool:
-        return self.get_dressed_up(state)
+    @memoized_rule
+    def pickup_red_bow(self) -> Requirement:
+        return self.get_dressed_up
     
-    def pickup_cricket_ball(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_cricket_ball(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_CRICKET_BALL)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_CRICKET_BALL)
         )
     
-    def pickup_bust_pipe(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_bust_pipe(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_BUST_PIPE)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_BUST_PIPE)
         )
     
-    def pickup_bust_hat(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_bust_hat(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_BUST_HAT)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_BUST_HAT)
         )
     
-    def pickup_bust_glasses(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_bust_glasses(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_BUST_GLASSES)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_BUST_GLASSES)
         )
     
-    def pickup_slippers(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_slippers(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
         )
     
-    def pickup_tea_cup(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_tea_cup(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_TEA_CUP)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_TEA_CUP)
         )
     
-    def pickup_newspaper(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_newspaper(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_NEWSPAPER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_NEWSPAPER)
         )
     
-    def pickup_socks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_socks(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_SOCKS)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_SOCKS)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_vase(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_vase(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_VASE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_VASE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_pot_stack(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_pot_stack(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_POT_STACK)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_POT_STACK)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_soap(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_soap(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_SOAP)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_SOAP)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_paintbrush(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_paintbrush(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_PAINTBRUSH)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_PAINTBRUSH)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_vase_pieces(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_vase_pieces(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_VASE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_VASE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_bra(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_bra(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_BRA)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_BRA)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_badminton_racket(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_badminton_racket(self) -> Requirement:
         return (
-            self.has_prop(state, itemNames.PROP_BADMINTON_RACKET)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_MESSY)
-            and self.make_someone_prune_rose(state)
+            self.has_prop(itemNames.PROP_BADMINTON_RACKET)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_MESSY)
+            & self.make_someone_prune_rose
         )
     
-    def pickup_rose(self, state: CollectionState) -> bool:
-        return self.make_someone_prune_rose(state)
+    @memoized_rule
+    def pickup_rose(self) -> Requirement:
+        return self.make_someone_prune_rose
     
     
     # ----- Pub Item Pickup Defs -----
     
-    def pickup_exit_letter(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_exit_letter(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_LETTER)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_LETTER)
         )
     
-    def pickup_plates(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_plates(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PLATES)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_PLATES)
         )
     
-    def pickup_green_quoits(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_green_quoits(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_GREEN_QUOITS)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_GREEN_QUOITS)
         )
     
-    def pickup_red_quoits(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_red_quoits(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_RED_QUOITS)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_RED_QUOITS)
         )
     
-    def pickup_forks(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_forks(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_FORKS)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_FORKS)
         )
     
-    def pickup_knives(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_knives(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_KNIVES)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_KNIVES)
         )
     
-    def pickup_cork(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_cork(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_CORK)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_CORK)
         )
     
-    def pickup_candlestick(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_candlestick(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_CANDLESTICK)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_CANDLESTICK)
         )
     
-    def pickup_vase_flower(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_vase_flower(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-            and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
+            self.has_pub
+            & self.has_npc(itemNames.NPC_FANCY_LADIES)
+            & self.has_prop(itemNames.PROP_FLOWER_FOR_VASE)
         )
     
-    def pickup_darts(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_darts(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_OLD_MAN)
-            and self.has_prop(state, itemNames.PROP_DARTBOARD)
+            self.has_pub
+            & self.has_npc(itemNames.NPC_OLD_MAN)
+            & self.has_prop(itemNames.PROP_DARTBOARD)
         )
     
-    def pickup_harmonica(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_harmonica(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_HARMONICA)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_HARMONICA)
         )
     
-    def pickup_pint_glass(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_pint_glass(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PINT_GLASSES)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_PINT_GLASSES)
         )
     
-    def pickup_toy_boat(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_toy_boat(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TOY_BOAT)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_TOY_BOAT)
         )
     
-    def pickup_woolen_hat(self, state: CollectionState) -> bool:
-        return self.make_old_man_fall_on_bum(state)
+    @memoized_rule
+    def pickup_woolen_hat(self) -> Requirement:
+        return self.make_old_man_fall_on_bum
     
-    def pickup_pepper_grinder(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_pepper_grinder(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PEPPER_GRINDER)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_PEPPER_GRINDER)
         )
     
-    def pickup_pub_woman_cloth(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_pub_woman_cloth(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_PUB_LADY)
+            self.has_pub
+            & self.has_npc(itemNames.NPC_PUB_LADY)
         )
     
-    def pickup_pub_open_tomatoes(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_pub_open_tomatoes(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TOMATOES)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_TOMATOES)
         )
     
-    def pickup_pub_boxed_tomatoes(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_pub(state):
-            task_count += 1
-        if self.break_dartboard(state):
-            task_count += 1
-        if self.get_toy_boat(state):
-            task_count += 1
-        if self.make_old_man_fall_on_bum(state):
-            task_count += 1
-        if self.be_awarded_flower(state):
-            task_count += 1
-        if self.drop_pint_glass_in_canal(state):
-            task_count += 1
-        if self.set_table(state):
-            task_count += 1
-        
+    @memoized_rule
+    def pickup_pub_boxed_tomatoes(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_PUB_LADY)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_PUB)
-            and self.has_prop(state, itemNames.PROP_TOMATOES)
-            and task_count >= 6
+            self.has_npc(itemNames.NPC_PUB_LADY)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_PUB)
+            & self.has_prop(itemNames.PROP_TOMATOES)
+            & at_least(
+                6,
+                self.get_into_pub,
+                self.break_dartboard,
+                self.get_toy_boat,
+                self.make_old_man_fall_on_bum,
+                self.be_awarded_flower,
+                self.drop_pint_glass_in_canal,
+                self.set_table,
+            )
         )
     
     
     # ----- Model Village Item Pickup Defs -----
     
-    def pickup_people_miniatures(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_people_miniatures(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_PEOPLE)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_PEOPLE)
         )
     
-    def pickup_mini_shovel(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_mini_shovel(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_SHOVEL)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_SHOVEL)
         )
     
-    def pickup_mini_goose(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_mini_goose(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_GOOSE)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_GOOSE)
         )
     
-    def pickup_poppy(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_poppy(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_POPPY_FLOWER)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_POPPY_FLOWER)
         )
     
-    def pickup_mini_phone_booth(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_mini_phone_booth(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_PHONE_DOOR)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_PHONE_DOOR)
         )
     
-    def pickup_mini_mail_pillar(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_mini_mail_pillar(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_MAIL_PILLAR)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_MAIL_PILLAR)
         )
     
-    def pickup_timber_handle(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pickup_timber_handle(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_TIMBER_HANDLE)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_TIMBER_HANDLE)
         )
     
-    def pickup_golden_bell(self, state: CollectionState) -> bool:
-        return self.steal_bell(state)
+    @memoized_rule
+    def pickup_golden_bell(self) -> Requirement:
+        return self.steal_bell
     
     
     # ----- Hub Item Drag Defs -----
     
-    def drag_fence_bolt(self, state: CollectionState) -> bool:
-        return True
+    @memoized_rule
+    def drag_fence_bolt(self) -> Requirement:
+        return TRUE
     
-    def drag_tackle_box(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_TACKLE_BOX)
+    @memoized_rule
+    def drag_tackle_box(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_TACKLE_BOX)
     
     
     # ----- Garden Item Drag Defs -----
     
-    def drag_rake(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_rake(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_RAKE)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_RAKE)
         )
     
-    def drag_picnic_basket(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_picnic_basket(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_PICNIC_BASKET)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_PICNIC_BASKET)
         )
     
-    def drag_esky(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_esky(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_ESKY)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_ESKY)
         )
     
-    def drag_shovel(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_shovel(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_SHOVEL)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_SHOVEL)
         )
     
-    def drag_pumpkins(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_pumpkins(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_PUMPKINS)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_PUMPKINS)
         )
     
-    def drag_watering_can(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_watering_can(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_WATERING_CAN)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_WATERING_CAN)
         )
     
-    def drag_gumboots(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_gumboots(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_GUMBOOTS)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_GUMBOOTS)
         )
     
-    def drag_gardener_sign(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_garden(state):
-            task_count += 1
-        if self.get_groundskeeper_wet(state):
-            task_count += 1
-        if self.steal_groundskeepers_keys(state):
-            task_count += 1
-        if self.make_groundskeeper_wear_sun_hat(state):
-            task_count += 1
-        if self.rake_in_lake(state):
-            task_count += 1
-        if self.picnic(state):
-            task_count += 1
-        
+    @memoized_rule
+    def drag_gardener_sign(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-            and task_count >= 5
+            self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+            & at_least(
+                5,
+                self.get_into_garden,
+                self.get_groundskeeper_wet,
+                self.steal_groundskeepers_keys,
+                self.make_groundskeeper_wear_sun_hat,
+                self.rake_in_lake,
+                self.picnic,
+            )
         )
     
-    def drag_wooden_crate(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_wooden_crate(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_WOODEN_CRATE)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_WOODEN_CRATE)
         )
     
-    def drag_mallet(self, state: CollectionState) -> bool:
-        return self.make_groundskeeper_hammer_thumb(state)
+    @memoized_rule
+    def drag_mallet(self) -> Requirement:
+        return self.make_groundskeeper_hammer_thumb
     
-    def drag_topsoil_bags(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_topsoil_bags(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_TOPSOIL_BAGS)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_TOPSOIL_BAGS)
         )
     
     
     # ----- High Street Item Drag Defs -----
     
-    def drag_shopping_basket(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_shopping_basket(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_SHOPPING_BASKET)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_SHOPPING_BASKET)
         )
     
-    def drag_umbrellas(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_umbrellas(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_UMBRELLAS)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_UMBRELLAS)
         )
     
-    def drag_push_broom(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_push_broom(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_PUSH_BROOM)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_PUSH_BROOM)
         )
     
-    def drag_broom_head(self, state: CollectionState) -> bool:
-        return self.break_broom(state)
+    @memoized_rule
+    def drag_broom_head(self) -> Requirement:
+        return self.break_broom
     
-    def drag_dustbin(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_dustbin(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_DUSTBIN)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_DUSTBIN)
         )
     
-    def drag_baby_doll(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_baby_doll(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_BABY_DOLL)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_BABY_DOLL)
         )
     
-    def drag_pricing_gun(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_pricing_gun(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_PRICING_GUN)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_PRICING_GUN)
         )
     
-    def drag_adding_machine(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_adding_machine(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_ADDING_MACHINE)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_ADDING_MACHINE)
         )
     
     
     # ----- Back Gardens Item Drag Defs -----
     
-    def drag_rose_box(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.make_someone_break_vase(state):
-            task_count += 1
-        if self.make_man_spit_out_tea(state):
-            task_count += 1
-        if self.get_dressed_up(state):
-            task_count += 1
-        if self.make_man_barefoot(state):
-            task_count += 1
-        if self.do_washing(state):
-            task_count += 1
-        if self.dress_up_bust(state):
-            task_count += 1
-        
-        return (
-            self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_ROSE_BOX)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
-            and task_count >= 5
+    @memoized_rule
+    def drag_rose_box(self) -> Requirement:
+        return (
+            self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_ROSE_BOX)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
+            & at_least(
+                5,
+                self.make_someone_break_vase,
+                self.make_man_spit_out_tea,
+                self.get_dressed_up,
+                self.make_man_barefoot,
+                self.do_washing,
+                self.dress_up_bust,
+            )
         )
     
-    def drag_cricket_bat(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_cricket_bat(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_CRICKET_BAT)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_CRICKET_BAT)
         )
     
-    def drag_tea_pot(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_tea_pot(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_TEA_POT)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_TEA_POT)
         )
     
-    def drag_clippers(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_clippers(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_CLIPPERS)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_CLIPPERS)
         )
     
-    def drag_duck_statue(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_duck_statue(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_DUCK_STATUE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_DUCK_STATUE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_frog_statue(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_frog_statue(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_FROG_STATUE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_FROG_STATUE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_jeremy_fish(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_jeremy_fish(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_JEREMY_FISH)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_JEREMY_FISH)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_messy_sign(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_messy_sign(self) -> Requirement:
         return (
-            self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_MESSY)
-            and self.make_someone_prune_rose(state)
+            self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_MESSY)
+            & self.make_someone_prune_rose
         )
     
-    def drag_drawer(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_drawer(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_enamel_jug(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_enamel_jug(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_ENAMEL_JUG)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_ENAMEL_JUG)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_clean_sign(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.make_someone_break_vase(state):
-            task_count += 1
-        if self.make_man_spit_out_tea(state):
-            task_count += 1
-        if self.get_dressed_up(state):
-            task_count += 1
-        if self.make_man_barefoot(state):
-            task_count += 1
-        if self.do_washing(state):
-            task_count += 1
-        if self.dress_up_bust(state):
-            task_count += 1
-        
+    @memoized_rule
+    def drag_clean_sign(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
-            and task_count >= 5
+            self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
+            & at_least(
+                5,
+                self.make_someone_break_vase,
+                self.make_man_spit_out_tea,
+                self.get_dressed_up,
+                self.make_man_barefoot,
+                self.do_washing,
+                self.dress_up_bust,
+            )
         )
     
     
     # ----- Pub Item Drag Defs -----
     
-    def drag_traffic_cone(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_traffic_cone(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TRAFFIC_CONE)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_TRAFFIC_CONE)
         )
     
-    def drag_exit_parcel(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_exit_parcel(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PARCEL)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_PARCEL)
         )
     
-    def drag_stealth_box(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_stealth_box(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_STEALTH_BOX)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_STEALTH_BOX)
         )
     
-    def drag_no_goose_sign(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_pub(state):
-            task_count += 1
-        if self.break_dartboard(state):
-            task_count += 1
-        if self.get_toy_boat(state):
-            task_count += 1
-        if self.make_old_man_fall_on_bum(state):
-            task_count += 1
-        if self.be_awarded_flower(state):
-            task_count += 1
-        if self.drop_pint_glass_in_canal(state):
-            task_count += 1
-        if self.set_table(state):
-            task_count += 1
-        
+    @memoized_rule
+    def drag_no_goose_sign(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_PUB_LADY)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_PUB)
-            and task_count >= 6
+            self.has_npc(itemNames.NPC_PUB_LADY)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_PUB)
+            & at_least(
+                6,
+                self.get_into_pub,
+                self.break_dartboard,
+                self.get_toy_boat,
+                self.make_old_man_fall_on_bum,
+                self.be_awarded_flower,
+                self.drop_pint_glass_in_canal,
+                self.set_table,
+            )
         )
     
-    def drag_portable_stool(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_portable_stool(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PORTABLE_STOOL)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_PORTABLE_STOOL)
         )
     
-    def drag_dartboard(self, state: CollectionState) -> bool:
-        return self.break_dartboard(state)
+    @memoized_rule
+    def drag_dartboard(self) -> Requirement:
+        return self.break_dartboard
     
-    def drag_mop_bucket(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_mop_bucket(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_MOP_BUCKET)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_MOP_BUCKET)
         )
     
-    def drag_mop(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_mop(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_MOP)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_MOP)
         )
     
-    def drag_delivery_box(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_delivery_box(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_COOK)
+            self.has_pub
+            & self.has_npc(itemNames.NPC_COOK)
         )
     
-    def drag_burly_mans_bucket(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_burly_mans_bucket(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_BUCKET)
+            self.has_pub
+            & self.has_prop(itemNames.PROP_BUCKET)
         )
     
     
     # ----- Model Village Item Drag Defs -----
     
-    def drag_mini_benches(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_mini_benches(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_BENCHES)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_BENCHES)
         )
     
-    def drag_mini_pump(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_mini_pump(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_PUMP)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_PUMP)
         )
     
-    def drag_mini_birdbath(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_mini_birdbath(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_BIRDBATH)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_BIRDBATH)
         )
     
-    def drag_mini_easel(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_mini_easel(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_EASEL)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_EASEL)
         )
     
-    def drag_sun_lounge(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drag_sun_lounge(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_SUN_LOUNGE)
+            self.has_model_village
+            & self.has_prop(itemNames.PROP_MINI_SUN_LOUNGE)
         )
     
     
     # ----- Interaction & Church Pecking Defs -----
     
-    def interact_bike_bell(self, state: CollectionState) -> bool:
-        return True
+    @memoized_rule
+    def interact_bike_bell(self) -> Requirement:
+        return TRUE
     
-    def interact_garden_water(self, state: CollectionState) -> bool:
-        return self.has_garden(state)
+    @memoized_rule
+    def interact_garden_water(self) -> Requirement:
+        return self.has_garden
     
-    def short_out_radio(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def short_out_radio(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_RADIO)
+            self.has_garden
+            & self.has_prop(itemNames.PROP_RADIO)
         )
     
-    def interact_intro_gate(self, state: CollectionState) -> bool:
-        return True
+    @memoized_rule
+    def interact_intro_gate(self) -> Requirement:
+        return TRUE
     
-    def interact_well(self, state: CollectionState) -> bool:
-        return True
+    @memoized_rule
+    def interact_well(self) -> Requirement:
+        return TRUE
     
-    def drop_mail_in_well(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def drop_mail_in_well(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and (
-                self.has_prop(state, itemNames.PROP_LETTER)
-                or self.has_model_village(state)
-                and self.has_prop(state, itemNames.PROP_MINI_MAIL_PILLAR)
+            self.has_pub
+            & (
+                self.has_prop(itemNames.PROP_LETTER)
+                | self.has_model_village
+                & self.has_prop(itemNames.PROP_MINI_MAIL_PILLAR)
             )
         )
     
-    def interact_boards(self, state: CollectionState) -> bool:
-        return self.has_back_gardens(state)
+    @memoized_rule
+    def interact_boards(self) -> Requirement:
+        return self.has_back_gardens
     
-    def interact_radio(self, state: CollectionState) -> bool:
-        return self.has_high_street(state)
+    @memoized_rule
+    def interact_radio(self) -> Requirement:
+        return self.has_high_street
     
-    def interact_football(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def interact_football(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_FOOTBALL)
+            self.has_high_street
+            & self.has_prop(itemNames.PROP_FOOTBALL)
         )
     
-    def interact_umbrellas(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def interact_umbrellas(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_UMBRELLAS)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_UMBRELLAS)
         )
     
-    def interact_boys_laces(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def interact_boys_laces(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
+            self.has_high_street
+            & self.has_npc(itemNames.NPC_BOY)
         )
     
-    def trap_tv_shop_owner_in_garage(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def trap_tv_shop_owner_in_garage(self) -> Requirement:
         return (
-            self.trap_shopkeep_in_garage(state)
-            and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-            and self.has_prop(state, itemNames.PROP_WALKIE_TALKIES)
+            self.trap_shopkeep_in_garage
+            & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+            & self.has_prop(itemNames.PROP_WALKIE_TALKIES)
         )
     
-    def interact_back_gardens_objects(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def interact_back_gardens_objects(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def interact_trellis(self, state: CollectionState) -> bool:
-        return self.has_back_gardens(state)
+    @memoized_rule
+    def interact_trellis(self) -> Requirement:
+        return self.has_back_gardens
 
-    def interact_make_woman_fix_topiary(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def interact_make_woman_fix_topiary(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_CLIPPERS)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_CLIPPERS)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
 
-    def pose_as_duck_statue(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def pose_as_duck_statue(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DUCK_STATUE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DUCK_STATUE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def dress_up_bush(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def dress_up_bush(self) -> Requirement:
         return (
-            self.make_someone_prune_rose(state)
-            and self.has_prop(state, itemNames.PROP_RIBBONS)
+            self.make_someone_prune_rose
+            & self.has_prop(itemNames.PROP_RIBBONS)
         )
     
-    def interact_van_doors(self, state: CollectionState) -> bool:
-        return self.has_pub(state)
+    @memoized_rule
+    def interact_van_doors(self) -> Requirement:
+        return self.has_pub
     
-    def interact_burly_laces(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def interact_burly_laces(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_BURLY_MAN)
+            self.has_pub
+            & self.has_npc(itemNames.NPC_BURLY_MAN)
         )
     
-    def interact_pub_tap(self, state: CollectionState) -> bool:
-        return self.has_pub(state)
+    @memoized_rule
+    def interact_pub_tap(self) -> Requirement:
+        return self.has_pub
     
-    def perform_with_harmonica(self, state: CollectionState) -> bool:
+    @memoized_rule
+    def perform_with_harmonica(self) -> Requirement:
         return (
-            self.be_awarded_flower(state)
-            and self.has_prop(state, itemNames.PROP_HARMONICA)
+            self.be_awarded_flower
+            & self.has_prop(itemNames.PROP_HARMONICA)
         )
     
-    def peck_church(self, state: CollectionState) -> bool:
-        return self.has_model_village(state)
+    @memoized_rule
+    def peck_church(self) -> Requirement:
+        return self.has_model_village
     
     
     # --------------- Set Rules ---------------
 
+    def set_shared_rule(self, location: Location, rule: Requirement) -> None:
+        # Whatever the way into the region already checks is dropped from the location's own rule
+        implied = region_requirements(location.parent_region, self.region_requirements)
+        if implied & AREA_MASK & ~rule.required():
+            self.region_gate_mismatches.append(location.name)
+            logging.debug(f"Untitled Goose Game: rule for {location.name} doesn't check access to {location.parent_region.name}")
+        if (rule, implied) not in self.simplified_rules:
+            self.simplified_rules[rule, implied] = rule.assuming(implied)
+        set_rule(location, self.simplified_rules[rule, implied])
+    
     def set_rules(self) -> None:
-        # Model Village Rules/Victory Rules
-        for location, rules in self.victory_rules.items():
-            new_rule = self.world.multiworld.get_location(location, self.player)
-            set_rule(new_rule, rules)
-        
-        # Main Task Rules
-        for location, rules in self.main_tasks_rules.items():
-            new_rule = self.world.multiworld.get_location(location, self.player)
-            set_rule(new_rule, rules)
-        
-        # To Do (As Well) Task Rules
-        if self.world.options.include_extra_tasks.value:
-            for location, rules in self.extra_task_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # To Do (Quickly!!) Task Rules
-        if self.world.options.include_speedrun_tasks.value:
-            for location, rules in self.speedrun_task_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Item Pickup Rules
-        if self.world.options.include_item_pickups.value:
-            for location, rules in self.pickup_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Item Drag Rules
-        if self.world.options.include_drag_items.value:
-            for location, rules in self.drag_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Interaction Rules
-        if self.world.options.include_interactions.value:
-            for location, rules in self.interaction_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # New Tasks Rules
-        if self.world.options.include_new_tasks.value:
-            for location, rules in self.new_tasks_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Model Church Pecking Rules
-        if self.world.options.include_model_church_pecks.value == 1:
-            for location, rules in self.church_first_peck_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.include_model_church_pecks.value == 2:
-            for location, rules in self.church_all_peck_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Milestone Rules
-        if self.world.options.include_milestone_locations.value and self.world.options.include_extra_tasks.value and self.world.options.include_speedrun_tasks.value:
-            for location, rules in self.all_milestone_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.include_milestone_locations.value and self.world.options.include_extra_tasks.value:
-            for location, rules in self.non_speedrun_milestone_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.include_milestone_locations.value and self.world.options.include_speedrun_tasks.value:
-            for location, rules in self.non_to_do_as_well_milestone_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.include_milestone_locations.value:
-            for location, rules in self.basic_milestone_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Goals
-        if self.world.options.goal.value == 0:
-            for location, rules in self.simple_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        # elif self.world.options.goal.value == 1:\
-            # No special locations
-        elif self.world.options.goal.value == 2:
-            for location, rules in self.all_main_tasks_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.goal.value == 3:
-            for location, rules in self.all_speedrun_tasks_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.goal.value == 4:
-            for location, rules in self.all_non_speedrun_tasks_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.goal.value == 5:
-            for location, rules in self.all_tasks_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.goal.value == 6:
-            for location, rules in self.four_final_tasks_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
+        # The plan already knows which rule each enabled location takes, so this is a single pass
+        plan = self.world.location_plan
+        for name, rule_key in zip(plan.names, plan.rule_keys):
+            if rule_key is not None:
+                self.set_shared_rule(self.world.location_index[name], getattr(self, rule_key))
         
         self.world.multiworld.completion_condition[self.player] = self.steal_bell
\ No newline at end of file
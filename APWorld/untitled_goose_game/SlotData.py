@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from .names import itemNames
+
+if TYPE_CHECKING:
+    from . import GooseGameWorld
+
+
+# Layout version of the compact block. Bump it whenever OPTION_BITS or the block's keys change.
+COMPACT_VERSION = 2
+
+# Options packed into the compact block's bitfield after the starting area, lowest bits first, with their width
+# in bits. Only ever append here; anything reordered or resized needs a new COMPACT_VERSION.
+OPTION_BITS: Tuple[Tuple[str, int], ...] = (
+    ("include_npc_souls", 1),
+    ("include_prop_souls", 1),
+    ("include_new_tasks", 1),
+    ("death_link", 1),
+    ("include_extra_tasks", 1),
+    ("include_speedrun_tasks", 1),
+    ("include_item_pickups", 1),
+    ("include_drag_items", 1),
+    ("include_interactions", 1),
+    ("include_milestone_locations", 1),
+    ("filler_active_silent_steps", 1),
+    ("include_model_church_pecks", 2),
+    ("goal", 3),
+)
+
+# The starting area takes the lowest STARTING_AREA_BITS bits, ahead of OPTION_BITS, as its index here
+# (the StartingArea option order, with random already resolved)
+STARTING_AREAS: Tuple[str, ...] = (
+    itemNames.GARDEN_ACCESS,
+    itemNames.HIGH_STREET_ACCESS,
+    itemNames.BACK_GARDENS_ACCESS,
+    itemNames.PUB_ACCESS,
+)
+STARTING_AREA_BITS = 2
+
+
+def option_bitfield(world: "GooseGameWorld") -> int:
+    bits = STARTING_AREAS.index(world.location_plan.starting_area)
+    shift = STARTING_AREA_BITS
+    for field, width in OPTION_BITS:
+        value = int(getattr(world.options, field).value)
+        if not 0 <= value < 1 << width:
+            raise ValueError(f"{field} = {value} doesn't fit in {width} bits of the compact slot data")
+        bits |= value << shift
+        shift += width
+    return bits
+
+
+def location_ranges(ids) -> List[int]:
+    """Location ids as inclusive runs, flattened: [first, last, first, last, ...]."""
+    ranges: List[int] = []
+    for loc_id in sorted(ids):
+        if ranges and loc_id == ranges[-1] + 1:
+            ranges[-1] = loc_id
+        else:
+            ranges += (loc_id, loc_id)
+    return ranges
+
+
+def compact_slot_data(world: "GooseGameWorld") -> Dict[str, Any]:
+    """What the game client needs from slot_data, in a fixed shape it can read in one pass.
+
+    The proxy forwards this to the game as a frame of its own, so the client doesn't have to search
+    the whole Connected packet for each option."""
+    return {
+        "version": COMPACT_VERSION,
+        "options": option_bitfield(world),
+        "locations": location_ranges(world.location_plan.ids),
+    }
\ No newline at end of file
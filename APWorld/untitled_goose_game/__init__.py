@@ -1,13 +1,23 @@
-from typing import Dict, Any, ClassVar
+from typing import TYPE_CHECKING, Dict, Any, ClassVar, List, Optional, Set
 from worlds.AutoWorld import World, WebWorld
-from BaseClasses import Item, Tutorial
+from BaseClasses import CollectionState, Item, ItemClassification, Location, MultiWorld, Tutorial
 from Options import OptionError
-from .Items import item_table, GooseGameItem, ITEM_GROUPS
-from .Locations import location_table, GooseGameLocation, get_all_location_ids
-from .Regions import create_regions
+from .Items import (
+    item_table, item_bit_table, apportion, repeated_items, items_can_clone, GooseGameItem, ITEM_GROUPS,
+    PROGRESSION_MASK, npc_souls, prop_souls
+)
+from .Locations import location_table, GooseGameLocation
+from .Registry import item_registry, location_registry
+from .Instrumentation import GenerationReport, timed_stage
 from .Options import GooseGameOptions
 from .names import itemNames, locationNames, regionNames
 
+# The rules, the location plan and everything behind them are only needed once generation starts,
+# so they're imported in the steps that use them rather than on every Archipelago launch
+if TYPE_CHECKING:
+    from .LocationPlan import LocationPlan
+    from .Rules import UntitledGooseRules
+
 
 class GooseGameWeb(WebWorld):
     theme = "grass"
@@ -38,17 +48,29 @@ class GooseGameWorld(World):
     
     options_dataclass = GooseGameOptions
     options: GooseGameOptions
+    location_plan: "LocationPlan"
+    rules: "UntitledGooseRules"
+    location_index: Dict[str, Location]
+    # Only made when GOOSE_GENERATION_REPORT is set, by the first step that runs
+    generation_report: Optional[GenerationReport]
     
-    item_name_to_id: ClassVar[Dict[str, int]] = {
-        name: data.id for name, data in item_table.items()
-    }
+    item_name_to_id: ClassVar[Dict[str, int]] = item_registry.name_to_id
     
     # Register ALL possible locations - AP needs these upfront or it breaks badly (Lookin at you early MM Dev Builds)
-    location_name_to_id: ClassVar[Dict[str, int]] = get_all_location_ids()
+    location_name_to_id: ClassVar[Dict[str, int]] = location_registry.name_to_id
     
     item_name_groups = ITEM_GROUPS
 
+    def __init__(self, multiworld: MultiWorld, player: int) -> None:
+        super().__init__(multiworld, player)
+        # First copy of each filler/trap made, later ones are cloned from it
+        self.item_prototypes: Dict[str, GooseGameItem] = {}
+        # Souls that gate nothing under this slot's options, set in generate_early
+        self.non_gating_souls: Set[str] = set()
+        self.generation_report = None
+
     # Validating YAML options
+    @timed_stage
     def generate_early(self) -> None:
         if self.options.include_prop_souls.value and not self.options.include_item_pickups.value:
             raise OptionError("The setting 'Include Prop Souls' requires 'Include Item Pickups' to be enabled in the YAML options.")
@@ -58,13 +80,62 @@ class GooseGameWorld(World):
             raise OptionError("The goal 'all_tasks_no_speedrun' requires 'Include Extra Tasks' to be enabled in the YAML options.")
         elif self.options.goal.value == 5 and (not self.options.include_speedrun_tasks.value or not self.options.include_extra_tasks.value):
             raise OptionError("The goal 'all_tasks' requires both 'Include Extra Tasks' and 'Include Speedrun Tasks' to be enabled in the YAML options.")
+        
+        # Every later stage reads the location set (and the rolled starting area) from here.
+        # Built fresh each time: about 0.16 ms, less than reading a cached plan back from disk (about 0.28 ms)
+        from .LocationPlan import build_location_plan
+        self.location_plan = build_location_plan(self.options, self.get_starting_area_name())
+
+        # Built once per world: the entrances and every location rule come from this one instance
+        from .Rules import UntitledGooseRules
+        self.rules = UntitledGooseRules(self)
+
+        # A soul that no enabled location, entrance or the goal reads only matters in game, not to the fill,
+        # so it's made as useful and the fill has that much less progression to place and sweep.
+        # Worked out here, so every copy is made that way, start inventory included.
+        # The Golden Bell Soul isn't in these lists, so it always stays progression
+        from .Dependencies import gating_items
+        gating = gating_items(self)
+        self.non_gating_souls = {
+            soul for soul in npc_souls + prop_souls if not item_bit_table[soul] & gating
+        }
     
     def create_item(self, name: str) -> Item:
+        prototype = self.item_prototypes.get(name)
+        if prototype is not None:
+            return prototype.clone()
         item_data = item_table[name]
-        return GooseGameItem(name, item_data.classification, item_data.id, self.player)
-    
+        classification = ItemClassification.useful if name in self.non_gating_souls else item_data.classification
+        item = GooseGameItem(name, classification, item_data.id, self.player)
+        if items_can_clone and name in repeated_items:
+            self.item_prototypes[name] = item
+            return item.clone()
+        return item
+
+    # Keep the progression bitmask in step with prog_items so the rules can test one int
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        change = super().collect(state, item)
+        if change:
+            state.prog_items[self.player][PROGRESSION_MASK] |= item_bit_table.get(item.name, 0)
+        return change
+
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        change = super().remove(state, item)
+        if change and not state.prog_items[self.player][item.name]:
+            state.prog_items[self.player][PROGRESSION_MASK] &= ~item_bit_table.get(item.name, 0)
+        return change
+
+    @timed_stage
     def create_regions(self) -> None:
+        from .Regions import create_regions
         create_regions(self)
+        if self.generation_report is not None:
+            regions = self.multiworld.get_regions(self.player)
+            self.generation_report.counts.update(
+                regions=len(regions),
+                entrances=sum(len(region.entrances) for region in regions),
+                locations=len(self.location_index),
+            )
     
     def get_starting_area_name(self) -> str:
         """Determine which area the player starts with access to."""
@@ -83,9 +154,10 @@ class GooseGameWorld(World):
         else:
             return area_names[starting_option]
     
+    @timed_stage
     def create_items(self) -> None:
         # Determine starting area
-        starting_area = self.get_starting_area_name()
+        starting_area = self.location_plan.starting_area
         
         # All area access items (5 total)
         area_items = [
@@ -96,160 +168,6 @@ class GooseGameWorld(World):
             itemNames.MODEL_VILLAGE_ACCESS,
         ]
         
-        # NPC Soul items (11 total) - required for NPC-related goals
-        npc_souls = [
-            itemNames.NPC_GROUNDSKEEPER,
-            itemNames.NPC_BOY,
-            itemNames.NPC_TV_SHOP_OWNER,
-            itemNames.NPC_MARKET_LADY,
-            itemNames.NPC_TIDY_NEIGHBOUR,
-            itemNames.NPC_MESSY_NEIGHBOUR,
-            itemNames.NPC_BURLY_MAN,
-            itemNames.NPC_OLD_MAN,
-            itemNames.NPC_PUB_LADY,
-            itemNames.NPC_FANCY_LADIES,
-            itemNames.NPC_COOK,
-        ]
-        
-        # Prop Soul items - required for picking up/dragging items
-        # NOTE: NPC-tied items (Keys, Gardener Hat, Boy's Glasses, Slipper, Wooly Hat, Pub Cloth, etc)
-        prop_souls = [
-            # Grouped Props (26)
-            itemNames.PROP_CARROTS,
-            itemNames.PROP_TOMATOES,
-            itemNames.PROP_PUMPKINS,
-            itemNames.PROP_TOPSOIL_BAGS,
-            itemNames.PROP_GREEN_QUOITS,
-            itemNames.PROP_PLATES,
-            itemNames.PROP_ORANGES,
-            itemNames.PROP_LEEKS,
-            itemNames.PROP_CUCUMBERS,
-            itemNames.PROP_UMBRELLAS,
-            itemNames.PROP_TINNED_FOOD,
-            itemNames.PROP_SOCKS,
-            itemNames.PROP_PINT_BOTTLES,
-            itemNames.PROP_KNIVES,
-            itemNames.PROP_GUMBOOTS,
-            itemNames.PROP_FORKS,
-            itemNames.PROP_APPLE_CORES,
-            itemNames.PROP_APPLES,
-            itemNames.PROP_SANDWICH,
-            itemNames.PROP_RED_QUOITS,
-            itemNames.PROP_RIBBONS,
-            itemNames.PROP_WALKIE_TALKIES,
-            itemNames.PROP_BOOTS,
-            itemNames.PROP_MINI_PEOPLE,
-            itemNames.PROP_MINI_BENCHES,
-            itemNames.PROP_WEED_TOOLS,
-
-            # Start Area One-Off Props (5)
-            itemNames.PROP_DRINK_CAN,
-            itemNames.PROP_TENNIS_BALL,
-            itemNames.PROP_DUMMY,
-            itemNames.PROP_FISHING_BOBBER,
-            itemNames.PROP_TACKLE_BOX,
-            
-            # Garden One-Off Props (15)
-            itemNames.PROP_RADIO,
-            itemNames.PROP_TROWEL,
-            itemNames.PROP_TULIP,
-            itemNames.PROP_JAM,
-            itemNames.PROP_PICNIC_MUG,
-            itemNames.PROP_THERMOS,
-            itemNames.PROP_STRAW_HAT,
-            itemNames.PROP_RAKE,
-            itemNames.PROP_PICNIC_BASKET,
-            itemNames.PROP_ESKY,
-            itemNames.PROP_SHOVEL,
-            itemNames.PROP_WATERING_CAN,
-            itemNames.PROP_MALLET,
-            itemNames.PROP_WOODEN_CRATE,
-            itemNames.PROP_CABBAGES,
-            
-            # High Street One-Off Props (22)
-            itemNames.PROP_HORN_RIMMED_GLASSES,
-            itemNames.PROP_RED_GLASSES,
-            itemNames.PROP_SUNGLASSES,
-            itemNames.PROP_LOO_PAPER,
-            itemNames.PROP_TOY_CAR,
-            itemNames.PROP_FOOTBALL,
-            itemNames.PROP_HAIRBRUSH,
-            itemNames.PROP_TOOTHRBRUSH,
-            itemNames.PROP_STEREOSCOPE,
-            itemNames.PROP_DISH_SOAP_BOTTLE,
-            itemNames.PROP_SPRAY_BOTTLE,
-            itemNames.PROP_LILY_FLOWER,
-            itemNames.PROP_TOY_PLANE,
-            itemNames.PROP_CHALK,
-            itemNames.PROP_DUSTBIN_LID,
-            itemNames.PROP_SHOPPING_BASKET,
-            itemNames.PROP_PUSH_BROOM,
-            itemNames.PROP_DUSTBIN,
-            itemNames.PROP_BABY_DOLL,
-            itemNames.PROP_PRICING_GUN,
-            itemNames.PROP_ADDING_MACHINE,
-            itemNames.PROP_GARAGE_ROPE,
-            
-            # Back Gardens One-Off Props (24)
-            itemNames.PROP_CRICKET_BALL,
-            itemNames.PROP_BUST_PIPE,
-            itemNames.PROP_BUST_HAT,
-            itemNames.PROP_BUST_GLASSES,
-            itemNames.PROP_TEA_CUP,
-            itemNames.PROP_NEWSPAPER,
-            itemNames.PROP_BADMINTON_RACKET,
-            itemNames.PROP_POT_STACK,
-            itemNames.PROP_SOAP,
-            itemNames.PROP_PAINTBRUSH,
-            itemNames.PROP_VASE,
-            itemNames.PROP_BRA,
-            itemNames.PROP_ROSE,
-            itemNames.PROP_ROSE_BOX,
-            itemNames.PROP_CRICKET_BAT,
-            itemNames.PROP_TEA_POT,
-            itemNames.PROP_CLIPPERS,
-            itemNames.PROP_DUCK_STATUE,
-            itemNames.PROP_FROG_STATUE,
-            itemNames.PROP_JEREMY_FISH,
-            itemNames.PROP_NO_GOOSE_SIGN_MESSY,
-            itemNames.PROP_DRAWER,
-            itemNames.PROP_ENAMEL_JUG,
-            itemNames.PROP_NO_GOOSE_SIGN_CLEAN,
-            
-            # Pub Prop One-Off Props (17)
-            itemNames.PROP_LETTER,
-            itemNames.PROP_PINT_GLASSES,
-            itemNames.PROP_TOY_BOAT,
-            itemNames.PROP_PEPPER_GRINDER,
-            itemNames.PROP_CORK,
-            itemNames.PROP_CANDLESTICK,
-            itemNames.PROP_FLOWER_FOR_VASE,
-            itemNames.PROP_HARMONICA,
-            itemNames.PROP_TRAFFIC_CONE,
-            itemNames.PROP_PARCEL,
-            itemNames.PROP_STEALTH_BOX,
-            itemNames.PROP_NO_GOOSE_SIGN_PUB,
-            itemNames.PROP_PORTABLE_STOOL,
-            itemNames.PROP_DARTBOARD,
-            itemNames.PROP_MOP_BUCKET,
-            itemNames.PROP_MOP,
-            itemNames.PROP_BUCKET,
-            
-            # Model Village One-Off Props (10)
-            itemNames.PROP_MINI_GOOSE,
-            itemNames.PROP_MINI_MAIL_PILLAR,
-            itemNames.PROP_MINI_PHONE_DOOR,
-            itemNames.PROP_MINI_SHOVEL,
-            itemNames.PROP_POPPY_FLOWER,
-            itemNames.PROP_TIMBER_HANDLE,
-            itemNames.PROP_MINI_BIRDBATH,
-            itemNames.PROP_MINI_EASEL,
-            itemNames.PROP_MINI_PUMP,
-            itemNames.PROP_MINI_SUN_LOUNGE,
-            
-            # Golden Bell Soul is always required even when prop souls are turned off, so it's not in this list
-        ]
-
         # Add Golden Bell Soul to pool if the chosen goal is to find the bell
         # If the chosen goal is NOT to find the bell, Golden Bell Soul is placed in pre_fill()
         if self.options.goal.value == 1:
@@ -285,76 +203,57 @@ class GooseGameWorld(World):
         # This ensures players must have Golden Bell Soul to access it
         
         # Calculate filler needed
-        total_locations = len(self.multiworld.get_unfilled_locations(self.player))
+        total_locations = len(self.location_plan)
         filler_needed = total_locations - items_added
 
+        # Capped fillers go in first, then the weighted fillers and traps make up the rest
+        fillers: List[str] = []
+        
         # Add Silent Steps first since there can only be one
         if self.options.filler_active_silent_steps:
-            self.multiworld.itempool.append(self.create_item(itemNames.FILLER_SILENT_STEPS))
-            filler_needed -= 1
+            fillers.append(itemNames.FILLER_SILENT_STEPS)
 
         # Add other capped fillers next
-        for i in range (self.options.filler_amount_mega_honk.value): # Max 3
-            self.multiworld.itempool.append(self.create_item(itemNames.FILLER_MEGA_HONK))
-            filler_needed -= 1
-        for i in range (self.options.filler_amount_speedy_feet.value): # Max 10
-            self.multiworld.itempool.append(self.create_item(itemNames.FILLER_SPEEDY_FEET))
-            filler_needed -= 1
-        for i in range (self.options.filler_amount_goose_day.value): # Max 3
-            self.multiworld.itempool.append(self.create_item(itemNames.FILLER_A_GOOSE_DAY))
-            filler_needed -= 1
+        fillers += [itemNames.FILLER_MEGA_HONK] * self.options.filler_amount_mega_honk.value  # Max 3
+        fillers += [itemNames.FILLER_SPEEDY_FEET] * self.options.filler_amount_speedy_feet.value  # Max 10
+        fillers += [itemNames.FILLER_A_GOOSE_DAY] * self.options.filler_amount_goose_day.value  # Max 3
+        filler_needed -= len(fillers)
         
         # Remaining filler items based on weights
         if filler_needed > 0:
-            # Build weighted filler pool from options
-            # Format: (item_name, weight)
-            weighted_items = []
-            coins_weight = self.options.filler_weight_coins.value
-            tired_goose_weight = self.options.trap_weight_tired_goose.value
-            confused_feet_weight = self.options.trap_weight_confused_feet.value
-            butterbeak_weight = self.options.trap_weight_butterbeak.value
-            suspicious_goose_weight = self.options.trap_weight_suspicious_goose.value
-            
-            # Filler items
-            if coins_weight > 0:
-                weighted_items.append((itemNames.FILLER_COIN, coins_weight))
-            
-            # Trap items
-            if tired_goose_weight > 0:
-                weighted_items.append((itemNames.TRAP_TIRED_GOOSE, tired_goose_weight))
-            if confused_feet_weight > 0:
-                weighted_items.append((itemNames.TRAP_CONFUSED_FEET, confused_feet_weight))
-            if butterbeak_weight > 0:
-                weighted_items.append((itemNames.TRAP_BUTTERBEAK, butterbeak_weight))
-            if suspicious_goose_weight > 0:
-                weighted_items.append((itemNames.TRAP_SUSPICIOUS_GOOSE, suspicious_goose_weight))
-                
-            total_weight = 0
-            for item_name, weight in weighted_items:
-                total_weight += weight
-            
-            for _ in range(filler_needed):
-                if total_weight == 0:
-                    # All weighted filler has been turned off, so Coins are forced
-                    item_name = itemNames.FILLER_COIN
-                else:
-                    # Weighted random selection
-                    roll = self.random.randint(1, total_weight)
-                    if roll <= coins_weight:
-                        item_name = itemNames.FILLER_COIN
-                    elif roll <= coins_weight + tired_goose_weight:
-                        item_name = itemNames.TRAP_TIRED_GOOSE
-                    elif roll <= coins_weight + tired_goose_weight + confused_feet_weight:
-                        item_name = itemNames.TRAP_CONFUSED_FEET
-                    elif roll <= coins_weight + tired_goose_weight + confused_feet_weight + butterbeak_weight:
-                        item_name = itemNames.TRAP_BUTTERBEAK
-                    elif roll <= coins_weight + tired_goose_weight + confused_feet_weight + butterbeak_weight + suspicious_goose_weight:
-                        item_name = itemNames.TRAP_SUSPICIOUS_GOOSE
-                    else:
-                        item_name = itemNames.FILLER_COIN # We shouldn't reach this, but if something goes wrong, we fall back on Coins
-                
-                self.multiworld.itempool.append(self.create_item(item_name))
+            fillers += self.get_weighted_fillers(filler_needed)
+        
+        self.multiworld.itempool += [self.create_item(item_name) for item_name in fillers]
+        if self.generation_report is not None:
+            pool = [item for item in self.multiworld.itempool if item.player == self.player]
+            self.generation_report.counts.update(
+                item_pool=len(pool),
+                progression_items=sum(item.advancement for item in pool),
+            )
+    
+    def get_weighted_fillers(self, count: int) -> List[str]:
+        """Draw every weighted filler and trap at once from the option weights."""
+        weighted_items = [
+            (item_name, weight) for item_name, weight in (
+                (itemNames.FILLER_COIN, self.options.filler_weight_coins.value),
+                (itemNames.TRAP_TIRED_GOOSE, self.options.trap_weight_tired_goose.value),
+                (itemNames.TRAP_CONFUSED_FEET, self.options.trap_weight_confused_feet.value),
+                (itemNames.TRAP_BUTTERBEAK, self.options.trap_weight_butterbeak.value),
+                (itemNames.TRAP_SUSPICIOUS_GOOSE, self.options.trap_weight_suspicious_goose.value),
+            ) if weight > 0
+        ]
+        
+        if not weighted_items:
+            # All weighted filler has been turned off, so Coins are forced
+            return [itemNames.FILLER_COIN] * count
+        
+        if self.options.filler_exact_ratios:
+            return apportion(weighted_items, count)
+        
+        item_names, weights = zip(*weighted_items)
+        return self.random.choices(item_names, weights, k=count)
     
+    @timed_stage
     def pre_fill(self) -> None:
         """Place victory-related items at their fixed locations.
         
@@ -391,14 +290,27 @@ class GooseGameWorld(World):
             goal_6_location = self.multiworld.get_location(locationNames.GOAL_ALL_FINAL_TASKS, self.player)
             goal_6_location.place_locked_item(golden_bell_soul)
     
+    @timed_stage
     def set_rules(self) -> None:
-        from .Rules import UntitledGooseRules
-        rules = UntitledGooseRules(self)
-        rules.set_rules()
+        self.rules.set_rules()
+        if self.generation_report is not None:
+            self.generation_report.counts.update(
+                # Identical rules are one shared object, so this is how many distinct rules the locations use
+                shared_rules=len(set(self.rules.simplified_rules.values())),
+                region_gate_mismatches=len(self.rules.region_gate_mismatches),
+            )
+            # From here on every rule call is counted, up to generate_output
+            self.generation_report.count_rules(self)
+    
+    def generate_output(self, output_directory: str) -> None:
+        # Fill is done by now, so the rule counts cover it; the spoiler playthrough comes after and isn't counted
+        if self.generation_report is not None:
+            self.generation_report.write(self, output_directory)
     
     def fill_slot_data(self) -> Dict[str, Any]:
+        from .SlotData import compact_slot_data
         return {
-            "starting_area": self.get_starting_area_name(),
+            "starting_area": self.location_plan.starting_area,
             "goal": self.options.goal.value,
             "include_extra_tasks": self.options.include_extra_tasks.value,
             "include_speedrun_tasks": self.options.include_speedrun_tasks.value,
@@ -420,4 +332,6 @@ class GooseGameWorld(World):
             "trap_weight_butterbeak": self.options.trap_weight_butterbeak.value,
             "trap_weight_suspicious_goose": self.options.trap_weight_suspicious_goose.value,
             "death_link": self.options.death_link.value,
+            # What the game client needs from the above, packed for it; see SlotData.py for the layout
+            "compact_slot_data": compact_slot_data(self),
         }
\ No newline at end of file